@@ -5,9 +5,11 @@ See Also:
     :obj:`connect.Connect` for creating a client for using this package.
 
 """
+import importlib
 import logging
 import sys
 import pathlib
+import typing as t
 
 from . import setup_env, version
 
@@ -38,69 +40,104 @@ POST_DOTENV: dict = setup_env.get_env_ax()
 """AX.* env variables after loading dotenv."""
 
 # short term hack for projects until they are moved to their own repos
-try:
-    sys.path.insert(0, str(PROJECTS_PATH))
-    from .projects import cf_token, cert_human, url_parser
-
-except Exception:  # pragma: no cover
-    raise
-
-
-try:
-    # noinspection PyCompatibility
-    from . import (
-        api,
-        auth,
-        cli,
-        constants,
-        data,
-        exceptions,
-        http,
-        logs,
-        tools,
-        projects,
-    )
-
-    from .api import (
-        ActivityLogs,
-        Adapters,
-        ApiEndpoints,
-        Cnx,
-        Dashboard,
-        DashboardSpaces,
-        Devices,
-        Enforcements,
-        Instances,
-        Meta,
-        RemoteSupport,
-        Runner,
-        SettingsGlobal,
-        SettingsGui,
-        SettingsLifecycle,
-        Signup,
-        SystemRoles,
-        SystemUsers,
-        Users,
-        Vulnerabilities,
-        Wizard,
-        WizardCsv,
-        WizardText,
-        json_api,
-    )
-    from .auth import AuthApiKey, AuthCredentials, AuthModel, AuthNull
-    from .connect import Connect
-    from .features import Features
-    from .http import Http
-except Exception:  # pragma: no cover
-    raise
-
-
-LOG = logs.LOG
+sys.path.insert(0, str(PROJECTS_PATH))
+
+LAZY_ATTRS: t.Dict[str, t.Tuple[str, t.Optional[str]]] = {
+    # modules
+    "api": (".api", None),
+    "auth": (".auth", None),
+    "cli": (".cli", None),
+    "constants": (".constants", None),
+    "data": (".data", None),
+    "exceptions": (".exceptions", None),
+    "http": (".http", None),
+    "logs": (".logs", None),
+    "tools": (".tools", None),
+    "projects": (".projects", None),
+    "json_api": (".api.json_api", None),
+    "connect": (".connect", None),
+    "connect_async": (".connect_async", None),
+    "features": (".features", None),
+    "parsers": (".parsers", None),
+    # projects
+    "cert_human": (".projects.cert_human", None),
+    "cf_token": (".projects.cf_token", None),
+    "url_parser": (".projects.url_parser", None),
+    # API client
+    "Connect": (".connect", "Connect"),
+    "AsyncConnect": (".connect_async", "AsyncConnect"),
+    "Features": (".features", "Features"),
+    "Http": (".http", "Http"),
+    # API authentication
+    "AuthApiKey": (".auth", "AuthApiKey"),
+    "AuthCredentials": (".auth", "AuthCredentials"),
+    "AuthModel": (".auth", "AuthModel"),
+    "AuthNull": (".auth", "AuthNull"),
+    # API
+    **{
+        x: (".api", x)
+        for x in [
+            "ActivityLogs",
+            "Adapters",
+            "ApiEndpoints",
+            "Cnx",
+            "Dashboard",
+            "DashboardSpaces",
+            "Devices",
+            "Enforcements",
+            "Instances",
+            "Meta",
+            "RemoteSupport",
+            "Runner",
+            "SettingsGlobal",
+            "SettingsGui",
+            "SettingsLifecycle",
+            "Signup",
+            "SystemRoles",
+            "SystemUsers",
+            "Users",
+            "Vulnerabilities",
+            "Wizard",
+            "WizardCsv",
+            "WizardText",
+        ]
+    },
+}
+"""Attributes of this package that are imported the first time they are used."""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the modules and classes of this package the first time they are used (PEP 562).
+
+    Notes:
+        Importing the API models, the CLI, and the cert tools takes much longer than most
+        scripts take to run, so they are only imported when something uses them.
+    """
+    if name not in LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module, attr = LAZY_ATTRS[name]
+    value = importlib.import_module(module, package=__name__)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the ones not yet imported.
+
+    Notes:
+        The names only used to do the lazy imports are left out.
+    """
+    return sorted({*globals(), *LAZY_ATTRS} - {"LAZY_ATTRS", "importlib", "t"})
+
 
 __all__ = (
     "PACKAGE_ROOT",
     # API client
     "Connect",
+    "AsyncConnect",
     # HTTP client
     "Http",
     # API authentication
@@ -1,31 +1,87 @@
 # -*- coding: utf-8 -*-
 """API library package."""
-from . import api_endpoints, json_api
-from .adapters import Adapters, Cnx
-from .api_endpoint import ApiEndpoint
-from .api_endpoints import ApiEndpoints
-from .assets import Devices, Runner, Users, Vulnerabilities, AssetMixin
-from .enforcements import Enforcements
-from .folders import Folders
-from .mixins import ChildMixins, ModelMixins
-from .openapi import OpenAPISpec
-from .system import (
-    ActivityLogs,
-    Dashboard,
-    DashboardSpaces,
-    DataScopes,
-    Instances,
-    Meta,
-    RemoteSupport,
-    SettingsGlobal,
-    SettingsGui,
-    SettingsIdentityProviders,
-    SettingsLifecycle,
-    Signup,
-    SystemRoles,
-    SystemUsers,
-)
-from .wizards import Wizard, WizardCsv, WizardText
+import importlib
+import typing as t
+
+LAZY_ATTRS: t.Dict[str, t.Tuple[str, t.Optional[str]]] = {
+    "api_endpoints": (".api_endpoints", None),
+    "json_api": (".json_api", None),
+    **{
+        x: (f".{x}", None)
+        for x in [
+            "adapters",
+            "api_endpoint",
+            "asset_callbacks",
+            "assets",
+            "enforcements",
+            "folders",
+            "mixins",
+            "openapi",
+            "system",
+            "wizards",
+        ]
+    },
+    "Adapters": (".adapters", "Adapters"),
+    "Cnx": (".adapters", "Cnx"),
+    "ApiEndpoint": (".api_endpoint", "ApiEndpoint"),
+    "ApiEndpoints": (".api_endpoints", "ApiEndpoints"),
+    "Devices": (".assets", "Devices"),
+    "Runner": (".assets", "Runner"),
+    "Users": (".assets", "Users"),
+    "Vulnerabilities": (".assets", "Vulnerabilities"),
+    "AssetMixin": (".assets", "AssetMixin"),
+    "Enforcements": (".enforcements", "Enforcements"),
+    "Folders": (".folders", "Folders"),
+    "ChildMixins": (".mixins", "ChildMixins"),
+    "ModelMixins": (".mixins", "ModelMixins"),
+    "OpenAPISpec": (".openapi", "OpenAPISpec"),
+    **{
+        x: (".system", x)
+        for x in [
+            "ActivityLogs",
+            "Dashboard",
+            "DashboardSpaces",
+            "DataScopes",
+            "Instances",
+            "Meta",
+            "RemoteSupport",
+            "SettingsGlobal",
+            "SettingsGui",
+            "SettingsIdentityProviders",
+            "SettingsLifecycle",
+            "Signup",
+            "SystemRoles",
+            "SystemUsers",
+        ]
+    },
+    "Wizard": (".wizards", "Wizard"),
+    "WizardCsv": (".wizards", "WizardCsv"),
+    "WizardText": (".wizards", "WizardText"),
+}
+"""Attributes of this package that are imported the first time they are used."""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the API models and endpoints the first time they are used (PEP 562)."""
+    if name not in LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module, attr = LAZY_ATTRS[name]
+    value = importlib.import_module(module, package=__name__)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the ones not yet imported.
+
+    Notes:
+        The names only used to do the lazy imports are left out.
+    """
+    return sorted({*globals(), *LAZY_ATTRS} - {"LAZY_ATTRS", "importlib", "t"})
+
 
 __all__ = (
     "Adapters",
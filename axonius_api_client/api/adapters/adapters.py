@@ -205,6 +205,8 @@ class Adapters(ModelMixins):
         log_level: t.Union[int, str] = PagingState.log_level,
         history_filters: t.Optional[AdapterFetchHistoryFilters] = None,
         request_obj: t.Optional[AdapterFetchHistoryRequest] = None,
+        compact: bool = False,
+        trusted: bool = False,
     ) -> HIST_GEN:
         """Get adapter fetch history.
 
@@ -244,6 +246,10 @@ class Adapters(ModelMixins):
                 from :meth:`get_fetch_history_filters` (will be fetched if not supplied)
             request_obj (Optional[AdapterFetchHistoryRequest], optional): Request object to use
                 for options
+            compact (bool, optional): yield compact rows that use less memory and are not
+                instances of AdapterFetchHistory, see :meth:`BaseModel.to_compact`
+            trusted (bool, optional): load records without validating them,
+                see :meth:`BaseModel.from_trusted`
         """
         if not isinstance(history_filters, AdapterFetchHistoryFilters):
             history_filters = self.get_fetch_history_filters()
@@ -308,8 +314,11 @@ class Adapters(ModelMixins):
             log_level=log_level,
         ) as state:
             while not state.stop_paging:
-                page = state.page(method=self._get_fetch_history, request_obj=request_obj)
-                yield from page.rows
+                page = state.page(
+                    method=self._get_fetch_history, request_obj=request_obj, trusted=trusted
+                )
+                for row in page.rows:
+                    yield row.to_compact() if compact else row
 
     def config_get(
         self,
@@ -633,11 +642,13 @@ class Adapters(ModelMixins):
         return response
 
     def _get_fetch_history(
-        self, request_obj: t.Optional[AdapterFetchHistoryRequest] = None
+        self, request_obj: t.Optional[AdapterFetchHistoryRequest] = None, trusted: bool = False
     ) -> HIST_LIST:
         """Get adapter fetch history."""
         api_endpoint = ApiEndpoints.adapters.get_fetch_history
         if not request_obj:
             request_obj = AdapterFetchHistoryRequest()
-        response = api_endpoint.perform_request(http=self.http, request_obj=request_obj)
+        response = api_endpoint.perform_request(
+            http=self.http, request_obj=request_obj, trusted=trusted
+        )
         return response
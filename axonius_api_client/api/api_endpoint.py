@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 """Models for API requests & responses."""
+import asyncio
+import concurrent.futures
 import dataclasses
+import functools
 import inspect
 import logging
 import typing as t
 
 import requests
 
+from ..constants.api import STREAM_CHUNK_SIZE
 from ..constants.general import JSON_TYPES, RERAISE
 from ..constants.logs import LOG_LEVEL_ENDPOINTS
 from ..exceptions import (
@@ -22,7 +26,7 @@ from ..exceptions import (
 )
 from ..http import Http
 from ..logs import set_log_level
-from ..tools import combo_dicts, get_cls_path, json_log
+from ..tools import combo_dicts, get_cls_path, json_decode, json_log, json_stream
 from .json_api.base import BaseModel, BaseSchema, BaseSchemaJson
 
 LOGGER: logging.Logger = logging.getLogger(name=__name__)
@@ -95,6 +99,15 @@ class ApiEndpoint:
 
     response_json_error: bool = True
     """Throw errors if the JSON can not be serialized."""
+
+    response_stream_key: t.Optional[str] = None
+    """Key of a list in the response JSON to decode one item at a time if stream=True."""
+
+    response_trusted: bool = False
+    """Load the response into models without validating it, see :meth:`BaseModel.from_trusted`.
+
+    Off for every endpoint, callers opt in per request with trusted=True. Schemas that do not
+    pass :meth:`BaseSchema.can_load_trusted` fall back to validating."""
     log: t.ClassVar[logging.Logger] = LOGGER.getChild("ApiEndpoint")
 
     def __str__(self):
@@ -141,6 +154,51 @@ class ApiEndpoint:
         kwargs["response"] = response
         return response if raw else self.handle_response(http=http, **kwargs)
 
+    async def perform_request_async(
+        self,
+        http: Http,
+        request_obj: t.Optional[BaseModel] = None,
+        raw: bool = False,
+        executor: t.Optional[concurrent.futures.Executor] = None,
+        **kwargs,
+    ) -> t.Any:
+        """Perform a request to this endpoint using a http object without blocking the event loop.
+
+        Notes:
+            The request is built and the response is loaded exactly as in
+            :meth:`perform_request`, only sending the request and loading the response
+            are run in executor.
+
+        Args:
+            http (Http): HTTP object to use to send request
+            request_obj (t.Optional[BaseModel], optional): dataclass containing
+                object to serialize for the request
+            raw (bool): return the raw requests.Response object
+            executor (t.Optional[concurrent.futures.Executor], optional): executor to run
+                the request in, default executor of the running loop if not supplied
+            **kwargs: passed to :meth:`perform_request_raw` and :meth:`handle_response`
+
+        Returns:
+            the data loaded from the response received
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.log.debug(
+            f"{self!r} Performing async request with request_obj type {type(request_obj)}"
+        )
+        response: requests.Response = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                self.perform_request_raw, http=http, request_obj=request_obj, **kwargs
+            ),
+        )
+        self.log.debug(f"{self!r} Received response {response}")
+        if raw:
+            return response
+        kwargs["response"] = response
+        return await loop.run_in_executor(
+            executor, functools.partial(self.handle_response, http=http, **kwargs)
+        )
+
     def perform_request_raw(
         self, http: Http, request_obj: t.Optional[BaseModel] = None, **kwargs
     ) -> requests.Response:
@@ -202,7 +260,12 @@ class ApiEndpoint:
         return ret
 
     def load_response(
-        self, data: dict, http: Http, unloaded: bool = False, **kwargs
+        self,
+        data: dict,
+        http: Http,
+        unloaded: bool = False,
+        trusted: t.Optional[bool] = None,
+        **kwargs,
     ) -> t.Union[BaseModel, JSON_TYPES]:
         """Load the response data into a dataclass model object.
 
@@ -210,21 +273,27 @@ class ApiEndpoint:
             data (dict): JSON data received from response
             http (Http): HTTP object used to receive response
             unloaded (bool): return the data without loading it into a dataclass model
+            trusted (t.Optional[bool]): load the data without validating it using load_trusted
+                instead of load_response, if None use :attr:`response_trusted`
             **kwargs: passed to :meth:`BaseSchema.load_response` or :meth:`BaseModel.load_response`
 
         Returns:
             t.Union[BaseModel, JSON_TYPES]: Loaded dataclass model or JSON data
         """
         kwargs["reraise"] = kwargs.get("reraise", RERAISE)
+        trusted = self.response_trusted if trusted is None else trusted
 
         if not unloaded:
             load_cls = self.response_load_cls
             if load_cls:
                 self.log.debug(
                     f"{self!r} Loading response with data type {type(data)}, load_cls={load_cls}"
+                    f", trusted={trusted}"
                 )
+                load_method = getattr(load_cls, "load_trusted", None) if trusted else None
+                load_method = load_method or load_cls.load_response
                 try:
-                    data = load_cls.load_response(data=data, http=http, **kwargs)
+                    data = load_method(data=data, http=http, **kwargs)
                 except Exception as exc:
                     if kwargs["reraise"]:
                         raise
@@ -291,8 +360,11 @@ class ApiEndpoint:
         """
         reraise = kwargs.get("reraise", RERAISE)
 
+        if self.response_stream_key and self.is_response_unread(response=response):
+            return self.get_response_json_stream(response=response)
+
         try:
-            return response.json()
+            return json_decode(response.content)
         except Exception as exc:
             if reraise:
                 raise
@@ -301,6 +373,38 @@ class ApiEndpoint:
                 raise JsonInvalidError(msg=msg, response=response, exc=exc)
             return response.text
 
+    def get_response_json_stream(
+        self, response: requests.Response
+    ) -> t.Generator[t.Tuple[str, t.Any, bool], None, None]:
+        """Incrementally decode the JSON from a response that was sent with stream=True.
+
+        Args:
+            response (requests.Response): response to handle
+
+        Yields:
+            t.Tuple[str, t.Any, bool]: tuples of (key, value, is_item) from
+                :func:`axonius_api_client.tools.json_stream`, where each item of
+                :attr:`response_stream_key` is yielded as it is decoded
+        """
+        self.log.debug(f"{self!r} Decoding streamed response {response}")
+        chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        try:
+            yield from json_stream(
+                chunks=chunks, key=self.response_stream_key, encoding=response.encoding or "utf-8"
+            )
+        finally:
+            response.close()
+
+    @staticmethod
+    def is_response_unread(response: requests.Response) -> bool:
+        """Check if the body of a response sent with stream=True has not been read yet.
+
+        Args:
+            response (requests.Response): response to check
+        """
+        # requests sets _content to False until the body is read
+        return getattr(response, "_content", None) is False
+
     def check_response_status(
         self,
         http: Http,
@@ -120,6 +120,7 @@ class Assets(ApiEndpointGroup):
         request_model_cls=json_api.assets.AssetRequest,
         response_schema_cls=None,
         response_model_cls=json_api.assets.AssetsPage,
+        response_stream_key="data",
     )
     # PBUG: include_notes=True ignored if fields are specified
 
@@ -7,6 +7,7 @@ from .base_json_to_csv import JsonToCsv
 from .base_table import Table
 from .base_xlsx import Xlsx
 from .base_xml import Xml
+from .delta import DeltaState
 from .tools import CB_MAP, get_callbacks_cls
 
 __all__ = (
@@ -20,4 +21,5 @@ __all__ = (
     "JsonToCsv",
     "get_callbacks_cls",
     "CB_MAP",
+    "DeltaState",
 )
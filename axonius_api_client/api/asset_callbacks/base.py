@@ -36,6 +36,7 @@ from ...tools import (
     path_backup_file,
     strip_right,
 )
+from .delta import DeltaState
 
 
 # noinspection SpellCheckingInspection
@@ -140,6 +141,11 @@ class Base:
             ...
             >>> assets = apiobj.get(custom_cbs=[custom_cb1])
 
+            Only return the assets that were added, changed, or removed since the last export
+            that used the same state file, with the type of change in a new column.
+
+            >>> assets = apiobj.get(delta_path="devices_delta.state")
+
         See Also:
             * :meth:`args_map_custom` for callback specific arguments to format and export data.
 
@@ -187,6 +193,8 @@ class Base:
             "tags_add_invert_selection": False,
             "tags_remove": [],
             "tags_remove_invert_selection": False,
+            "tags_chunk_size": 0,
+            "tags_concurrency": 1,
             "report_adapters_missing": False,
             "report_software_whitelist": [],
             "page_progress": 10000,
@@ -198,6 +206,7 @@ class Base:
             "csv_field_flatten": True,
             "csv_field_join": True,
             "csv_field_null": True,
+            "delta_path": None,
         }
 
     def get_arg_value(self, arg: str) -> t.Any:
@@ -206,7 +215,7 @@ class Base:
         Args:
             arg: key to get from :attr:`GETARGS` with a default value from :meth:`args_map`
         """
-        return self.GETARGS.get(arg, self.args_map()[arg])
+        return self.GETARGS.get(arg, self.ARGS_DEFAULT[arg])
 
     def set_arg_value(self, arg: str, value: t.Any):
         """Set an argument value.
@@ -216,6 +225,9 @@ class Base:
             value: value to set for key
         """
         self.GETARGS[arg] = value
+        self.field_keys.clear()
+        if self.PLAN is not None:
+            self.PLAN = self.compile_plan()
 
     def __init__(
         self,
@@ -242,9 +254,12 @@ class Base:
         self.STORE: dict = store or {}
         self.CURRENT_ROWS: List[dict] = []
         self.GETARGS: dict = getargs or {}
-        self.TAG_ROWS_ADD: List[dict] = []
-        self.TAG_ROWS_REMOVE: List[dict] = []
+        self.ARGS_DEFAULT: dict = self.args_map()
+        self.PLAN: t.Optional[t.List[t.Callable]] = None
+        self.TAG_IDS_ADD: t.Dict[str, None] = {}
+        self.TAG_IDS_REMOVE: t.Dict[str, None] = {}
         self.CUSTOM_CB_EXC: List[dict] = []
+        self.DELTA: t.Optional[DeltaState] = None
         self._init()
 
     def _init(self):
@@ -271,6 +286,8 @@ class Base:
             self.echo(msg=f"Adding fields {missing} to field_excludes: {excludes}", debug=True)
             self.set_arg_value("field_excludes", value=excludes + missing)
 
+        self.start_delta()
+
         cb_args = crjoin(join_kv(obj=self.GETARGS))
         self.LOG.debug(f"Get Extra Arguments: {cb_args}")
 
@@ -280,6 +297,10 @@ class Base:
         store = crjoin(join_kv(obj=self.STORE))
         self.echo(msg=f"Get Arguments: {store}")
 
+        self.PLAN = self.compile_plan()
+        plan = crjoin([x.__name__ for x in self.PLAN])
+        self.echo(msg=f"Row Callbacks: {plan}", debug=True)
+
     # noinspection PyUnusedLocal
     def echo_columns(self, **kwargs):
         """Echo the columns of the fields selected."""
@@ -302,8 +323,35 @@ class Base:
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         self.do_tagging()
+        if self.DELTA is not None:
+            self.DELTA.save()
+            self.echo(msg=f"Saved {self.DELTA}")
         self.echo(msg=f"Stopping {self}")
 
+    def start_delta(self):
+        """Load the delta state from the previous export if delta_path is supplied."""
+        delta_path = self.get_arg_value("delta_path")
+        if not delta_path:
+            return
+
+        limits = ["max_rows", "max_pages", "row_start", "page_start"]
+        limits = {x: self.STORE[x] for x in limits if self.STORE.get(x)}
+        if limits:
+            msg = f"Can not use 'delta_path' with {limits}, assets not fetched would be removed"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        self.DELTA = DeltaState(path=delta_path)
+        self.echo(msg=f"Loaded {self.DELTA}")
+
+    def delta_removed(self) -> Generator[dict, None, None]:
+        """Get rows for the assets from the previous export that were not returned."""
+        if self.DELTA is None:
+            return
+
+        key = SCHEMAS_CUSTOM["delta_path"]["delta_change"]["name_qual"]
+        for axid in self.DELTA.removed():
+            yield {"internal_axon_id": axid, key: self.DELTA.REMOVED}
+
     def echo_page_progress(self):
         """Echo progress per N rows using an echo method."""
         page_progress = self.get_arg_value("page_progress")
@@ -362,6 +410,7 @@ class Base:
     def callbacks(self) -> list:
         """Get order of callbacks to run."""
         return [
+            self.do_delta,
             self.do_custom_cbs,
             self.process_tags_to_add,
             self.process_tags_to_remove,
@@ -379,9 +428,53 @@ class Base:
             self.do_change_field_replace,
         ]
 
+    def compile_plan(self) -> List[t.Callable]:
+        """Get the callbacks from :attr:`callbacks` that are enabled by the arguments.
+
+        Notes:
+            Callbacks that are not known here are always included. The callbacks that change
+            field titles, compress field names, and replace characters in field names are
+            replaced by :meth:`do_change_field_keys` so keys are changed in one pass.
+        """
+        enabled = {
+            self.do_delta: self.get_arg_value("delta_path"),
+            self.do_custom_cbs: self.get_arg_value("custom_cbs"),
+            self.process_tags_to_add: self.get_arg_value("tags_add"),
+            self.process_tags_to_remove: self.get_arg_value("tags_remove"),
+            self.add_report_adapters_missing: self.get_arg_value("report_adapters_missing"),
+            self.add_report_software_whitelist: self.get_arg_value("report_software_whitelist"),
+            self.add_include_dates: self.get_arg_value("include_dates"),
+            self.do_excludes: self.get_arg_value("field_excludes"),
+            self.do_add_null_values: self.get_arg_value("field_null"),
+            self.do_explode_entities: self.get_arg_value("explode_entities"),
+            self.do_flatten_fields: self.get_arg_value("field_flatten"),
+            self.do_explode_field: self.get_arg_value("field_explode"),
+            self.do_join_values: self.get_arg_value("field_join"),
+            self.do_change_field_titles: self.get_arg_value("field_titles"),
+            self.do_change_field_compress: self.get_arg_value("field_compress"),
+            self.do_change_field_replace: self.field_replacements,
+        }
+        renames = [
+            self.do_change_field_titles,
+            self.do_change_field_compress,
+            self.do_change_field_replace,
+        ]
+
+        plan = []
+        for cb in self.callbacks:
+            if cb in renames:
+                if enabled[cb] and self.do_change_field_keys not in plan:
+                    plan.append(self.do_change_field_keys)
+            elif enabled.get(cb, True):
+                plan.append(cb)
+        return plan
+
     def do_row(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute the callbacks for current row.
 
+        Notes:
+            Uses :attr:`PLAN` if :meth:`start` has been called, otherwise :attr:`callbacks`.
+
         Args:
             rows: rows to process
         """
@@ -392,7 +485,7 @@ class Base:
         if debug_timing:  # pragma: no cover
             p_start = dt_now()
 
-        for cb in self.callbacks:
+        for cb in self.callbacks if self.PLAN is None else self.PLAN:
             if debug_timing:  # pragma: no cover
                 cb_start = dt_now()
 
@@ -408,6 +501,25 @@ class Base:
 
         return rows
 
+    def do_delta(self, rows: Union[List[dict], dict]) -> List[dict]:
+        """Only keep assets that were added or changed since the previous export.
+
+        Args:
+            rows: rows to process
+        """
+        rows = listify(rows)
+        if self.DELTA is None:
+            return rows
+
+        key = SCHEMAS_CUSTOM["delta_path"]["delta_change"]["name_qual"]
+        changed = []
+        for row in rows:
+            change = row.get(key) or self.DELTA.check(row=row)
+            if change:
+                row[key] = change
+                changed.append(row)
+        return changed
+
     def do_custom_cbs(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute any custom callbacks for current row.
 
@@ -541,6 +653,64 @@ class Base:
                 value = [value[:trim_len], msg]
                 row[field] = joiner.join(value)
 
+    def do_change_field_keys(self, rows: Union[List[dict], dict]) -> List[dict]:
+        """Asset callback to change titles, shorten, and replace characters of field names.
+
+        Notes:
+            Does the same as :meth:`do_change_field_titles`, :meth:`do_change_field_compress`,
+            and :meth:`do_change_field_replace` in one pass over each row using
+            :attr:`field_titles_map` and :meth:`_field_key`.
+
+        Args:
+            rows: rows to process
+        """
+        rows = listify(rows)
+        titles = self.field_titles_map if self.get_arg_value("field_titles") else []
+        skips = {x[0] for x in titles}
+        get_key = self._field_key
+        new_rows = []
+
+        for row in rows:
+            new_row = {get_key(k): v for k, v in row.items() if k not in skips}
+            for name, title, default in titles:
+                new_row[get_key(title)] = row.get(name, default)
+            new_rows.append(new_row)
+        return new_rows
+
+    def _field_key(self, key: str) -> str:
+        """Get the output name of a field after compressing and replacing characters.
+
+        Args:
+            key: name of field
+        """
+        keys = self.field_keys
+        if key not in keys:
+            keys[key] = self._field_replace(key=self._field_compress(key=key))
+        return keys[key]
+
+    @property
+    def field_keys(self) -> t.Dict[str, str]:
+        """Cache of field names to output field names used by :meth:`_field_key`."""
+        if not hasattr(self, "_field_keys"):
+            self._field_keys = {}
+        return self._field_keys
+
+    @property
+    def field_titles_map(self) -> t.List[Tuple[str, str, t.Any]]:
+        """Get tuples of (name_qual, column_title, null value) for :attr:`final_schemas`."""
+        if not hasattr(self, "_field_titles_map"):
+            null_value = self.get_arg_value("field_null_value")
+            complex_null_value = self.get_arg_value("field_null_value_complex")
+            self._field_titles_map = [
+                (
+                    x["name_qual"],
+                    x["column_title"],
+                    complex_null_value if x["is_complex"] else null_value,
+                )
+                for x in self.final_schemas
+            ]
+        return self._field_titles_map
+
     def do_change_field_replace(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Asset callback to replace characters.
 
@@ -637,14 +807,7 @@ class Base:
         Args:
             row: row being processed
         """
-        null_value = self.get_arg_value("field_null_value")
-        complex_null_value = self.get_arg_value("field_null_value_complex")
-
-        for schema in self.final_schemas:
-            title = schema["column_title"]
-            name = schema["name_qual"]
-            is_complex = schema["is_complex"]
-            default = complex_null_value if is_complex else null_value
+        for name, title, default in self.field_titles_map:
             row[title] = row.pop(name, default)
 
     def do_flatten_fields(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -807,7 +970,7 @@ class Base:
         """Add tags to assets."""
         tags = listify(self.get_arg_value("tags_add"))
         expirable_tags = self.get_arg_value("expirable_tags")
-        rows = self.TAG_ROWS_ADD
+        rows = list(self.TAG_IDS_ADD)
         invert_selection = self.get_arg_value("tags_add_invert_selection")
         count_tags = len(tags)
         count_supplied = len(rows)
@@ -819,14 +982,19 @@ class Base:
         if tags:
             self.echo(["Performing API call to add tags to assets", *msgs])
             count_modified = self.APIOBJ.labels.add(
-                rows=rows, labels=tags, invert_selection=invert_selection, expirable_tags=expirable_tags,
+                rows=rows,
+                labels=tags,
+                invert_selection=invert_selection,
+                expirable_tags=expirable_tags,
+                chunk_size=self.get_arg_value("tags_chunk_size"),
+                concurrency=self.get_arg_value("tags_concurrency"),
             )
             self.echo(msg=[f"API added tags to {count_modified} assets", *msgs])
 
     def do_tag_remove(self):
         """Remove tags from assets."""
         tags = listify(self.get_arg_value("tags_remove"))
-        rows = self.TAG_ROWS_REMOVE
+        rows = list(self.TAG_IDS_REMOVE)
         invert_selection = self.get_arg_value("tags_remove_invert_selection")
         count_tags = len(tags)
         count_supplied = len(rows)
@@ -838,7 +1006,11 @@ class Base:
         if tags:
             self.echo(["Performing API call to remove tags from assets", *msgs])
             count_modified = self.APIOBJ.labels.remove(
-                rows=rows, labels=tags, invert_selection=invert_selection
+                rows=rows,
+                labels=tags,
+                invert_selection=invert_selection,
+                chunk_size=self.get_arg_value("tags_chunk_size"),
+                concurrency=self.get_arg_value("tags_concurrency"),
             )
             msgs = [
                 f"API finished removing tags from assets",
@@ -847,6 +1019,16 @@ class Base:
             ]
             self.echo(msg=msgs)
 
+    @property
+    def TAG_ROWS_ADD(self) -> List[dict]:
+        """Get the assets to add tags to as a list of dicts with internal_axon_id."""
+        return [{"internal_axon_id": x} for x in self.TAG_IDS_ADD]
+
+    @property
+    def TAG_ROWS_REMOVE(self) -> List[dict]:
+        """Get the assets to remove tags from as a list of dicts with internal_axon_id."""
+        return [{"internal_axon_id": x} for x in self.TAG_IDS_REMOVE]
+
     def process_tags_to_add(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Add assets to tracker for adding tags.
 
@@ -858,11 +1040,8 @@ class Base:
         if not tags:
             return rows
 
-        for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
-
-            if tag_row not in self.TAG_ROWS_ADD:
-                self.TAG_ROWS_ADD.append(tag_row)
+        for row in self._rows_to_tag(rows=rows):
+            self.TAG_IDS_ADD[row["internal_axon_id"]] = None
         return rows
 
     def process_tags_to_remove(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -876,14 +1055,22 @@ class Base:
         if not tags:
             return rows
 
-        for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
-
-            if tag_row not in self.TAG_ROWS_REMOVE:
-                self.TAG_ROWS_REMOVE.append(tag_row)
+        for row in self._rows_to_tag(rows=rows):
+            self.TAG_IDS_REMOVE[row["internal_axon_id"]] = None
 
         return rows
 
+    def _rows_to_tag(self, rows: List[dict]) -> List[dict]:
+        """Get the rows that can be tagged, skipping rows for assets removed since the last delta.
+
+        Args:
+            rows: rows to process
+        """
+        if self.DELTA is None:
+            return rows
+        key = SCHEMAS_CUSTOM["delta_path"]["delta_change"]["name_qual"]
+        return [x for x in rows if x.get(key) != self.DELTA.REMOVED]
+
     def add_report_software_whitelist(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Process report: Software whitelist.
 
@@ -1090,6 +1277,8 @@ class Base:
             schemas += list(SCHEMAS_CUSTOM["report_software_whitelist"].values())
         if self.get_arg_value("include_dates"):
             schemas += list(SCHEMAS_CUSTOM["include_dates"].values())
+        if self.get_arg_value("delta_path"):
+            schemas += list(SCHEMAS_CUSTOM["delta_path"].values())
         return schemas
 
     @property
@@ -1126,7 +1315,7 @@ class Base:
 
         def get_key(s):
             """Get the key for a schema."""
-            return self._field_replace(self._field_compress(s[key]))
+            return self._field_key(s[key])
 
         if hasattr(self, "_final_columns"):
             return self._final_columns
@@ -1278,11 +1467,18 @@ class Base:
     GETARGS: dict = None
     """original kwargs supplied to get assets method."""
 
-    TAG_ROWS_ADD: List[dict] = None
-    """tracker of assets to add tags to in :meth:`do_tagging`."""
+    ARGS_DEFAULT: dict = None
+    """default values for arguments from :meth:`args_map`."""
+
+    PLAN: t.Optional[t.List[t.Callable]] = None
+    """callbacks from :attr:`callbacks` that are enabled, built by :meth:`start`."""
+
+    TAG_IDS_ADD: t.Dict[str, None] = None
+    """tracker of internal_axon_ids (insertion ordered set) to add tags to in :meth:`do_tagging`."""
 
-    TAG_ROWS_REMOVE: List[dict] = None
-    """tracker of assets to remove tags from in :meth:`do_tagging`."""
+    TAG_IDS_REMOVE: t.Dict[str, None] = None
+    """tracker of internal_axon_ids (insertion ordered set) to remove tags from in
+    :meth:`do_tagging`."""
 
     CUSTOM_CB_EXC: List[dict] = None
     """tracker of custom callbacks that have been executed by :meth:`do_custom_cbs`"""
@@ -1455,6 +1651,8 @@ ARG_DESCRIPTIONS: dict = {
     "tags_add_invert_selection": "Invert selection for tags to add",
     "tags_remove": "Tags to remove from assets",
     "tags_remove_invert_selection": "Invert selection for tags to remove",
+    "tags_chunk_size": "Number of assets to add or remove tags from per request (0 = all)",
+    "tags_concurrency": "Number of requests to add or remove tags to send at once",
     "report_adapters_missing": "Add Missing Adapters calculation",
     "report_software_whitelist": "Missing Software to calculate",
     "page_progress": "Echo page progress every N assets",
@@ -1483,5 +1681,6 @@ ARG_DESCRIPTIONS: dict = {
     "debug_timing": "Enable logging of time taken for each callback",
     "explode_entities": "Split rows into one row for each asset entity",
     "include_dates": "Include history date and current date as a columns in the output",
+    "delta_path": "Only return assets added, changed, or removed since the export using this state",
 }
 """Descriptions of all arguments for all callbacks"""
@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
 """JSON export callbacks."""
-import json
 import textwrap
 from typing import List, Union
 
-from ...tools import listify
+from ...tools import json_encode, listify
 from .base import ExportMixins
 
 
@@ -124,7 +123,7 @@ class Json(ExportMixins):
             self._first_row = False
             self._fd.write(pre)
 
-            value = json.dumps(row, indent=indent)
+            value = json_encode(row, indent=indent)
             value = textwrap.indent(value, prefix=prefix) if indent else value
             self._fd.write(value)
             del value, row
@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
 """JSON to CSV export callbacks."""
-import json
 import tempfile
 from typing import List, Union
 
-from ...tools import listify
+from ...tools import json_decode, json_encode, listify
 from .base_csv import Csv
 
 
@@ -134,7 +133,7 @@ class JsonToCsv(Csv):
         self._temp_file.file.seek(0)
 
         for line in self._temp_file.file.readlines():
-            row = json.loads(line.strip())
+            row = json_decode(line.strip())
             rows = listify(row)
             rows = self.do_pre_row(rows=rows)
             rows = self.do_row(rows=rows)
@@ -156,7 +155,7 @@ class JsonToCsv(Csv):
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_pre_row(rows=rows)
         for row in rows:
-            value = json.dumps(row)
+            value = json_encode(row)
             self._temp_file.file.write(f"{value}\n")
             del row, value
 
@@ -2,8 +2,6 @@
 """Excel export callbacks class."""
 from typing import List
 
-import xlsxwriter
-
 from ...constants.api import FIELD_TRIM_LEN
 from ...exceptions import ApiError
 from ...tools import listify
@@ -128,6 +126,9 @@ class Xlsx(ExportMixins):
                 msg="Must supply export_file for this export method", error=ApiError, level="error"
             )
 
+        # xlsxwriter is slow to import, only import it when exporting to xlsx
+        import xlsxwriter
+
         self._workbook = xlsxwriter.Workbook(str(self._file_path), {"constant_memory": True})
         self._cell_format = self._workbook.add_format(cell_format)
 
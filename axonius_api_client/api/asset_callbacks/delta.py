@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""State of the assets returned by previous exports for delta exports."""
+import bisect
+import gzip
+import hashlib
+import heapq
+import json
+import logging
+import os
+import pathlib
+import typing as t
+
+from ...constants.fields import AXID
+from ...tools import PathLike, get_path
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DeltaKeys:
+    """Sequence of the asset keys in the records of a delta state for use with bisect."""
+
+    def __init__(self, data: bytes, count: int):
+        """Pass."""
+        self.data: bytes = data
+        self.count: int = count
+
+    def __len__(self) -> int:
+        """Pass."""
+        return self.count
+
+    def __getitem__(self, idx: int) -> bytes:
+        """Pass."""
+        start = len(DeltaState.MAGIC) + idx * DeltaState.RECORD_SIZE
+        return self.data[start : start + DeltaState.KEY_SIZE]  # noqa: E203
+
+
+class DeltaState:
+    """Track the assets returned by an export to find the assets added, changed, or removed.
+
+    Notes:
+        The state file is a gzipped sorted array of fixed size records, one for each asset,
+        made of the internal_axon_id and a hash of the asset. Lookups use a binary search of
+        the array so the previous state is never loaded into a dict, which keeps memory
+        usage close to the size of the state file even with millions of assets.
+
+        The records of the current export are kept in one bytearray. Every
+        :attr:`RUN_SIZE` records are sorted in place into a run, and :meth:`save` merges the
+        runs straight into the state file.
+    """
+
+    MAGIC: bytes = b"axdelta1"
+    """Header of a delta state file."""
+
+    KEY_SIZE: int = AXID.length
+    """Size of the internal_axon_id in each record."""
+
+    HASH_SIZE: int = 8
+    """Size of the hash of the asset in each record."""
+
+    RECORD_SIZE: int = KEY_SIZE + HASH_SIZE
+    """Size of each record."""
+
+    RUN_SIZE: int = 65536
+    """Number of records of the current export that are sorted at a time."""
+
+    ADDED: str = "added"
+    """Change type for assets that were not returned by the previous export."""
+
+    CHANGED: str = "changed"
+    """Change type for assets that have a different hash than in the previous export."""
+
+    REMOVED: str = "removed"
+    """Change type for assets that were returned by the previous export but not this one."""
+
+    def __init__(self, path: PathLike):
+        """Track the assets returned by an export.
+
+        Args:
+            path: path to the state file of the previous export
+        """
+        self.LOG: logging.Logger = LOGGER.getChild(self.__class__.__name__)
+        self.path: pathlib.Path = get_path(path)
+        self.data: bytes = self.load()
+        self.count: int = (len(self.data) - len(self.MAGIC)) // self.RECORD_SIZE
+        self.keys: DeltaKeys = DeltaKeys(data=self.data, count=self.count)
+        self.seen: bytearray = bytearray(self.count)
+        self.records: bytearray = bytearray()
+        self.runs: t.List[int] = []
+
+    def __str__(self) -> str:
+        """Pass."""
+        return (
+            f"{self.__class__.__name__}(path={str(self.path)!r}, previous={self.count}, "
+            f"current={len(self.records) // self.RECORD_SIZE})"
+        )
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+    def load(self) -> bytes:
+        """Load the records of the previous export from the state file."""
+        if not self.path.is_file():
+            return self.MAGIC
+
+        try:
+            with gzip.open(self.path, "rb") as fh:
+                data = fh.read()
+        except Exception as exc:
+            self.LOG.warning(f"Unable to load delta state from {str(self.path)!r}: {exc}")
+            return self.MAGIC
+
+        if not data.startswith(self.MAGIC) or (len(data) - len(self.MAGIC)) % self.RECORD_SIZE:
+            self.LOG.warning(f"Ignoring invalid delta state in {str(self.path)!r}")
+            return self.MAGIC
+
+        self.LOG.debug(f"Loaded delta state from {str(self.path)!r}")
+        return data
+
+    @classmethod
+    def get_key(cls, row: dict) -> bytes:
+        """Get the key of an asset for a record."""
+        return str(row.get(AXID.name) or "").encode()[: cls.KEY_SIZE].ljust(cls.KEY_SIZE, b"\0")
+
+    @classmethod
+    def get_hash(cls, row: dict) -> bytes:
+        """Get the hash of the fields of an asset for a record.
+
+        Notes:
+            This always uses json instead of the JSON backend in use, so the hashes in a
+            state file do not change if the backend does.
+        """
+        body = json.dumps(row, sort_keys=True, separators=(",", ":"), default=str).encode()
+        return hashlib.blake2b(body, digest_size=cls.HASH_SIZE).digest()
+
+    def check(self, row: dict) -> t.Optional[str]:
+        """Track an asset and get its change type.
+
+        Args:
+            row: asset to check
+
+        Returns:
+            :attr:`ADDED`, :attr:`CHANGED`, or None if the asset has not changed
+        """
+        key = self.get_key(row)
+        value = self.get_hash(row)
+        self.records += key
+        self.records += value
+        if len(self.records) - self.get_run_start() >= self.RUN_SIZE * self.RECORD_SIZE:
+            self.sort_run()
+
+        idx = bisect.bisect_left(self.keys, key)
+        if idx >= self.count or self.keys[idx] != key:
+            return self.ADDED
+
+        self.seen[idx] = 1
+        start = len(self.MAGIC) + idx * self.RECORD_SIZE + self.KEY_SIZE
+        previous = self.data[start : start + self.HASH_SIZE]  # noqa: E203
+        return None if previous == value else self.CHANGED
+
+    def removed(self) -> t.Generator[str, None, None]:
+        """Get the internal_axon_id of the assets from the previous export that were not checked."""
+        for idx in range(self.count):
+            if not self.seen[idx]:
+                yield self.keys[idx].rstrip(b"\0").decode()
+
+    def get_run_start(self) -> int:
+        """Get the offset in :attr:`records` of the records that are not sorted yet."""
+        return self.runs[-1] if self.runs else 0
+
+    def sort_run(self):
+        """Sort the records that are not sorted yet in place into a run."""
+        start = self.get_run_start()
+        size = self.RECORD_SIZE
+        if start == len(self.records):
+            return
+
+        run = memoryview(self.records)[start:]
+        # keep the last record if an asset was returned more than once
+        records = {}
+        for idx in range(0, len(run), size):
+            record = run[idx : idx + size].tobytes()  # noqa: E203
+            records[record[: self.KEY_SIZE]] = record
+        run.release()
+        self.records[start:] = b"".join([records[x] for x in sorted(records)])
+        self.runs.append(len(self.records))
+
+    def iter_run(self, start: int, stop: int) -> t.Generator[bytes, None, None]:
+        """Get the records of a sorted run."""
+        size = self.RECORD_SIZE
+        for idx in range(start, stop, size):
+            yield bytes(self.records[idx : idx + size])  # noqa: E203
+
+    def iter_records(self) -> t.Generator[bytes, None, None]:
+        """Get the records of the assets that were checked sorted by key.
+
+        Notes:
+            The runs are merged by key, and runs that were sorted later come later for the
+            same key, so the last record of an asset returned more than once is kept.
+        """
+        self.sort_run()
+        starts = [0, *self.runs[:-1]]
+        runs = [self.iter_run(start=x, stop=y) for x, y in zip(starts, self.runs)]
+        previous = None
+        for record in heapq.merge(*runs, key=lambda x: x[: self.KEY_SIZE]):
+            if previous is not None and previous[: self.KEY_SIZE] != record[: self.KEY_SIZE]:
+                yield previous
+            previous = record
+        if previous is not None:
+            yield previous
+
+    def save(self):
+        """Save the records of the assets that were checked to the state file."""
+        count = 0
+        temp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with gzip.open(temp, "wb", compresslevel=1) as fh:
+                fh.write(self.MAGIC)
+                buffer = bytearray()
+                for record in self.iter_records():
+                    buffer += record
+                    count += 1
+                    if len(buffer) >= self.RUN_SIZE * self.RECORD_SIZE:
+                        fh.write(buffer)
+                        buffer.clear()
+                fh.write(buffer)
+            os.replace(temp, self.path)
+        finally:
+            if temp.exists():
+                temp.unlink()
+        self.LOG.debug(f"Saved delta state with {count} assets to {str(self.path)!r}")
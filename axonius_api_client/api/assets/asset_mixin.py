@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """API model mixin for device and user assets."""
+import copy
 import datetime
 import pathlib
 import time
@@ -9,11 +10,28 @@ import uuid
 
 import cachetools
 
-from ...constants.api import DEFAULT_CALLBACKS_CLS, MAX_PAGE_SIZE, PAGE_SIZE
+from ...constants.api import (
+    DEFAULT_CALLBACKS_CLS,
+    GET_BY_IDS_CHUNK_SIZE,
+    GET_BY_IDS_CONCURRENCY,
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+)
 from ...constants.fields import AXID
-from ...exceptions import ApiError, NotFoundError, ResponseNotOk, StopFetch
+from ...exceptions import ApiError, ChunkError, NotFoundError, ResponseNotOk, StopFetch
 from ...parsers.grabber import Grabber
-from ...tools import PathLike, dt_now, dt_now_file, get_subcls, json_dump, listify
+from ...tools import (
+    PathLike,
+    Prefetcher,
+    coerce_int,
+    concurrent_map,
+    dt_now,
+    dt_now_file,
+    get_subcls,
+    json_dump,
+    listify,
+    prefetch_merge,
+)
 from ..api_endpoints import ApiEndpoint, ApiEndpoints
 from ..asset_callbacks.tools import Base as BaseCallbacks
 from ..asset_callbacks.tools import get_callbacks_cls
@@ -84,6 +102,8 @@ class AssetMixin(ModelMixins):
         src_fields: t.Optional[t.List[str]] = None,
         check_stdin: bool = True,
         grabber: t.Optional[Grabber] = None,
+        batch_size: t.Optional[int] = None,
+        concurrency: int = 1,
     ) -> Runner:
         """Run an enforcement set against a manually selected list of assets.
 
@@ -130,6 +150,9 @@ class AssetMixin(ModelMixins):
             src_fields (list): fields to use to get $ids
             check_stdin (bool): error if stdin is a TTY when prompting
             grabber: (grabber): Grabber used to get IDs
+            batch_size (int): split $ids into batches of this many Asset IDs, each one
+                verified with its own count query and run with its own request
+            concurrency (int): number of batches to count or run $eset against at once
 
         Returns:
             Runner: Runner object used to verify and run $eset
@@ -147,6 +170,8 @@ class AssetMixin(ModelMixins):
             src_fields=src_fields,
             grabber=grabber,
             check_stdin=check_stdin,
+            batch_size=batch_size,
+            concurrency=concurrency,
         )
         if verify_and_run:
             runner.verify_and_run()
@@ -671,6 +696,7 @@ class AssetMixin(ModelMixins):
         keys: t.Optional[t.Union[str, t.List[str]]] = None,
         do_echo_grab: bool = True,
         do_raise_grab: bool = False,
+        stream_grab: bool = False,
         **kwargs,
     ) -> Runner:
         """Get Asset IDs from a JSONL file with one dict per line and run $eset against them.
@@ -715,6 +741,8 @@ class AssetMixin(ModelMixins):
             do_echo_grab (bool, optional): Echo output of Asset ID grabber to console as well as log
             do_raise_grab (bool, optional): Throw an error if grabber fails to find an Asset ID
                 in any items
+            stream_grab (bool, optional): Read $path one line at a time and only keep the
+                Asset IDs and items with errors, for files with millions of rows
             **kwargs: passed to :method:`run_enforcement`
 
         Returns:
@@ -725,6 +753,7 @@ class AssetMixin(ModelMixins):
             keys=keys,
             do_echo=do_echo_grab,
             do_raise=do_raise_grab,
+            stream=stream_grab,
             source=kwargs.pop("source", None),
         )
         kwargs["ids"] = grabber.axids
@@ -737,6 +766,7 @@ class AssetMixin(ModelMixins):
         keys: t.Optional[t.Union[str, t.List[str]]] = None,
         do_echo_grab: bool = True,
         do_raise_grab: bool = False,
+        stream_grab: bool = False,
         **kwargs,
     ) -> Runner:
         """Get Asset IDs from a CSV file and run $eset against them.
@@ -781,6 +811,8 @@ class AssetMixin(ModelMixins):
             do_echo_grab (bool, optional): Echo output of Asset ID grabber to console as well as log
             do_raise_grab (bool, optional): Throw an error if grabber fails to find an Asset ID
                 in any items
+            stream_grab (bool, optional): Read $path one line at a time and only keep the
+                Asset IDs and items with errors, for files with millions of rows
             **kwargs: passed to :method:`run_enforcement`
 
         Returns:
@@ -791,6 +823,7 @@ class AssetMixin(ModelMixins):
             keys=keys,
             do_echo=do_echo_grab,
             do_raise=do_raise_grab,
+            stream=stream_grab,
             source=kwargs.pop("source", None),
         )
         kwargs["ids"] = grabber.axids
@@ -1112,6 +1145,12 @@ class AssetMixin(ModelMixins):
         export_templates: t.Optional[dict] = None,
         http_args: t.Optional[dict] = None,
         return_plain_data: t.Optional[bool] = None,
+        prefetch_pages: int = 0,
+        shards: int = 0,
+        shards_ordered: bool = True,
+        stream_pages: bool = False,
+        queries: t.Optional[t.List[str]] = None,
+        queries_concurrency: int = 1,
         **kwargs,
     ) -> t.Generator[dict, None, None]:
         """Get assets from a query.
@@ -1190,8 +1229,28 @@ class AssetMixin(ModelMixins):
             http_args: http args to pass to :meth:`axonius_api_client.http.Http.__call__` for each
                 page fetched
             request_obj: request object to use for this query
+            prefetch_pages: if greater than 0, fetch up to N pages ahead on a background thread
+                while the rows of the current page are processed
+            shards: if greater than 1, split the rows from initial_count into N offset ranges and
+                fetch them concurrently without cursor based pagination
+            shards_ordered: if shards is greater than 1, yield the rows in the same order as a
+                non-sharded fetch, otherwise yield rows from each page as soon as it is fetched
+            stream_pages: decode each page incrementally as it is received, keeping only the
+                attributes of each asset instead of the whole response in memory
+            queries: if more than one is supplied, get the assets that match any of these queries
+                instead of query, fetch the pages of each query concurrently and only yield the
+                first row for each internal_axon_id
+            queries_concurrency: number of queries to fetch at once
             **kwargs: passed thru to the asset callback defined in ``export``
         """
+        queries: t.List[str] = listify(queries)
+        if len(queries) == 1:
+            query = queries.pop()
+
+        if isinstance(shards, int) and shards > 1:
+            use_cursor = False
+            cursor_id = None
+
         request_obj: AssetRequest = self.build_get_request(
             request_obj=request_obj,
             search=search,
@@ -1223,6 +1282,9 @@ class AssetMixin(ModelMixins):
         if not isinstance(http_args, dict):
             http_args: dict = {}
 
+        if stream_pages:
+            http_args = {**http_args, "stream": True}
+
         if not isinstance(wiz_parsed, dict):
             wiz_parsed: dict = self.get_wiz_entries(wiz_entries=wiz_entries)
 
@@ -1257,13 +1319,22 @@ class AssetMixin(ModelMixins):
             )
 
         if not isinstance(initial_count, int):
-            initial_count: int = self.count(
-                query=query,
-                frontend_sent_time=request_obj.frontend_sent_time,
-                history_date_parsed=history_date_parsed,
-                query_id=request_obj.query_id,
-                saved_query_id=request_obj.saved_query_id,
-            )
+            initial_count: int = 0
+            for count_query, count, exc in concurrent_map(
+                func=lambda x: self.count(
+                    query=x,
+                    frontend_sent_time=request_obj.frontend_sent_time,
+                    history_date_parsed=history_date_parsed,
+                    query_id=request_obj.query_id,
+                    saved_query_id=request_obj.saved_query_id,
+                ),
+                items=queries or [query],
+                concurrency=queries_concurrency,
+                name=f"{self.ASSET_TYPE}_count",
+            ):
+                if exc:
+                    raise exc
+                initial_count += count
 
         if not isinstance(file_date, str):
             file_date: str = dt_now_file()
@@ -1299,6 +1370,12 @@ class AssetMixin(ModelMixins):
             "page_sleep": page_sleep,
             "page_start": page_start,
             "row_start": row_start,
+            "prefetch_pages": prefetch_pages,
+            "shards": shards,
+            "shards_ordered": shards_ordered,
+            "stream_pages": stream_pages,
+            "queries": queries,
+            "queries_concurrency": queries_concurrency,
             "initial_count": initial_count,
             "export_templates": export_templates,
             "request_obj": request_obj,
@@ -1312,6 +1389,7 @@ class AssetMixin(ModelMixins):
             row_start=row_start,
             initial_count=initial_count,
         )
+        state["queries_total"] = len(queries)
         callbacks_cls: t.Type[BaseCallbacks] = get_callbacks_cls(export=export)
         callbacks: BaseCallbacks = callbacks_cls(
             apiobj=self, getargs=kwargs, state=state, store=store
@@ -1320,34 +1398,336 @@ class AssetMixin(ModelMixins):
         callbacks.start()
         self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
         self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
+        seen: t.Optional[t.Set[str]] = set() if queries else None
 
-        while not state["stop_fetch"]:
-            request_obj.filter = store["query"]
-            request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
-            request_obj.include_details = store["include_details"]
-            request_obj.set_offset(state["rows_offset"])
-            request_obj.set_limit(state["page_size"])
-
-            try:
-                start_dt: datetime.datetime = dt_now()
-                page: AssetsPage = self._get(request_obj=request_obj, http_args=http_args)
-
-                if request_obj.use_cursor:
-                    request_obj.cursor_id = page.cursor
+        pages: t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None] = self._get_pages(
+            request_obj=request_obj,
+            state=state,
+            store=store,
+            http_args=http_args,
+            prefetch_pages=prefetch_pages,
+            shards=shards,
+            shards_ordered=shards_ordered,
+        )
+        try:
+            for page, start_dt in pages:
                 state: dict = page.process_page(state=state, start_dt=start_dt, apiobj=self)
                 for row in page.assets:
+                    if seen is not None:
+                        if row.get(AXID.name) in seen:
+                            continue
+                        seen.add(row.get(AXID.name))
                     state: dict = page.start_row(state=state, apiobj=self, row=row)
                     yield from listify(obj=callbacks.process_row(row=row))
                     state: dict = page.process_row(state=state, apiobj=self, row=row)
                 state: dict = page.process_loop(state=state, apiobj=self)
-                time.sleep(state["page_sleep"])
-            except StopFetch as exc:
-                self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
-                break
+        except StopFetch as exc:
+            self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+        finally:
+            pages.close()
+
+        for row in callbacks.delta_removed():
+            yield from listify(obj=callbacks.process_row(row=row))
+
         self.LOG.info(f"FINISHED FETCH store={json_dump(store)}")
         self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
         callbacks.stop()
 
+    def _get_pages(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        store: dict,
+        http_args: dict,
+        prefetch_pages: int = 0,
+        shards: int = 0,
+        shards_ordered: bool = True,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None]:
+        """Fetch pages of assets for :meth:`get_generator`.
+
+        Notes:
+            If prefetch_pages is 0, each page is fetched only after the rows of the previous
+            page have been processed and the offset is taken from ``state``.
+
+            Otherwise, pages are fetched in order on a background thread using a
+            :obj:`axonius_api_client.tools.Prefetcher` that keeps up to prefetch_pages
+            pages ahead of the consumer and tracks its own offset and cursor. The background
+            thread stops fetching once an empty page is returned or once max_pages or max_rows
+            have been fetched.
+
+            If shards is greater than 1, pages are fetched by :meth:`_get_pages_sharded`.
+
+            If store contains more than one query, pages are fetched by
+            :meth:`_get_pages_queries`.
+
+        Args:
+            request_obj: request object to use for each page
+            state: paging state from :meth:`AssetsPage.create_state`
+            store: store from :meth:`get_generator`
+            http_args: http args to pass to :meth:`_get`
+            prefetch_pages: number of pages to fetch ahead of the consumer
+            shards: number of offset ranges to fetch concurrently
+            shards_ordered: yield pages from the offset ranges in order
+
+        Yields:
+            tuple of (page, datetime the fetch of the page started)
+        """
+        request_obj.filter = store["query"]
+        request_obj.fields = {self.ASSET_TYPE: store["fields_parsed"]}
+        request_obj.include_details = store["include_details"]
+
+        if store.get("queries"):
+            yield from self._get_pages_queries(
+                request_obj=request_obj,
+                state=state,
+                http_args=http_args,
+                queries=store["queries"],
+                concurrency=store["queries_concurrency"],
+                ordered=shards_ordered,
+                prefetch_pages=prefetch_pages,
+            )
+            return
+
+        if isinstance(shards, int) and shards > 1:
+            yield from self._get_pages_sharded(
+                request_obj=request_obj,
+                state=state,
+                http_args=http_args,
+                shards=shards,
+                ordered=shards_ordered,
+                prefetch_pages=prefetch_pages,
+            )
+            return
+
+        if not prefetch_pages:
+            while not state["stop_fetch"]:
+                request_obj.set_offset(state["rows_offset"])
+                request_obj.set_limit(state["page_size"])
+                start_dt: datetime.datetime = dt_now()
+                page: AssetsPage = self._get(request_obj=request_obj, http_args=http_args)
+                if request_obj.use_cursor:
+                    request_obj.cursor_id = page.cursor
+                yield page, start_dt
+                time.sleep(state["page_sleep"])
+            return
+
+        fetched: dict = {"offset": state["rows_offset"], "pages": 0, "rows": 0}
+
+        def fetch() -> t.Tuple[t.Tuple[AssetsPage, datetime.datetime], bool]:
+            request_obj.set_offset(fetched["offset"])
+            request_obj.set_limit(state["page_size"])
+            fetch_dt: datetime.datetime = dt_now()
+            page: AssetsPage = self._get(request_obj=request_obj, http_args=http_args)
+            took: datetime.timedelta = dt_now() - fetch_dt
+            if request_obj.use_cursor:
+                request_obj.cursor_id = page.cursor
+            fetched["offset"] += page.asset_count_page
+            fetched["pages"] += 1
+            fetched["rows"] += page.asset_count_page
+            done: bool = (
+                not page.assets
+                or bool(state["max_pages"] and fetched["pages"] >= state["max_pages"])
+                or bool(state["max_rows"] and fetched["rows"] >= state["max_rows"])
+            )
+            if not done:
+                time.sleep(state["page_sleep"])
+            return (page, took), done
+
+        prefetcher: Prefetcher = Prefetcher(
+            fetch=fetch, size=prefetch_pages, name=f"{self.ASSET_TYPE}_prefetch"
+        )
+        self.LOG.debug(f"Fetching pages with {prefetcher}")
+        try:
+            for page, took in prefetcher:
+                # report the time spent fetching, not the time spent waiting in the queue
+                yield page, dt_now() - took
+        finally:
+            prefetcher.stop()
+
+    def _get_pages_sharded(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        http_args: dict,
+        shards: int,
+        ordered: bool = True,
+        prefetch_pages: int = 0,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None]:
+        """Fetch pages of assets for :meth:`get_generator` using concurrent offset ranges.
+
+        Notes:
+            The rows to fetch are calculated from the initial count, the row offset, max_rows,
+            and max_pages in ``state``, then split into ``shards`` offset ranges that are
+            aligned to the page size. If the initial count is 0 or None, it is fetched again.
+            Each range is fetched on its own thread without cursor based pagination using a
+            copy of request_obj.
+
+            Since pages can arrive out of order, max_pages is enforced by the size of the
+            offset ranges and is removed from ``state``. Empty pages are not yielded, the
+            fetch ends once every range has been fetched.
+
+        Args:
+            request_obj: request object to copy for each offset range
+            state: paging state from :meth:`AssetsPage.create_state`
+            http_args: http args to pass to :meth:`_get`
+            shards: number of offset ranges to fetch concurrently
+            ordered: yield pages from the offset ranges in order
+            prefetch_pages: number of pages to fetch ahead of the consumer for each offset range
+
+        Yields:
+            tuple of (page, datetime the fetch of the page started)
+        """
+        page_size: int = state["page_size"]
+        row_start: int = state["rows_offset"]
+        row_stop: t.Optional[int] = state["rows_initial_count"]
+        if not isinstance(row_stop, int) or row_stop < 1:
+            # the offset ranges can not be split without knowing how many rows there are
+            row_stop = state["rows_initial_count"] = self.count(
+                query=request_obj.filter,
+                frontend_sent_time=request_obj.frontend_sent_time,
+                history_date_parsed=request_obj.history,
+                query_id=request_obj.query_id,
+                saved_query_id=request_obj.saved_query_id,
+            )
+        if state["max_rows"]:
+            row_stop = min(row_stop, row_start + state["max_rows"])
+        if state["max_pages"]:
+            row_stop = min(row_stop, row_start + state["max_pages"] * page_size)
+        state["max_pages"] = 0
+
+        pages_total: int = -(-max(row_stop - row_start, 0) // page_size)
+        shard_size: int = -(-pages_total // shards) * page_size
+        ranges: t.List[t.Tuple[int, int]] = [
+            (offset, min(offset + shard_size, row_stop))
+            for offset in range(row_start, row_stop, shard_size or 1)
+        ]
+        self.LOG.debug(
+            f"Fetching {row_stop - row_start} rows from offset {row_start} "
+            f"in {len(ranges)} offset ranges: {ranges}"
+        )
+
+        def get_fetch(
+            offset: int, stop: int
+        ) -> t.Callable[[], t.Tuple[t.Tuple[AssetsPage, datetime.timedelta], bool]]:
+            shard_request: AssetRequest = copy.deepcopy(request_obj)
+            shard_request.use_cursor = False
+            shard_request.cursor_id = None
+            fetched: dict = {"offset": offset}
+
+            def fetch() -> t.Tuple[t.Tuple[AssetsPage, datetime.timedelta], bool]:
+                shard_request.set_offset(fetched["offset"])
+                shard_request.set_limit(min(page_size, stop - fetched["offset"]))
+                fetch_dt: datetime.datetime = dt_now()
+                page: AssetsPage = self._get(request_obj=shard_request, http_args=http_args)
+                took: datetime.timedelta = dt_now() - fetch_dt
+                fetched["offset"] += page.asset_count_page
+                done: bool = not page.assets or fetched["offset"] >= stop
+                if not done:
+                    time.sleep(state["page_sleep"])
+                return (page, took), done
+
+            return fetch
+
+        pages = prefetch_merge(
+            fetches=[get_fetch(offset=offset, stop=stop) for offset, stop in ranges],
+            size=prefetch_pages or 1,
+            ordered=ordered,
+            name=f"{self.ASSET_TYPE}_shard",
+        )
+        try:
+            for page, took in pages:
+                if page.assets:
+                    yield page, dt_now() - took
+        finally:
+            pages.close()
+
+    def _get_pages_queries(
+        self,
+        request_obj: AssetRequest,
+        state: dict,
+        http_args: dict,
+        queries: t.List[str],
+        concurrency: int = 1,
+        ordered: bool = True,
+        prefetch_pages: int = 0,
+    ) -> t.Generator[t.Tuple[AssetsPage, datetime.datetime], None, None]:
+        """Fetch pages of assets for :meth:`get_generator` from multiple queries concurrently.
+
+        Notes:
+            The queries are fetched in groups of ``concurrency``, each query on its own thread
+            with cursor based pagination using a copy of request_obj.
+
+            Since the pages of each query are numbered separately, the row offset and max_pages
+            are applied to each query and max_pages is removed from ``state``. Empty pages are not
+            yielded, the fetch ends once every query has been fetched.
+
+        Args:
+            request_obj: request object to copy for each query
+            state: paging state from :meth:`AssetsPage.create_state`
+            http_args: http args to pass to :meth:`_get`
+            queries: queries to fetch
+            concurrency: number of queries to fetch at once
+            ordered: yield pages from the queries in order
+            prefetch_pages: number of pages to fetch ahead of the consumer for each query
+
+        Yields:
+            tuple of (page, datetime the fetch of the page started)
+        """
+        page_size: int = state["page_size"]
+        row_start: int = state["rows_offset"]
+        max_pages: int = state["max_pages"]
+        max_rows: int = state["max_rows"]
+        state["max_pages"] = 0
+        concurrency: int = max(1, concurrency or 1)
+
+        def get_fetch(
+            query: str,
+        ) -> t.Callable[[], t.Tuple[t.Tuple[AssetsPage, datetime.timedelta], bool]]:
+            query_request: AssetRequest = copy.deepcopy(request_obj)
+            query_request.filter = query
+            query_request.cursor_id = None
+            fetched: dict = {"offset": row_start, "pages": 0, "rows": 0}
+
+            def fetch() -> t.Tuple[t.Tuple[AssetsPage, datetime.timedelta], bool]:
+                query_request.set_offset(fetched["offset"])
+                query_request.set_limit(page_size)
+                fetch_dt: datetime.datetime = dt_now()
+                page: AssetsPage = self._get(request_obj=query_request, http_args=http_args)
+                took: datetime.timedelta = dt_now() - fetch_dt
+                if query_request.use_cursor:
+                    query_request.cursor_id = page.cursor
+                fetched["offset"] += page.asset_count_page
+                fetched["pages"] += 1
+                fetched["rows"] += page.asset_count_page
+                done: bool = (
+                    not page.assets
+                    or bool(max_pages and fetched["pages"] >= max_pages)
+                    or bool(max_rows and fetched["rows"] >= max_rows)
+                )
+                if not done:
+                    time.sleep(state["page_sleep"])
+                return (page, took), done
+
+            return fetch
+
+        for idx in range(0, len(queries), concurrency):
+            group: t.List[str] = queries[idx : idx + concurrency]  # noqa: E203
+            self.LOG.debug(
+                f"Fetching queries {idx + 1}-{idx + len(group)} of {len(queries)} concurrently"
+            )
+            pages = prefetch_merge(
+                fetches=[get_fetch(query=query) for query in group],
+                size=prefetch_pages or 1,
+                ordered=ordered,
+                name=f"{self.ASSET_TYPE}_query",
+            )
+            try:
+                for page, took in pages:
+                    if page.assets:
+                        yield page, dt_now() - took
+            finally:
+                pages.close()
+
     def get_by_saved_query(
         self,
         name: str,
@@ -1558,6 +1938,127 @@ class AssetMixin(ModelMixins):
                 raise NotFoundError(msg)
             raise  # pragma: no cover
 
+    def get_by_ids(
+        self, ids: t.Union[str, t.List[str]], generator: bool = False, **kwargs
+    ) -> GEN_TYPE:
+        """Get the data for multiple assets.
+
+        Examples:
+            >>> import axonius_api_client as axonapi
+            >>> connect_args: dict = axonapi.get_env_connect()
+            >>> client: axonapi.Connect = axonapi.Connect(**connect_args)
+            >>> apiobj: axonapi.api.assets.AssetMixin = client.devices
+            >>>       # or client.users or client.vulnerabilities
+            >>> asset_ids: list[str] = [x["internal_axon_id"] for x in apiobj.get(max_rows=10)]
+            Get the full data set of all adapters for each asset, 5 assets at a time
+            >>> assets: list[dict] = apiobj.get_by_ids(ids=asset_ids, concurrency=5)
+            Get the default fields for each asset using queries of 1000 ids each
+            >>> assets: list[dict] = apiobj.get_by_ids(ids=asset_ids, full=False)
+
+        Args:
+            ids: internal_axon_id of assets to get
+            generator: return an iterator for assets that will yield assets as they are fetched
+            **kwargs: passed to :meth:`get_by_ids_generator`
+        """
+        gen = self.get_by_ids_generator(ids=ids, **kwargs)
+        return gen if generator else list(gen)
+
+    def get_by_ids_generator(
+        self,
+        ids: t.Union[str, t.List[str]],
+        full: bool = True,
+        concurrency: int = GET_BY_IDS_CONCURRENCY,
+        chunk_size: int = GET_BY_IDS_CHUNK_SIZE,
+        error: bool = True,
+        **kwargs,
+    ) -> t.Generator[dict, None, None]:
+        """Get the data for multiple assets.
+
+        Notes:
+            If full is True, the full data set of all adapters for each asset is fetched using
+            :meth:`get_by_id` and each asset is yielded as soon as it is fetched.
+
+            If full is False, the fields of each asset are fetched using :meth:`get_by_values`
+            with one ``internal_axon_id in [...]`` query for every chunk_size ids, which is much
+            faster when only the basic fields are needed.
+
+            All requests share the connection pool of the http client, so concurrency is
+            limited to its pool size. An id that fails does not stop the other ids from being
+            fetched.
+
+        Args:
+            ids: internal_axon_id of assets to get
+            full: get the full data set of all adapters for each asset
+            concurrency: number of requests to send at once
+            chunk_size: number of ids to put in each query if full is False
+            error: raise an error after all assets are fetched if any ids failed
+            **kwargs: passed to :meth:`get_by_values` if full is False
+
+        Raises:
+            :exc:`ChunkError`: if error is True and any ids failed, with the id and exception
+                of each failure in errors and the count of assets fetched in value
+        """
+        ids: t.List[str] = list(dict.fromkeys(listify(ids)))
+        total: int = len(ids)
+        errors: t.List[dict] = []
+        value: int = 0
+
+        pool_size: t.Optional[int] = getattr(self.auth.http, "POOL_MAXSIZE", None)
+        if pool_size and concurrency > pool_size:
+            self.LOG.warning(f"Limiting concurrency {concurrency} to pool size {pool_size}")
+            concurrency = pool_size
+
+        for id in [x for x in ids if not AXID.is_axid(x)]:
+            ids.remove(id)
+            errors.append({"id": id, "exc": ApiError(f"Invalid {AXID.name}: {AXID.rules_short}")})
+
+        if full:
+            results = concurrent_map(
+                func=self.get_by_id,
+                items=ids,
+                concurrency=concurrency,
+                name=f"{self.ASSET_TYPE}_get_by_id",
+                ordered=False,
+            )
+            for id, asset, exc in results:
+                if exc:
+                    errors.append({"id": id, "exc": exc})
+                else:
+                    value += 1
+                    yield asset
+        elif ids:
+            found: t.Set[str] = set()
+            assets = self.get_by_values(
+                values=ids,
+                field=AXID.name,
+                field_manual=True,
+                chunk_size=chunk_size,
+                concurrency=concurrency,
+                generator=True,
+                **kwargs,
+            )
+            for asset in assets:
+                found.add(asset.get(AXID.name))
+                value += 1
+                yield asset
+            for id in [x for x in ids if x not in found]:
+                msg = f"Failed to find {self.ASSET_TYPE} asset with internal_axon_id of {id!r}"
+                errors.append({"id": id, "exc": NotFoundError(msg)})
+
+        for item in errors:
+            self.LOG.error(f"Failed to get {self.ASSET_TYPE} asset {item['id']!r}: {item['exc']}")
+
+        if errors and error:
+            raise ChunkError(
+                [
+                    f"{len(errors)} out of {total} ids failed",
+                    f"Assets fetched: {value}",
+                    *[f"Asset {x['id']!r}: {x['exc']}" for x in errors],
+                ],
+                errors=errors,
+                value=value,
+            )
+
     @property
     def fields_default(self) -> t.List[dict]:
         """Fields to use by default for getting assets."""
@@ -1585,6 +2086,8 @@ class AssetMixin(ModelMixins):
         pre: str = "",
         post: str = "",
         field_manual: bool = False,
+        chunk_size: t.Optional[int] = None,
+        concurrency: int = 1,
         **kwargs,
     ) -> GEN_TYPE:  # pragma: no cover
         """Build a query to get assets where field in values.
@@ -1593,6 +2096,24 @@ class AssetMixin(ModelMixins):
             It is better to use :attr:`wizard`, :attr:`wizard_text`, or :attr:`wizard_csv`
             to build queries!
 
+            If chunk_size is supplied and there are more values than chunk_size, one query is
+            built for each chunk of values and the queries are fetched concurrently by
+            :meth:`get_generator`, which only returns the first row for each internal_axon_id.
+            The rows are processed by a single export callback, so headers are only written once.
+
+            When not_flag is True the values are the assets to exclude, splitting them up would
+            change which assets match, so they are always sent in one query.
+
+        Examples:
+            >>> import axonius_api_client as axonapi
+            >>> connect_args: dict = axonapi.get_env_connect()
+            >>> client: axonapi.Connect = axonapi.Connect(**connect_args)
+            >>> apiobj: axonapi.api.assets.AssetMixin = client.devices
+            Get assets for 50000 hostnames using 5 queries at a time with 1000 hostnames each
+            >>> assets: list[dict] = apiobj.get_by_values(
+            ...     values=hostnames, field="hostname", chunk_size=1000, concurrency=5
+            ... )
+
         Args:
             values: list of values that must match `field`
             field: name of field to query against
@@ -1600,23 +2121,28 @@ class AssetMixin(ModelMixins):
             pre: query to add to the beginning of the query
             post: query to add to the end of the query
             field_manual: consider supplied field as a fully qualified field name
+            chunk_size: build one query for every N values (ignored if not_flag is True)
+            concurrency: number of queries to fetch at once
             **kwargs: passed to :meth:`get`
         """
         field = self.fields.get_field_name(value=field, field_manual=field_manual)
 
-        match = listify(values)
-        match = [f"'{x.strip()}'" for x in match]
-        match = ", ".join(match)
-
-        inner = f"{field} in [{match}]"
-
-        kwargs["query"] = self._build_query(
-            inner=inner,
-            pre=pre,
-            post=post,
-            not_flag=not_flag,
-        )
-
+        values = [f"'{x.strip()}'" for x in listify(values)]
+        chunk_size = coerce_int(chunk_size, min_value=0, allow_none=True, as_none=0)
+        if not_flag or not chunk_size:
+            chunk_size = len(values) or 1
+
+        queries = [
+            self._build_query(
+                inner=f"{field} in [{', '.join(values[idx : idx + chunk_size])}]",  # noqa: E203
+                pre=pre,
+                post=post,
+                not_flag=not_flag,
+            )
+            for idx in range(0, len(values) or 1, chunk_size)
+        ]
+        kwargs["queries"] = queries
+        kwargs["queries_concurrency"] = concurrency
         return self.get(**kwargs)
 
     def get_by_value_regex(
@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 """API for working with fields for assets."""
+import gzip
+import hashlib
+import os
+import pathlib
 import re
+import time
 import typing as t
 from typing import List, Optional, Tuple, Union
 
 from cachetools import TTLCache, cached
 
+from ... import DEFAULT_PATH
 from ...constants.fields import (
     AGG_ADAPTER_ALTS,
     AGG_ADAPTER_NAME,
+    FIELDS_CACHE_DIR,
+    FIELDS_CACHE_TTL,
     FUZZY_SCHEMAS_KEYS,
     GET_SCHEMA_KEYS,
     GET_SCHEMAS_KEYS,
@@ -16,7 +24,7 @@ from ...constants.fields import (
 )
 from ...exceptions import ApiError, NotFoundError
 from ...parsers.fields import parse_fields, schema_custom
-from ...tools import listify, split_str, strip_right
+from ...tools import json_decode, json_encode, listify, split_str, strip_right
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ChildMixins
@@ -60,11 +68,19 @@ class Fields(ChildMixins):
         * Get schemas of all adapters and their fields: :meth:`get`
         * Validate field names supplied: :meth:`validate`
 
+    Notes:
+        If the client was created with ``fields_cache=True`` (or OS env AX_FIELDS_CACHE=yes),
+        the parsed field schemas are also cached on disk in :attr:`cache_path` so that new
+        processes do not need to fetch and parse them again.
+
     See Also:
         * Device assets :obj:`axonius_api_client.api.assets.devices.Devices`
         * User assets :obj:`axonius_api_client.api.assets.users.Users`
     """
 
+    CACHE_TTL: int = FIELDS_CACHE_TTL
+    """Seconds a persistent cache of parsed field schemas is valid for."""
+
     @cached(cache=TTLCache(maxsize=1024, ttl=300))
     def get(self) -> dict:
         """Get the schema of all adapters and their fields.
@@ -88,7 +104,76 @@ class Fields(ChildMixins):
             ...     print(f"title {title!r}, qualified name {name!r}, base name {name!r}")
 
         """
-        return parse_fields(raw=self._get().document_meta)
+        cache_path = self.cache_path
+        data = self._load_cache(path=cache_path) if cache_path else None
+        if data is None:
+            data = parse_fields(raw=self._get().document_meta)
+            if cache_path:
+                self._save_cache(path=cache_path, data=data)
+        return data
+
+    @property
+    def cache_key(self) -> t.Optional[str]:
+        """Get the key for the persistent cache of parsed field schemas.
+
+        Notes:
+            The key is made from the URL, the asset type, and the version and build date from
+            :meth:`axonius_api_client.api.system.meta.Meta.about`. None if the persistent
+            cache is not enabled or the version and build date are unknown.
+        """
+        client = getattr(self.http, "CLIENT", None)
+        if not getattr(client, "FIELDS_CACHE", False):
+            return None
+
+        about = client.meta.about(error=False)
+        version = about.get("Version", about.get("Installed Version", ""))
+        build = about.get("Build Date", "")
+        if not version and not build:
+            return None
+        return "|".join([str(self.http.url), self.parent.ASSET_TYPE, str(version), str(build)])
+
+    @property
+    def cache_path(self) -> t.Optional[pathlib.Path]:
+        """Get the path for the persistent cache of parsed field schemas."""
+        key = self.cache_key
+        if not key:
+            return None
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        name = f"fields_{self.parent.ASSET_TYPE}_{digest}.json.gz"
+        return pathlib.Path(DEFAULT_PATH) / FIELDS_CACHE_DIR / name
+
+    def _load_cache(self, path: pathlib.Path) -> t.Optional[dict]:
+        """Load parsed field schemas from a persistent cache if it is valid."""
+        try:
+            if not path.is_file() or time.time() - path.stat().st_mtime > self.CACHE_TTL:
+                return None
+
+            with gzip.open(path, "rb") as fh:
+                data = json_decode(fh.read())
+
+            if data.get("key") != self.cache_key:
+                return None
+
+            self.LOG.debug(f"Loaded parsed field schemas from cache {str(path)!r}")
+            return data["fields"]
+        except Exception as exc:
+            self.LOG.warning(f"Unable to load parsed field schemas from {str(path)!r}: {exc}")
+            return None
+
+    def _save_cache(self, path: pathlib.Path, data: dict):
+        """Save parsed field schemas to a persistent cache."""
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            body = json_encode({"key": self.cache_key, "fields": data}).encode()
+            with gzip.open(temp, "wb") as fh:
+                fh.write(body)
+            os.replace(temp, path)
+            self.LOG.debug(f"Saved parsed field schemas to cache {str(path)!r}")
+        except Exception as exc:
+            self.LOG.warning(f"Unable to save parsed field schemas to {str(path)!r}: {exc}")
+            if temp.exists():
+                temp.unlink()
 
     def validate(
         self,
@@ -132,7 +217,8 @@ class Fields(ChildMixins):
 
         def add(items):
             for item in listify(items):
-                if item not in selected:
+                if item not in seen:
+                    seen.add(item)
                     selected.append(item)
 
         fields = listify(obj=fields)
@@ -140,6 +226,7 @@ class Fields(ChildMixins):
         fields_fuzzy = listify(obj=fields_fuzzy)
 
         selected: t.List[str] = []
+        seen: t.Set[str] = set()
 
         if fields_default and not fields_root:
             add(self.parent.fields_default)
@@ -209,14 +296,17 @@ class Fields(ChildMixins):
 
         afield = afields[0]
 
-        fields = self.get()
         adapter = self.get_adapter_name(value=adapter)
-        schemas = fields[adapter]
-        if fields_custom and adapter in fields_custom:
-            schemas += fields_custom[adapter]
-        schema = self.get_field_schema(
-            value=afield, schemas=schemas, selectable_only=selectable_only
+        schema = self.find_field_schema(
+            adapter=adapter, value=afield, selectable_only=selectable_only
         )
+        if schema is None:
+            schemas = self.get()[adapter]
+            if fields_custom and adapter in fields_custom:
+                schemas = schemas + fields_custom[adapter]
+            schema = self.get_field_schema(
+                value=afield, schemas=schemas, selectable_only=selectable_only
+            )
         return schema[key] if key else schema
 
     def get_field_names_re(
@@ -276,6 +366,7 @@ class Fields(ChildMixins):
         fields = self.get()
 
         matches = []
+        seen = set()
 
         for adapter_re, fields_re in splits:
             adapters = self.get_adapter_names(value=adapter_re)
@@ -289,8 +380,10 @@ class Fields(ChildMixins):
                     if root_only:
                         found_schemas = [x for x in found_schemas if x["is_root"]]
 
-                    names = [x[key] for x in found_schemas]
-                    matches += [x for x in names if x not in matches]
+                    for name in [x[key] for x in found_schemas]:
+                        if name not in seen:
+                            seen.add(name)
+                            matches.append(name)
         return matches
 
     def get_field_names_eq(
@@ -330,20 +423,26 @@ class Fields(ChildMixins):
         fields = self.get()
 
         matches = []
+        seen = set()
 
         for adapter_name, names in splits:
             adapter = self.get_adapter_name(value=adapter_name)
             for name in names:
-                schemas = fields[adapter]
-                schema = self.get_field_schema(
-                    value=name,
-                    schemas=schemas,
-                    fields_error=fields_error,
-                    selectable_only=selectable_only,
+                schema = self.find_field_schema(
+                    adapter=adapter, value=name, selectable_only=selectable_only
                 )
+                if schema is None:
+                    schema = self.get_field_schema(
+                        value=name,
+                        schemas=fields[adapter],
+                        fields_error=fields_error,
+                        selectable_only=selectable_only,
+                    )
 
                 match = schema[key] if key else schema
-                if match not in matches:
+                marker = match if key else (schema["adapter_name"], schema["name_qual"])
+                if marker not in seen:
+                    seen.add(marker)
                     matches.append(match)
 
         return matches
@@ -397,12 +496,8 @@ class Fields(ChildMixins):
             since 'ips' is a sub-field of 'specific_data.data.network_interfaces'
 
         """
-        fields = self.get()
         adapter = self.get_adapter_name(value=adapter)
-        schemas = fields[adapter]
-
-        matches = [x for x in schemas if x.get("selectable") and x.get("is_root")]
-        return matches
+        return list(self.get_index()[adapter]["root"])
 
     def get_field_names_root(self, adapter: str, key: str = "name_qual") -> List[str]:
         """Get names of all root fields for a given adapter.
@@ -517,6 +612,57 @@ class Fields(ChildMixins):
             f"No adapter found where name equals {value!r}, valid adapters:{valids}"
         )
 
+    def get_index(self) -> t.Dict[str, dict]:
+        """Get the index of the field schemas of each adapter.
+
+        Notes:
+            The index is rebuilt whenever :meth:`get` returns a new set of field schemas.
+            For each adapter it has:
+
+            * ``selectable``: lowercase name, base name, qualified name, and title of each
+              selectable schema mapped to the first schema with that value
+            * ``all``: the same for all schemas
+            * ``root``: schemas of selectable root fields
+        """
+        fields = self.get()
+        cached = getattr(self, "_index", None)
+        if cached and cached[0] is fields:
+            return cached[1]
+
+        index = {}
+        for adapter, schemas in fields.items():
+            index[adapter] = {"selectable": {}, "all": {}, "root": []}
+            for schema in schemas:
+                selectable = schema.get("selectable", True)
+                for key in GET_SCHEMA_KEYS:
+                    value = schema[key].lower()
+                    index[adapter]["all"].setdefault(value, schema)
+                    if selectable:
+                        index[adapter]["selectable"].setdefault(value, schema)
+                if schema.get("selectable") and schema.get("is_root"):
+                    index[adapter]["root"].append(schema)
+
+        self._index = (fields, index)
+        return index
+
+    def find_field_schema(
+        self, adapter: str, value: str, selectable_only: bool = True
+    ) -> t.Optional[dict]:
+        """Find a field schema that equals a value using :meth:`get_index`.
+
+        Args:
+            adapter: name of adapter as returned by :meth:`get_adapter_name`
+            value: name, base name, qualified name, or title of field
+            selectable_only: only find schemas of selectable fields
+
+        Returns:
+            the same schema :meth:`get_field_schema` would return, None if not found
+        """
+        index = self.get_index().get(adapter, {})
+        return index.get("selectable" if selectable_only else "all", {}).get(
+            value.lower().strip()
+        )
+
     def get_field_schemas(
         self, value: str, schemas: List[dict], keys: List[str] = GET_SCHEMAS_KEYS
     ) -> List[dict]:
@@ -535,9 +681,8 @@ class Fields(ChildMixins):
             if not schema.get("selectable"):
                 continue
 
-            for key in keys:
-                if search.search(schema[key]) and schema not in matches:
-                    matches.append(schema)
+            if any(search.search(schema[key]) for key in keys):
+                matches.append(schema)
         return matches
 
     def get_field_schema(
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 """API for working with tags for assets."""
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Union
 
-from ...tools import listify
+from ...exceptions import ChunkError
+from ...tools import coerce_int, concurrent_map, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ChildMixins
@@ -97,6 +98,8 @@ class Labels(ChildMixins):
         labels: List[str],
         invert_selection: bool = False,
         expirable_tags: Optional[dict] = None,
+        chunk_size: Optional[int] = None,
+        concurrency: int = 1,
     ) -> int:
         """Add tags to assets.
 
@@ -119,6 +122,10 @@ class Labels(ChildMixins):
                 )
             1
 
+            Add tags to a large number of assets 5000 at a time using 4 threads
+
+            >>> apiobj.labels.add(rows=rows, labels=['api tag 1'], chunk_size=5000, concurrency=4)
+
         Args:
             rows: list of internal_axon_id strs or list of assets returned from a get method
             labels: tags to add
@@ -127,11 +134,24 @@ class Labels(ChildMixins):
             expirable_tags: Dict with tag name and expiration_date (string or int) as keys
              - expiration_date as string is a date (YYYY-MM-DD)
              - expiration_date as int is days from now
+            chunk_size: send this many ids per request (ignored if invert_selection is True)
+            concurrency: number of chunks to send at once
+
+        Raises:
+            :exc:`ChunkError`: if any chunks failed, with the count from the successful chunks
 
         """
         ids = self._get_ids(rows=rows)
         expirable_tags: List[dict] = self._set_expirable_tags(expirations=expirable_tags)
-        return self._add(labels=labels, ids=ids, include=not invert_selection, expirable_tags=expirable_tags).value
+        return self._chunked(
+            method=self._add,
+            ids=ids,
+            include=not invert_selection,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            labels=labels,
+            expirable_tags=expirable_tags,
+        )
 
     def _add(
         self, labels: List[str], ids: List[str], include: bool = True, expirable_tags: List[dict] = None,
@@ -155,7 +175,14 @@ class Labels(ChildMixins):
             http=self.auth.http, request_obj=request_obj, asset_type=self.asset_type
         )
 
-    def remove(self, rows: List[dict], labels: List[str], invert_selection: bool = False) -> int:
+    def remove(
+        self,
+        rows: List[dict],
+        labels: List[str],
+        invert_selection: bool = False,
+        chunk_size: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> int:
         """Remove tags from assets.
 
         Examples:
@@ -176,10 +203,85 @@ class Labels(ChildMixins):
             labels: tags to remove
             invert_selection: True=remove tags from assets that ARE NOT supplied in rows;
                 False=remove tags from assets that ARE supplied in rows
+            chunk_size: send this many ids per request (ignored if invert_selection is True)
+            concurrency: number of chunks to send at once
+
+        Raises:
+            :exc:`ChunkError`: if any chunks failed, with the count from the successful chunks
 
         """
         ids: List[str] = self._get_ids(rows=rows)
-        return self._remove(labels=labels, ids=ids, include=not invert_selection).value
+        return self._chunked(
+            method=self._remove,
+            ids=ids,
+            include=not invert_selection,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            labels=labels,
+        )
+
+    def _chunked(
+        self,
+        method: Callable[..., json_api.generic.IntValue],
+        ids: List[str],
+        include: bool = True,
+        chunk_size: Optional[int] = None,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> int:
+        """Send ids to :meth:`_add` or :meth:`_remove` in chunks.
+
+        Notes:
+            When include is False the ids are the assets to exclude, splitting them up would
+            change which assets are modified, so they are always sent in one request.
+
+        Args:
+            method: :meth:`_add` or :meth:`_remove`
+            ids: internal_axon_id of assets to process
+            include: passed to method
+            chunk_size: send this many ids per request
+            concurrency: number of chunks to send at once
+            **kwargs: passed to method
+
+        Raises:
+            :exc:`ChunkError`: if any chunks failed, with the count from the successful chunks
+        """
+        chunk_size = coerce_int(chunk_size, min_value=0, allow_none=True, as_none=0)
+
+        if not include or not chunk_size or len(ids) <= chunk_size:
+            return method(ids=ids, include=include, **kwargs).value
+
+        chunks = [ids[idx : idx + chunk_size] for idx in range(0, len(ids), chunk_size)]
+        value = 0
+        errors = []
+
+        def perform(chunk: List[str]) -> json_api.generic.IntValue:
+            return method(ids=chunk, include=include, **kwargs)
+
+        results = concurrent_map(
+            func=perform, items=chunks, concurrency=concurrency, name=method.__name__.strip("_")
+        )
+        for number, (chunk, result, exc) in enumerate(results, start=1):
+            if exc:
+                errors.append({"chunk": number, "ids": chunk, "exc": exc})
+                self.LOG.error(
+                    f"Chunk {number} of {len(chunks)} with {len(chunk)} ids failed: {exc}"
+                )
+            else:
+                value += result.value
+                self.LOG.debug(f"Chunk {number} of {len(chunks)} modified {result.value} assets")
+
+        if errors:
+            raise ChunkError(
+                [
+                    f"{len(errors)} out of {len(chunks)} chunks of {chunk_size} ids failed",
+                    f"Assets modified by successful chunks: {value}",
+                    *[f"Chunk {x['chunk']} ({len(x['ids'])} ids): {x['exc']}" for x in errors],
+                ],
+                errors=errors,
+                value=value,
+            )
+        return value
 
     def _remove(
         self, labels: List[str], ids: List[str], include: bool = True
@@ -9,7 +9,7 @@ from ...constants.fields import AXID
 from ...data import BaseData
 from ...exceptions import RunnerError, RunnerWarning
 from ...parsers.grabber import Grabber, Mixins
-from ...tools import confirm, csv_able, is_str, listify, style_switch
+from ...tools import coerce_int, concurrent_map, confirm, csv_able, is_str, listify, style_switch
 
 # from .. import json_api
 from ..json_api.enforcements import (
@@ -41,13 +41,18 @@ NOTES: str = """# Run Enforcement via manual selection
 - $prompt (bool): default=True if running from axonshell else False
 - $do_echo (bool): default=False
 - $refetch (bool): default=False
+- $batch_size (int): default=None
+- $concurrency (int): default=1
 
 ## Calculations
 
 - $ids_csv (str): comma separated list of $ids
 - $query (str): build AQL like "internal_axon_id in [$ids_csv]"
-- $count_result (int): get the count of $query from the API
+- $batches (list[list[str]]): $ids split into lists of $batch_size Asset IDs
+- $count_result (int): get the count of $query from the API, summing the count of the
+  $query of each of $batches if there is more than one batch
 - $count_ids (int): the count of supplied $ids
+- $count_batch (int): the count of Asset IDs in the largest of $batches
 - $count_warn (int): 100
 - $count_error (int): 100000
 - $is_match (bool): $count_ids equals $count_result
@@ -56,9 +61,9 @@ NOTES: str = """# Run Enforcement via manual selection
 
 - If not $verified and not $verify_count
   - ERROR(must supply verified or verify_count as True)
-- If $count_ids is greater than $count_error
+- If $count_batch is greater than $count_error
   - ERROR(Query length is over error limit - please create EC + SQ to run)
-- If $count_ids is greater than $count_warn:
+- If $count_batch is greater than $count_warn:
   - WARN(Query length is over warning limit - recommend create EC + SQ to run)
 - If $verified:
   - set $state=user set $verified=True, skipping verification
@@ -97,11 +102,45 @@ NOTES: str = """# Run Enforcement via manual selection
 - If $verified is False:
   - If $force=False: ERROR(verified is False, must supply force=True)
   - if $force=True: RUN(running with force=True)
-- Send API request to execute
+- Send API request to execute for each of $batches, $concurrency at a time
+- If any of $batches failed:
+  - ERROR(report of the status of each of $batches)
 """
 NOTES_DOC: str = textwrap.indent(NOTES.lstrip(), prefix=" " * 8)
 
 
+@dataclasses.dataclass
+class RunnerBatch(BaseData):
+    """Status of running an Enforcement Set against one batch of Asset IDs."""
+
+    number: int
+    """number of this batch"""
+
+    ids: t.List[str] = dataclasses.field(repr=False)
+    """Asset IDs in this batch"""
+
+    result: t.Any = dataclasses.field(default=None, repr=False)
+    """response from the API for this batch"""
+
+    error: t.Optional[Exception] = None
+    """exception raised while running this batch"""
+
+    @property
+    def count_ids(self) -> int:
+        """Count of Asset IDs in this batch."""
+        return len(self.ids)
+
+    @property
+    def executed(self) -> bool:
+        """The Enforcement Set was executed against this batch."""
+        return self.error is None
+
+    def __str__(self) -> str:
+        """Dunder."""
+        status = "ran" if self.executed else f"FAILED: {self.error}"
+        return f"Batch {self.number} with {self.count_ids} Asset IDs {status}"
+
+
 @dataclasses.dataclass
 class Runner(BaseData, Mixins):
     f"""Run an Enforcement Set against a manually provided list of Asset IDs.
@@ -120,6 +159,8 @@ class Runner(BaseData, Mixins):
         prompt (bool): Prompt user for verification when applicable.
         do_echo (bool): Echo output to console as well as log
         refetch (bool): refetch $eset even if it is a model
+        batch_size (int): split $ids into batches of this many Asset IDs
+        concurrency (int): number of batches to count or run $eset against at once
     """
 
     apiobj: object
@@ -158,8 +199,15 @@ class Runner(BaseData, Mixins):
     grabber: t.Optional[Grabber] = None
     """Grabber used to get IDs."""
 
+    batch_size: t.Optional[int] = None
+    """Split $ids into batches of this many Asset IDs for $query and running $eset."""
+
+    concurrency: int = 1
+    """Number of batches to get the count of or run $eset against at once."""
+
     log: t.ClassVar[logging.Logger] = None
     result: t.ClassVar[str] = None
+    batch_results: t.ClassVar[t.Optional[t.List[RunnerBatch]]] = None
     _count_result: t.ClassVar[int] = None
     _initialized: t.ClassVar[bool] = False
     _executed: t.ClassVar[bool] = False
@@ -221,6 +269,9 @@ class Runner(BaseData, Mixins):
         Args:
             force (bool, optional): if verified=False or already run, ignore and run anyway
 
+        Returns:
+            the response from running $eset, or a list of :obj:`RunnerBatch` if $ids was run
+            in more than one batch
         """
         self.init()
         self.state = self._tstate_run_eval
@@ -249,6 +300,7 @@ class Runner(BaseData, Mixins):
             self.log = self.apiobj.LOG.getChild(self.__class__.__name__)
             self._count_result = None
             self._result = None
+            self.batch_results = None
             self._initialized = False
             self._executed = False
             self.state = "initialized!"
@@ -256,10 +308,10 @@ class Runner(BaseData, Mixins):
             self.get_eset()
 
     def check_limits(self):
-        """Check if $count_ids is past warning or error threshold."""
-        if self.count_ids >= self.count_error:
+        """Check if $count_batch is past warning or error threshold."""
+        if self.count_batch >= self.count_error:
             self.spew(msgs=self._tlimit_error, exc=True)
-        if self.count_ids >= self.count_warn:
+        if self.count_batch >= self.count_warn:
             self.spew(msgs=self._tlimit_warn, warn=True)
         self.state = self._tstate_checked_limits
 
@@ -311,9 +363,17 @@ class Runner(BaseData, Mixins):
         """Get $count_result from API using $query as a filter."""
         if refetch or not isinstance(self.count_result, int):
             self.state = self._tstate_get_count
-            self.count_result = self.apiobj.count(query=self.query)
+            if self.count_batches > 1:
+                self.count_result = self._get_count_batches()
+            else:
+                self.count_result = self.apiobj.count(query=self.query)
             self.state = self._tstate_got_count
 
+    def get_query(self, ids: t.List[str]) -> str:
+        """Build AQL to use to get count of assets matching ids."""
+        ids_csv = ", ".join([f'"{x}"' for x in ids])
+        return f'("{AXID.name}" in [{ids_csv}])'
+
     def infos(self, msgs: t.Optional[t.List[str]] = None, top: bool = True) -> t.List[str]:
         """Get info on runner."""
         ret = []
@@ -335,7 +395,25 @@ class Runner(BaseData, Mixins):
     @property
     def query(self) -> str:
         """AQL to use to get count of assets matching $ids."""
-        return f'("{AXID.name}" in [{self.ids_csv}])'
+        return self.get_query(ids=self.ids)
+
+    @property
+    def batches(self) -> t.List[t.List[str]]:
+        """$ids split into batches of $batch_size Asset IDs."""
+        size = self.count_batch
+        return [self.ids[idx : idx + size] for idx in range(0, self.count_ids, size)]  # noqa: E203
+
+    @property
+    def count_batch(self) -> int:
+        """Count of Asset IDs in the largest batch of $ids."""
+        if self.batch_size:
+            return min(self.batch_size, self.count_ids)
+        return self.count_ids
+
+    @property
+    def count_batches(self) -> int:
+        """Count of batches of $ids."""
+        return -(-self.count_ids // self.count_batch) if self.count_ids else 0
 
     @property
     def executed(self) -> bool:
@@ -418,7 +496,7 @@ class Runner(BaseData, Mixins):
 
     @property
     def _tstr_items(self) -> t.List[str]:
-        return [
+        items = [
             f"state={self.state!r}",
             f"eset={self._teset!r}",
             f"executed={self.executed}",
@@ -429,6 +507,13 @@ class Runner(BaseData, Mixins):
             f"prompt={self.prompt}",
             f"grabber={self.grabber}",
         ]
+        if self.count_batches > 1:
+            items += [
+                f"batch_size={self.batch_size}",
+                f"concurrency={self.concurrency}",
+                f"count_batches={self.count_batches}",
+            ]
+        return items
 
     @property
     def _teset(self) -> str:
@@ -505,6 +590,11 @@ class Runner(BaseData, Mixins):
 
     @property
     def _tlimit1_tmpl(self) -> str:
+        if self.count_batches > 1:
+            return (
+                f"Batches of {self.count_batch} Asset IDs were requested but the {{cond}} limit "
+                "is {value}"
+            )
         return f"{self.count_ids} Asset IDs were supplied but the {{cond}} limit is {{value}}"
 
     @property
@@ -517,7 +607,10 @@ class Runner(BaseData, Mixins):
 
     @property
     def _tget_count_post(self) -> str:
-        return f"using $query built from $count_ids={self.count_ids} Asset IDs"
+        ret = f"using $query built from $count_ids={self.count_ids} Asset IDs"
+        if self.count_batches > 1:
+            ret += f" in {self.count_batches} batches"
+        return ret
 
     @property
     def _tstate_get_count(self) -> str:
@@ -535,15 +628,88 @@ class Runner(BaseData, Mixins):
     def _tstate_ran(self) -> str:
         return f"{self._tran_pre} {self._trun_post}"
 
-    def _run(self):
-        """Actual workflow to run an Enforcement Set."""
+    @property
+    def _tbatches(self) -> t.List[str]:
+        batches = listify(self.batch_results)
+        failed = len([x for x in batches if not x.executed])
+        return [
+            f"{len(batches) - failed} out of {len(batches)} batches ran, {failed} failed",
+            *[f"  {x}" for x in batches],
+        ]
+
+    def _run(self) -> t.Union[t.Any, t.List[RunnerBatch]]:
+        """Actual workflow to run an Enforcement Set.
+
+        Returns:
+            the response from running the Enforcement Set if there is one batch of $ids,
+            otherwise a :obj:`RunnerBatch` for each batch, also set as :attr:`batch_results`
+        """
         self.state = self._tstate_run
+        if self.count_batches > 1:
+            return self._run_batches()
         ret = self.apiobj._run_enforcement(
             name=self.eset.name, ids=self.ids, fields=self.src_fields, query=self.src_query
         )
         self.state = self._tstate_ran
         return ret
 
+    def _run_batch(self, ids: t.List[str]) -> t.Any:
+        return self.apiobj._run_enforcement(
+            name=self.eset.name, ids=ids, fields=self.src_fields, query=self.src_query
+        )
+
+    def _run_batches(self) -> t.List[RunnerBatch]:
+        """Run the Enforcement Set against each batch of $ids, $concurrency at a time."""
+        results = concurrent_map(
+            func=self._run_batch,
+            items=self.batches,
+            concurrency=self._concurrency,
+            name="run_enforcement",
+        )
+        self.batch_results = [
+            RunnerBatch(number=number, ids=ids, result=result, error=exc)
+            for number, (ids, result, exc) in enumerate(results, start=1)
+        ]
+        if not all(x.executed for x in self.batch_results):
+            # batches that did run can not be un-run, require force=True to run again
+            self.executed = True
+            self.state = f"{self._tran_pre} with errors {self._trun_post}"
+            self.spew(msgs=[self.state, *self._tbatches], exc=True)
+
+        self.state = self._tstate_ran
+        self.spew(msgs=self._tbatches, level="debug", top=False)
+        return self.batch_results
+
+    def _get_count_batches(self) -> int:
+        """Get the sum of the count of the $query of each batch of $ids, $concurrency at a time."""
+        count = 0
+        errors = []
+        results = concurrent_map(
+            func=lambda ids: self.apiobj.count(query=self.get_query(ids=ids)),
+            items=self.batches,
+            concurrency=self._concurrency,
+            name="run_enforcement_count",
+        )
+        for number, (ids, result, exc) in enumerate(results, start=1):
+            if exc:
+                errors.append(f"Batch {number} with {len(ids)} Asset IDs FAILED: {exc}")
+            else:
+                count += result
+
+        if errors:
+            msg = f"Failed to get $count_result for {len(errors)} out of {self.count_batches}"
+            self.spew(msgs=[f"{msg} batches", *errors], exc=True)
+        return count
+
+    @property
+    def _concurrency(self) -> int:
+        concurrency = max(1, coerce_int(self.concurrency))
+        pool_size: t.Optional[int] = getattr(self.apiobj.auth.http, "POOL_MAXSIZE", None)
+        if pool_size and concurrency > pool_size:
+            self.log.warning(f"Limiting concurrency {concurrency} to pool size {pool_size}")
+            concurrency = pool_size
+        return concurrency
+
     def _infos(self, title: str, infos: dict) -> t.List[str]:
         """Build info for a section."""
         return [
@@ -562,12 +728,21 @@ class Runner(BaseData, Mixins):
             verified="$ids have already been verified, run $eset against them",
             verify_count="verify that $count_result from $query equals $count_ids",
             prompt="prompt if $verified=False and $is_match=False",
+            batch_size="split $ids into batches of this many Asset IDs",
+            concurrency="number of batches to count or run $eset against at once",
         )
         return ret
 
     @property
     def _info_calcs(self) -> t.List[str]:
-        return ["count_warn", "count_error", "count_ids", "count_result", "is_match"]
+        return [
+            "count_warn",
+            "count_error",
+            "count_ids",
+            "count_batch",
+            "count_result",
+            "is_match",
+        ]
 
     def _info_calcs_desc(self) -> dict:
         """Descriptions for calculations section."""
@@ -593,6 +768,7 @@ class Runner(BaseData, Mixins):
             raise RunnerError(self.infos(msgs=[self._tno_ids, self._tids, "", *AXID.rules]))
 
         self.ids = ids
+        self.batch_size = coerce_int(self.batch_size, min_value=0, allow_none=True, as_none=0)
         self.log.debug(self._tloadedids)
         self.log.debug(self._tquery)
 
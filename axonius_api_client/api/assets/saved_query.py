@@ -680,6 +680,7 @@ class SavedQuery(ChildMixins):
         run_by_values: t.Optional[t.List[str]] = None,
         run_from_values: t.Optional[t.List[str]] = None,
         request_obj: t.Optional[models.QueryHistoryRequest] = None,
+        compact: bool = False,
     ) -> t.List[models.QueryHistory]:
         """Get query history.
 
@@ -708,6 +709,8 @@ class SavedQuery(ChildMixins):
                 :meth:`get_query_history_run_from` (will be fetched if not supplied)
             request_obj (t.Optional[QueryHistoryRequest], optional):  Request object to use
                 for options
+            compact (bool, optional): yield compact rows that use less memory and are not
+                instances of QueryHistory, see :meth:`BaseModel.to_compact`
         """
         if not isinstance(request_obj, models.QueryHistoryRequest):
             request_obj = models.QueryHistoryRequest()
@@ -760,7 +763,8 @@ class SavedQuery(ChildMixins):
         ) as state:
             while not state.stop_paging:
                 page = state.page(method=self._get_query_history, request_obj=request_obj)
-                yield from page.rows
+                for row in page.rows:
+                    yield row.to_compact() if compact else row
 
     def get(
         self, generator: bool = False, **kwargs
@@ -878,6 +882,7 @@ class SavedQuery(ChildMixins):
         log_level: t.Union[int, str] = LOG_LEVEL_API,
         query: t.Optional[str] = None,
         request_obj: t.Optional[models.SavedQueryGet] = None,
+        trusted: bool = False,
     ) -> t.Generator[models.SavedQuery, None, None]:
         """Get Saved Queries using a generator.
 
@@ -895,6 +900,8 @@ class SavedQuery(ChildMixins):
             log_level (int, optional): log level
             query (str, optional): query to filter saved queries
             request_obj (t.Optional[models.SavedQueryGet], optional): request object
+            trusted (bool, optional): load saved queries without validating them,
+                see :meth:`BaseModel.from_trusted`
 
         Yields:
             t.Generator[QueryHistory, None, None]: saved query dataclass or dict
@@ -920,7 +927,9 @@ class SavedQuery(ChildMixins):
             log_level=log_level,
         ) as state:
             while not state.stop_paging:
-                page = state.page(method=self._get_model, request_obj=request_obj)
+                page = state.page(
+                    method=self._get_model, request_obj=request_obj, trusted=trusted
+                )
                 for row in page.rows:
                     yield row if as_dataclass else row.to_dict()
 
@@ -1374,10 +1383,14 @@ class SavedQuery(ChildMixins):
         self.get_cached.cache_clear()
         return response
 
-    def _get_model(self, request_obj: models.SavedQueryGet) -> t.List[models.SavedQuery]:
+    def _get_model(
+        self, request_obj: models.SavedQueryGet, trusted: bool = False
+    ) -> t.List[models.SavedQuery]:
         """Direct API method to get all saved queries."""
         api_endpoint = ApiEndpoints.saved_queries.get
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        return api_endpoint.perform_request(
+            http=self.auth.http, request_obj=request_obj, trusted=trusted
+        )
 
     def _check_name_exists(self, value: str):
         """Check if a SQ already exists with a given name.
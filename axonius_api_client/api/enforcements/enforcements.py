@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 """API for working with enforcements."""
+import threading
 import typing as t
 import warnings
 
 from cachetools import TTLCache, cached
 
-from ...constants.api import MAX_PAGE_SIZE
+from ...constants.api import GET_FULL_CONCURRENCY, MAX_PAGE_SIZE
 from ...exceptions import AlreadyExists, ApiError, ApiWarning, NotAllowedError, NotFoundError
 from ...parsers.tables import tablize
-from ...tools import listify
+from ...tools import concurrent_map, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..folders import FoldersEnforcements
@@ -36,6 +37,7 @@ MULTI_SET = t.Union[
 ]
 MULTI_ACTION_TYPE = t.Union[str, dict, ActionType]
 CACHE_GET = TTLCache(maxsize=1024, ttl=60)
+CACHE_GET_LOCK = threading.RLock()
 
 
 class Enforcements(ModelMixins):
@@ -136,15 +138,19 @@ class Enforcements(ModelMixins):
             )
         )
 
-    @cached(cache=CACHE_GET)
+    @cached(cache=CACHE_GET, lock=CACHE_GET_LOCK)
     def get_sets_cached(
         self, **kwargs
     ) -> t.List[t.Union[EnforcementBasicModel, EnforcementFullModel]]:
-        """Get all enforcements cached."""
+        """Get all enforcements cached for 60 seconds or until an enforcement set is changed.
+
+        Args:
+            **kwargs: passed to :meth:`get_sets_generator`
+        """
         return list(self.get_sets_generator(**kwargs))
 
     def get_sets(
-        self, generator: bool = False, full: bool = True
+        self, generator: bool = False, full: bool = True, concurrency: int = GET_FULL_CONCURRENCY
     ) -> t.Union[
         t.Generator[t.Union[EnforcementBasicModel, EnforcementFullModel], None, None],
         t.List[t.Union[EnforcementBasicModel, EnforcementFullModel]],
@@ -154,32 +160,43 @@ class Enforcements(ModelMixins):
         Args:
             generator: return an iterator for objects
             full: get the full model of each enforcement set
+            concurrency: number of full models to fetch at once
         """
-        gen = self.get_sets_generator(full=full)
+        gen = self.get_sets_generator(full=full, concurrency=concurrency)
         return gen if generator else list(gen)
 
     def get_sets_generator(
-        self, full: bool = True
+        self, full: bool = True, concurrency: int = GET_FULL_CONCURRENCY
     ) -> t.Generator[t.Union[EnforcementBasicModel, EnforcementFullModel], None, None]:
         """Get all enforcement sets using a generator.
 
+        Notes:
+            If full is True, the full models are fetched by a pool of concurrency threads as
+            the basic models are paged in and are yielded in the same order as the basic models.
+
         Args:
             full: get the full model of each enforcement set
+            concurrency: number of full models to fetch at once
 
         Yields:
             t.Generator[t.Union[EnforcementBasicModel, EnforcementFullModel], None, None]: Generator
         """
-        offset = 0
-
-        while True:
-            rows = self._get_sets(offset=offset)
-            offset += len(rows)
+        rows = self._get_sets_generator()
+        if not full:
+            yield from rows
+            return
 
-            if not rows:
-                break
+        for row, full_row, exc in concurrent_map(
+            func=lambda x: x.get_full(), items=rows, concurrency=concurrency, name="enforcements"
+        ):
+            if exc is not None:
+                raise exc
+            yield full_row
 
-            for row in rows:
-                yield row.get_full() if full else row
+    def clear_cache(self):
+        """Clear the cache used by :meth:`get_sets_cached`."""
+        with CACHE_GET_LOCK:
+            CACHE_GET.clear()
 
     def check_set_exists(self, value: MULTI_SET):
         """Check if an enforcement set already exists.
@@ -850,7 +867,7 @@ Easiest way to learn the correct configuration for an action:
         api_endpoint = ApiEndpoints.enforcements.delete_set
         request_obj = api_endpoint.load_request(value={"ids": [uuid], "include": True})
         response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
-        self.get_sets_cached.cache_clear()
+        self.clear_cache()
         return response
 
     def _copy(self, uuid: str, name: str, clone_triggers: bool) -> EnforcementFullModel:
@@ -869,7 +886,7 @@ Easiest way to learn the correct configuration for an action:
             id=uuid, uuid=uuid, name=name, clone_triggers=clone_triggers
         )
         response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
-        self.get_sets_cached.cache_clear()
+        self.clear_cache()
         return response
 
     def _update_description(self, uuid: str, description: str) -> None:
@@ -885,7 +902,7 @@ Easiest way to learn the correct configuration for an action:
         response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, uuid=uuid
         )
-        self.get_sets_cached.cache_clear()
+        self.clear_cache()
         return response
 
     def _update(
@@ -919,7 +936,7 @@ Easiest way to learn the correct configuration for an action:
         response = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, uuid=uuid
         )
-        self.get_sets_cached.cache_clear()
+        self.clear_cache()
         return response
 
     def _create_from_model(self, request_obj: CreateEnforcementModel) -> EnforcementFullModel:
@@ -928,7 +945,7 @@ Easiest way to learn the correct configuration for an action:
         response: EnforcementFullModel = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj
         )
-        self.get_sets_cached.cache_clear()
+        self.clear_cache()
         return response
 
     def _create(
@@ -970,7 +987,7 @@ Easiest way to learn the correct configuration for an action:
             folder_id=folder_id,
         )
         response = api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
-        self.get_sets_cached.cache_clear()
+        self.clear_cache()
         return response
 
     # noinspection PyShadowingBuiltins
@@ -1000,6 +1017,23 @@ Easiest way to learn the correct configuration for an action:
         )
         return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
 
+    def _get_sets_generator(self, **kwargs) -> t.Generator[EnforcementBasicModel, None, None]:
+        """Page through all enforcement sets in basic model.
+
+        Args:
+            **kwargs: passed to :meth:`_get_sets`
+        """
+        offset = 0
+
+        while True:
+            rows = self._get_sets(offset=offset, **kwargs)
+            offset += len(rows)
+
+            if not rows:
+                break
+
+            yield from rows
+
     def _get_set(self, uuid: str) -> EnforcementFullModel:
         """Get an enforcement set in full model.
 
@@ -1055,6 +1089,7 @@ Easiest way to learn the correct configuration for an action:
         response: MoveEnforcementsResponseModel = api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj
         )
+        self.clear_cache()
         return response
 
     def _run_sets_against_trigger(
@@ -238,6 +238,8 @@ class Tasks(ModelMixins):
         log_level: t.Union[int, str] = PagingState.log_level,
         request_obj: t.Optional[GetTasks] = None,
         echo: bool = True,
+        compact: bool = False,
+        trusted: bool = False,
         **kwargs,
     ) -> t.Generator[TaskTypes, None, None]:
         """Get all tasks for all enforcements in multiple model formats.
@@ -252,6 +254,9 @@ class Tasks(ModelMixins):
             log_level: log level to use
             request_obj: request object to use, will create using above args if not provided
             echo: echo debug output
+            compact: yield compact rows that use less memory and are not instances of the
+                task models, see :meth:`BaseModel.to_compact`
+            trusted: load full tasks without validating them, see :meth:`BaseModel.from_trusted`
             **kwargs: passed to :meth:`build_get_request`
         """
         request_obj: GetTasks = self.build_get_request(request_obj=request_obj, **kwargs)
@@ -266,17 +271,18 @@ class Tasks(ModelMixins):
             slow_warning=not as_basic,
         ):
             if as_basic:
-                yield basic
+                row = basic
             else:
                 # only get the full model if we need it
                 # this is because we can only get one full model at a time
                 # which can take quite a long time if there are many tasks
                 # this could be async but that's a problem for future me
-                full: TaskFull = basic.get_full()
+                full: TaskFull = basic.get_full(trusted=trusted)
                 if as_full:
-                    yield full
+                    row = full
                 else:
-                    yield Task.load(basic=basic, full=full, http=self.auth.http)
+                    row = Task.load(basic=basic, full=full, http=self.auth.http)
+            yield row.to_compact() if compact else row
 
     def direct_get_generator(
         self,
@@ -357,15 +363,17 @@ class Tasks(ModelMixins):
         )
         return response
 
-    def get_full(self, uuid: str) -> TaskFull:
+    def get_full(self, uuid: str, trusted: bool = False) -> TaskFull:
         """Direct API method to get a single task for an enforcement in full model.
 
         Args:
             uuid: uuid of the task to get
+            trusted: load the task without validating it, see :meth:`BaseModel.from_trusted`
         """
         api_endpoint: ApiEndpoint = ApiEndpoints.enforcements.tasks.get_full
         response: TaskFull = api_endpoint.perform_request(
             http=self.auth.http,
             uuid=uuid,
+            trusted=trusted,
         )
         return response
@@ -78,7 +78,14 @@ class AssetsPage(BaseModel):
             This is a custom method for this model because we do not want to break
             the interface that most users expect from this model.
 
+            If data is a generator from
+            :meth:`axonius_api_client.api.api_endpoint.ApiEndpoint.get_response_json_stream`,
+            only the attributes of each asset are kept as each one is decoded.
+
         """
+        if not isinstance(data, dict):
+            return cls.load_response_stream(data=data, **kwargs)
+
         inner_data: t.Optional[dict] = data.get("data")
         empty: bool = inner_data is None
         assets: t.Optional[t.List[dict]] = None
@@ -94,6 +101,37 @@ class AssetsPage(BaseModel):
         cls._post_load_attrs(data=obj, **kwargs)
         return obj
 
+    @classmethod
+    def load_response_stream(
+        cls, data: t.Iterable[t.Tuple[str, t.Any, bool]], **kwargs
+    ) -> "AssetsPage":
+        """Serialize the data from an incrementally decoded response into the model.
+
+        Args:
+            data: tuples of (key, value, is_item) from
+                :meth:`axonius_api_client.api.api_endpoint.ApiEndpoint.get_response_json_stream`
+        """
+        empty: bool = True
+        assets: t.Optional[t.List[dict]] = None
+        meta: t.Optional[dict] = None
+
+        for key, value, is_item in data:
+            if key == "data" and is_item:
+                if assets is None:
+                    empty, assets = False, []
+                if isinstance(value, dict) and isinstance(value.get("attributes"), dict):
+                    assets.append(value["attributes"])
+            elif key == "data":
+                empty = value is None
+                assets = [] if isinstance(value, list) else None
+            elif key == "meta":
+                meta = value
+
+        new_data = {"assets": assets, "meta": meta, "empty_response": empty}
+        obj = cls(**new_data)
+        cls._post_load_attrs(data=obj, **kwargs)
+        return obj
+
     def __str__(self):
         """Pass."""
         other_meta = {k: v for k, v in self.meta.items() if k not in ["page"]}
@@ -226,6 +264,10 @@ class AssetsPage(BaseModel):
         this_count = self.asset_count_left
         prev_count = state["rows_to_fetch_total"]
 
+        if state.get("queries_total", 0) > 1:
+            # each query has its own total, use the sum of the initial counts of all queries
+            this_count = prev_count = init_count
+
         if init_count and init_count != this_count:  # pragma: no cover
             apiobj.LOG.warning(f"Row total count changed from initial {init_count} to {this_count}")
         if prev_count and prev_count != this_count:  # pragma: no cover
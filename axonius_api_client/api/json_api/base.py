@@ -27,6 +27,30 @@ from ...tools import coerce_bool, combo_dicts, json_dump, json_load, listify, st
 
 LOGGER = logging.getLogger(__name__)
 WARN_TRACKER: t.Dict[t.Type["BaseModel"], t.Set[str]] = {}
+TRUSTED_TRACKER: t.Dict[t.Type["BaseSchema"], bool] = {}
+TRUSTED_FIELDS_TRACKER: t.Dict[t.Tuple[t.Type["BaseModel"], t.Any], t.Tuple[tuple, ...]] = {}
+COMPACT_TRACKER: t.Dict[t.Type["BaseModel"], t.Type["CompactModel"]] = {}
+TRUSTED_FIELD_TYPES: t.Tuple[t.Type[marshmallow.fields.Field], ...] = (
+    marshmallow.fields.Field,
+    marshmallow.fields.Raw,
+    marshmallow.fields.String,
+    marshmallow.fields.Email,
+    marshmallow.fields.Integer,
+    marshmallow.fields.Float,
+    marshmallow.fields.Boolean,
+    marshmallow.fields.Dict,
+)
+"""Marshmallow field types whose values are used as is when loading trusted data."""
+TRUSTED_VALUE_TYPES: t.Dict[t.Type[marshmallow.fields.Field], type] = {
+    marshmallow.fields.String: str,
+    marshmallow.fields.Email: str,
+    marshmallow.fields.Integer: int,
+    marshmallow.fields.Float: float,
+    marshmallow.fields.Boolean: bool,
+}
+"""Types of the values of trusted marshmallow field types."""
+TRUSTED_HOOKS: t.Tuple[str, ...] = ("unwrap_request", "post_load_process")
+"""Load hooks that are replicated when loading trusted data."""
 
 
 def get_warn_help(value: t.Type[Warning]) -> t.List[str]:
@@ -45,6 +69,77 @@ def get_warn_help(value: t.Type[Warning]) -> t.List[str]:
     return ret
 
 
+def get_trusted_convert(mm_field: marshmallow.fields.Field) -> t.Optional[t.Callable]:
+    """Get the function used to convert the value of a field when loading trusted data.
+
+    Args:
+        mm_field (marshmallow.fields.Field): field from a schema
+
+    Returns:
+        t.Optional[t.Callable]: None if the value should be used as is, a trusted loader for
+            nested models, or the deserialize method of the field for everything else
+    """
+    if type(mm_field) in TRUSTED_FIELD_TYPES and not getattr(mm_field, "value_field", None):
+        return None
+
+    if isinstance(mm_field, marshmallow.fields.List):
+        inner = get_trusted_convert(mm_field.inner)
+        if inner is None:
+            return None
+        return lambda value: [x if x is None else inner(x) for x in value]
+
+    if isinstance(mm_field, marshmallow.fields.Nested):
+        schema = mm_field.schema
+        schema_cls = type(schema)
+        if (
+            isinstance(schema, BaseSchema)
+            and not isinstance(schema, BaseSchemaJson)
+            and schema_cls.can_load_trusted()
+        ):
+            model_cls = schema_cls.get_model_cls()
+
+            def convert(value):
+                """Pass."""
+                if mm_field.many:
+                    return [model_cls.from_trusted(data=x, schema_cls=schema_cls) for x in value]
+                return model_cls.from_trusted(data=value, schema_cls=schema_cls)
+
+            return convert
+    return mm_field.deserialize
+
+
+def get_trusted_coerce(
+    field_type: t.Any, mm_field: t.Optional[marshmallow.fields.Field] = None
+) -> t.Optional[t.Callable]:
+    """Get the function used to convert a value used as is to the type of its dataclass field.
+
+    Notes:
+        dataclasses_json converts values to the type of int, float, str, and bool dataclass
+        fields (or optional ones), i.e. an Int schema field in a str dataclass field is
+        loaded as a str, so trusted loading has to do the same.
+
+    Args:
+        field_type (t.Any): type of a dataclass field
+        mm_field (t.Optional[marshmallow.fields.Field], optional): field from a schema whose
+            values are used as is
+
+    Returns:
+        t.Optional[t.Callable]: None if values of mm_field already have the type of field_type
+            or values of field_type are not converted
+    """
+    args = [x for x in t.get_args(field_type) if x is not type(None)]
+    if t.get_origin(field_type) is t.Union and len(args) == 1:
+        field_type = args[0]
+
+    if not (isinstance(field_type, type) and issubclass(field_type, (int, float, str, bool))):
+        return None
+
+    value_type = TRUSTED_VALUE_TYPES.get(type(mm_field))
+    if value_type and issubclass(value_type, field_type):
+        return None
+    return lambda value: value if isinstance(value, field_type) else field_type(value)
+
+
 class BaseCommon:
     """Common methods for all schema and model classes."""
 
@@ -165,6 +260,76 @@ class BaseSchema(BaseCommon, marshmallow.Schema):
 
         return cls._load_schema(**combo_dicts(kwargs, schema=schema, data=data))
 
+    @classmethod
+    def can_load_trusted(cls) -> bool:
+        """Check if data for this schema can be loaded by :meth:`load_trusted`.
+
+        Notes:
+            Schemas that load into something other than a BaseModel or that change the data
+            with their own load hooks or load_response methods must be validated.
+
+        Returns:
+            bool: True if this schema does not change the data it loads
+        """
+        if cls not in TRUSTED_TRACKER:
+            # noinspection PyProtectedMember
+            hooks = [x[0] for k in ["pre_load", "post_load"] for x in cls._hooks.get(k, [])]
+            model_cls = cls.get_model_cls()
+            TRUSTED_TRACKER[cls] = (
+                all(x in TRUSTED_HOOKS for x in hooks)
+                and cls.load_response.__func__
+                in [BaseSchema.load_response.__func__, BaseSchemaJson.load_response.__func__]
+                and isinstance(model_cls, type)
+                and issubclass(model_cls, BaseModel)
+                and dataclasses.is_dataclass(model_cls)
+            )
+        return TRUSTED_TRACKER[cls]
+
+    @classmethod
+    def load_trusted(
+        cls, data: t.Union[dict, list, tuple], **kwargs
+    ) -> t.Union["BaseModel", t.List["BaseModel"]]:
+        """Load data into models without validating it using this schema.
+
+        Args:
+            data (t.Union[dict, list, tuple]): Response data to load
+            **kwargs: passed to :meth:`load_response` if this schema can not be trusted,
+                or :meth:`BaseCommon._post_load_attrs`
+
+        Returns:
+            t.Union["BaseModel", t.List["BaseModel"]]: Loaded model(s)
+        """
+        items = cls._get_trusted_items(data=data)
+        if items is None or not cls.can_load_trusted():
+            return cls.load_response(data=data, **kwargs)
+
+        kwargs["reraise"] = kwargs.get("reraise", RERAISE)
+        model_cls = cls.get_model_cls()
+        try:
+            loaded = [model_cls.from_trusted(data=x, schema_cls=cls) for x in items]
+        except Exception as exc:
+            if kwargs["reraise"]:
+                raise
+            raise SchemaError(schema=cls, exc=exc, obj=cls, data=data)
+
+        loaded = loaded if cls._is_many(data) else loaded[0]
+        cls._post_load_attrs(data=loaded, **kwargs)
+        return loaded
+
+    @classmethod
+    def _get_trusted_items(cls, data: t.Any) -> t.Optional[t.List[dict]]:
+        """Get the attributes of each item in data, or None if data can not be trusted."""
+        if isinstance(data, dict):
+            return [data]
+        if isinstance(data, (list, tuple)) and all(isinstance(x, dict) for x in data):
+            return list(data)
+        return None
+
+    @classmethod
+    def _is_many(cls, data: t.Any) -> bool:
+        """Pass."""
+        return isinstance(data, (list, tuple))
+
     # noinspection PyUnusedLocal
     @marshmallow.post_load
     def post_load_process(self, data: dict, **kwargs) -> t.Union[dict, "BaseModel"]:
@@ -228,6 +393,40 @@ class BaseSchemaJson(BaseSchema, marshmallow_jsonapi.Schema):
         schema = cls(many=many, unknown=marshmallow.INCLUDE)
         return cls._load_schema(**combo_dicts(kwargs, schema=schema, data=data))
 
+    @classmethod
+    def _get_trusted_items(cls, data: t.Any) -> t.Optional[t.List[dict]]:
+        """Get the attributes of each JSON API resource in data, or None if it can not be trusted.
+
+        Notes:
+            Matches what marshmallow_jsonapi loads: the id and attributes of each resource,
+            and the top level meta as document_meta.
+        """
+        if isinstance(data, list):
+            return super()._get_trusted_items(data=data)
+
+        inner_data: t.Any = data.get("data") if isinstance(data, dict) else None
+        resources: list = inner_data if cls._is_many(data) else [inner_data]
+        if not all(isinstance(x, dict) for x in resources):
+            return None
+
+        meta: t.Any = data.get("meta")
+        items = []
+        for resource in resources:
+            item = dict(resource.get("attributes") or {})
+            if "id" in resource:
+                item["id"] = resource["id"]
+            if meta is not None:
+                item["document_meta"] = meta
+            items.append(item)
+        return items
+
+    @classmethod
+    def _is_many(cls, data: t.Any) -> bool:
+        """Pass."""
+        if isinstance(data, dict):
+            return isinstance(data.get("data"), (list, tuple))
+        return super()._is_many(data=data)
+
     @classmethod
     def validate_attr_excludes(cls) -> t.List[str]:
         """Pass."""
@@ -455,14 +654,102 @@ class BaseModel(dataclasses_json.DataClassJsonMixin, BaseCommon):
         fields_known: t.Dict[str, Field] = cls._get_fields_dict()
         extra_attributes = {k: data.pop(k) for k in list(data) if k not in fields_known}
         obj = super().from_dict(data, **kwargs)
-        if extra_attributes:
-            if hasattr(obj, "_extra_attributes"):
-                # noinspection PyProtectedMember
-                obj._extra_attributes.update(extra_attributes)
-            else:
-                obj.extra_attributes = extra_attributes
+        obj._update_extra_attributes(extra_attributes)
         return obj
 
+    @classmethod
+    def load_trusted(
+        cls, data: t.Union[dict, list, tuple], schema_cls: t.Optional[BaseSchema] = None, **kwargs
+    ) -> t.Union["BaseModel", t.List["BaseModel"]]:
+        """Load data into this model without validating it.
+
+        Args:
+            data (t.Union[dict, list, tuple]): Response data to load
+            schema_cls (Optional[BaseSchema], optional): Schema class to use to convert data
+                will fall back to :meth:`get_schema_cls`
+            **kwargs: passed to :meth:`BaseSchema.load_trusted` or :meth:`load_response`
+
+        Returns:
+            t.Union["BaseModel", t.List["BaseModel"]]: Loaded model(s)
+        """
+        schema_cls = schema_cls or cls.get_schema_cls()
+        if callable(getattr(schema_cls, "load_trusted", None)):
+            return schema_cls.load_trusted(data=data, **kwargs)
+        return cls.load_response(data=data, schema_cls=schema_cls, **kwargs)
+
+    @classmethod
+    def from_trusted(cls, data: dict, schema_cls: t.Optional[BaseSchema] = None) -> "BaseModel":
+        """Create an instance of this model from data without validating it.
+
+        Notes:
+            Values are used as is unless the field in schema_cls converts them, i.e. datetimes
+            and nested models. Missing values use the load_default of the field in schema_cls,
+            or the default of the dataclass field. Required fields missing from data still
+            raise a TypeError.
+
+        Args:
+            data (dict): Attributes to load, keys that are not fields become extra attributes
+            schema_cls (Optional[BaseSchema], optional): Schema class with the fields to use
+                to convert values
+
+        Returns:
+            BaseModel: loaded model
+        """
+        extra_attributes = dict(data)
+        kwargs = {}
+        for name, key, convert, default in cls._get_trusted_fields(schema_cls=schema_cls):
+            value = extra_attributes.pop(key, default)
+            if value is marshmallow.missing:
+                continue
+            if callable(value) and value is default:
+                value = value()
+            kwargs[name] = value if convert is None or value is None else convert(value)
+
+        # noinspection PyArgumentList
+        obj = cls(**kwargs)
+        obj._update_extra_attributes(extra_attributes)
+        return obj
+
+    @classmethod
+    def _get_trusted_fields(
+        cls, schema_cls: t.Optional[BaseSchema] = None
+    ) -> t.Tuple[t.Tuple[str, str, t.Optional[t.Callable], t.Any], ...]:
+        """Get the name, data key, convert function, and load default of each init field.
+
+        Notes:
+            Built once per model and schema for :meth:`from_trusted`, and cached in
+            TRUSTED_FIELDS_TRACKER.
+        """
+        tracker_key = (cls, schema_cls)
+        if tracker_key not in TRUSTED_FIELDS_TRACKER:
+            schema_fields = schema_cls().fields if schema_cls else {}
+            ret = []
+            for field in cls._get_fields():
+                if not field.init:
+                    continue
+                mm_field = schema_fields.get(field.name) or field.metadata.get(
+                    "dataclasses_json", {}
+                ).get("mm_field")
+                key = getattr(mm_field, "data_key", None) or field.name
+                if isinstance(mm_field, mm_fields.DocumentMeta):
+                    # top level meta is added as document_meta by _get_trusted_items
+                    key = field.name
+                convert = get_trusted_convert(mm_field) if mm_field else None
+                if convert is None:
+                    convert = get_trusted_coerce(field_type=field.type, mm_field=mm_field)
+                default = getattr(mm_field, "load_default", marshmallow.missing)
+                ret.append((field.name, key, convert, default))
+            TRUSTED_FIELDS_TRACKER[tracker_key] = tuple(ret)
+        return TRUSTED_FIELDS_TRACKER[tracker_key]
+
+    def _update_extra_attributes(self, value: dict):
+        """Add extra attributes supplied during deserialization."""
+        if value:
+            if hasattr(self, "_extra_attributes"):
+                self._extra_attributes.update(value)
+            else:
+                self.extra_attributes = value
+
     @staticmethod
     def _human_key(key):  # pragma: no cover
         """Pass."""
@@ -661,6 +948,32 @@ class BaseModel(dataclasses_json.DataClassJsonMixin, BaseCommon):
         ret._extra_attributes = extra_attributes
         return ret
 
+    @classmethod
+    def get_compact_cls(cls) -> t.Type["CompactModel"]:
+        """Get the slotted row class with the fields of this model used by :meth:`to_compact`."""
+        if cls not in COMPACT_TRACKER:
+            fields = tuple(cls._get_field_names())
+            COMPACT_TRACKER[cls] = type(
+                f"{cls.__name__}Compact",
+                (CompactModel,),
+                {
+                    "__slots__": (*fields, "HTTP", "_extra_attributes"),
+                    "__module__": cls.__module__,
+                    "__doc__": f"Compact row of {cls.__name__}.",
+                    "MODEL": cls,
+                    "FIELDS": fields,
+                },
+            )
+        return COMPACT_TRACKER[cls]
+
+    def to_compact(self) -> "CompactModel":
+        """Get a copy of this model that does not have a per instance __dict__.
+
+        Returns:
+            CompactModel: slotted row with the field values, HTTP, and extra attributes
+        """
+        return self.get_compact_cls().from_model(model=self)
+
     @property
     def extra_attributes(self) -> dict:
         """Extra attributes supplied during deserialization."""
@@ -693,3 +1006,92 @@ class BaseModel(dataclasses_json.DataClassJsonMixin, BaseCommon):
 
         # noinspection PyAttributeOutsideInit
         self._extra_attributes = value
+
+
+class CompactModel:
+    """Slotted row with the field values of a BaseModel, see :meth:`BaseModel.to_compact`.
+
+    Notes:
+        Rows only hold the field values, HTTP, and extra attributes of the model in slots,
+        which uses a fraction of the memory of a model with a per instance __dict__ when
+        holding many rows. The model is rebuilt for str, to_dict, and any other attribute
+        of the model, so they behave the same as they do for the model.
+
+        Rows are not instances of :attr:`MODEL` or :obj:`BaseModel`, so isinstance checks
+        against the model class fail and dataclasses functions do not work on them, use
+        :meth:`to_model` for those. The model is rebuilt on every access of an attribute
+        that is not a field, so use :meth:`to_model` once when using many of them.
+    """
+
+    __slots__ = ()
+
+    MODEL: t.ClassVar[t.Type[BaseModel]] = None
+    """Model class this row was built from."""
+
+    FIELDS: t.ClassVar[t.Tuple[str, ...]] = ()
+    """Names of the fields of :attr:`MODEL`."""
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "CompactModel":
+        """Build a row from a model.
+
+        Args:
+            model (BaseModel): model to get the field values, HTTP, and extra attributes from
+
+        Returns:
+            CompactModel: row with the values of model
+        """
+        obj = cls.__new__(cls)
+        for name in cls.FIELDS:
+            setattr(obj, name, getattr(model, name))
+        obj.HTTP = getattr(model, "HTTP", None)
+        obj._extra_attributes = getattr(model, "_extra_attributes", None) or None
+        return obj
+
+    def to_model(self) -> BaseModel:
+        """Rebuild the model this row was built from without re-running __init__.
+
+        Returns:
+            BaseModel: model with the values of this row
+        """
+        obj = self.MODEL.__new__(self.MODEL)
+        state = obj.__dict__
+        for name in self.FIELDS:
+            state[name] = getattr(self, name)
+        if self.HTTP is not None:
+            state["HTTP"] = self.HTTP
+        if self._extra_attributes:
+            state["_extra_attributes"] = self._extra_attributes
+        return obj
+
+    def to_dict(self, encode_json: bool = False) -> dict:
+        """Pass."""
+        return self.to_model().to_dict(encode_json=encode_json)
+
+    def __getattr__(self, name: str) -> t.Any:
+        """Get any attribute that is not a field from the rebuilt model."""
+        if name in self.__slots__ or name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.to_model(), name)
+
+    def __getitem__(self, key):
+        """Pass."""
+        return self.to_model()[key]
+
+    def __eq__(self, other):
+        """Pass."""
+        if isinstance(other, CompactModel):
+            other = other.to_model()
+        return self.to_model() == other
+
+    def __hash__(self):
+        """Pass."""
+        return hash(self.to_model())
+
+    def __str__(self):
+        """Pass."""
+        return str(self.to_model())
+
+    def __repr__(self):
+        """Pass."""
+        return repr(self.to_model())
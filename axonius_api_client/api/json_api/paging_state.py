@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """API for working with adapters."""
+import collections
 import dataclasses
 import datetime
 import logging
@@ -7,7 +8,9 @@ import math
 import time
 import typing as t
 
-from ...constants.api import MAX_PAGE_SIZE, PAGE_SIZE
+import requests
+
+from ...constants.api import MAX_PAGE_SIZE, PAGE_HISTORY_SIZE, PAGE_METRICS_SIZE, PAGE_SIZE
 from ...constants.logs import LOG_LEVEL_API
 from ...exceptions import ApiError, StopFetch
 from ...logs import get_obj_log
@@ -22,12 +25,15 @@ class Page(BaseModel):
     state: "PagingState"
     method: callable
     request_obj: BaseModel
+    method_kwargs: t.Optional[dict] = None
 
     response: t.ClassVar[t.Optional[t.List[BaseModel]]] = None
     start_date: t.ClassVar[t.Optional[datetime.datetime]] = None
     stop_date: t.ClassVar[t.Optional[datetime.datetime]] = None
     duration: t.ClassVar[t.Optional[datetime.timedelta]] = None
     page_number: t.ClassVar[int] = 0
+    response_bytes: t.ClassVar[t.Optional[int]] = None
+    http_response: t.ClassVar[t.Optional[requests.Response]] = None
 
     @staticmethod
     def get_model_cls() -> t.Any:
@@ -43,17 +49,33 @@ class Page(BaseModel):
 
         self.start_date = dt_now()
         self.state.log.debug(f"REQUESTING PAGE {self} for {self.state}")
+        http_response = self.get_http_response()
         self.response = self.handle_response(response=self.get_response())
         self.stop_date = dt_now()
         self.duration = self.stop_date - self.start_date
+        if self.get_http_response() is not http_response:
+            self.http_response = self.get_http_response()
+            self.response_bytes = get_response_bytes(response=self.http_response)
+        self.state.add_metrics(page=self, response=self.http_response)
         self.state.log.debug(f"RECEIVED PAGE {self} for {self.state}")
 
+    def get_http_response(self) -> t.Optional[requests.Response]:
+        """Get the last response received by this thread from the HTTP client that owns method.
+
+        Notes:
+            Pages of other fetches may share the HTTP client from other threads, so the shared
+            LAST_RESPONSE of the client may belong to a different request than this page.
+        """
+        http = getattr(getattr(self.method, "__self__", None), "http", None)
+        get_thread_response = getattr(http, "get_thread_response", None)
+        return get_thread_response() if callable(get_thread_response) else None
+
     def get_request_args(self) -> dict:
         """Pass."""
         request_obj = self.request_obj
         request_obj.page.offset = self.state.row_number
         request_obj.page.limit = self.state.page_size
-        return {"request_obj": request_obj}
+        return {**(self.method_kwargs or {}), "request_obj": request_obj}
 
     def get_response(self) -> t.List[BaseModel]:
         """Pass."""
@@ -80,6 +102,7 @@ class Page(BaseModel):
             "duration",
             "page_number",
             "row_count",
+            "response_bytes",
             "method",
         ]
         vals = ", ".join([f"{p}={getval(p)}" for p in props])
@@ -98,6 +121,7 @@ class Page(BaseModel):
             "duration",
             "page_number",
             "row_count",
+            "response_bytes",
         ]
         vals = ", ".join([f"{p}={getval(p)}" for p in props])
         return f"{self.__class__.__name__}({vals})"
@@ -147,9 +171,12 @@ class PagingState(BaseModel):
     row_stop: t.Optional[int] = None
     log_level: t.Union[int, str] = LOG_LEVEL_API
     page_cls: Page = Page
+    history_size: t.Optional[int] = PAGE_HISTORY_SIZE
+    metrics_size: int = PAGE_METRICS_SIZE
 
     page_number: t.ClassVar[int] = 0
-    page_history: t.ClassVar[t.List[Page]] = None
+    page_history: t.ClassVar[t.Deque[Page]] = None
+    page_metrics: t.ClassVar[t.Deque[t.Tuple[float, int, t.Optional[int]]]] = None
     row_number: t.ClassVar[int] = 0
     rows_fetched_total: t.ClassVar[int] = 0
     rows_yielded_total: t.ClassVar[int] = 0
@@ -176,7 +203,14 @@ class PagingState(BaseModel):
         self.row_stop = coerce_int(
             obj=self.row_stop, min_value=0, allow_none=True, errmsg="error in row_stop"
         )
-        self.page_history = []
+        self.history_size = coerce_int(
+            obj=self.history_size, min_value=0, allow_none=True, errmsg="error in history_size"
+        )
+        self.metrics_size = coerce_int(
+            obj=self.metrics_size, min_value=1, errmsg="error in metrics_size"
+        )
+        self.page_history = collections.deque(maxlen=self.history_size)
+        self.page_metrics = collections.deque(maxlen=self.metrics_size)
 
         if isinstance(self.row_start, int) and self.row_start >= 1:
             self.row_number = self.row_start
@@ -235,6 +269,10 @@ class PagingState(BaseModel):
             "page_number",
             "row_number",
             "rows_fetched_total",
+            "rows_per_second",
+            "latency_mean",
+            "latency_p95",
+            "bytes_mean",
             "page_cls",
         ]
         vals = ", ".join([f"{p}={getval(p)}" for p in props])
@@ -246,6 +284,42 @@ class PagingState(BaseModel):
         now = dt_now()
         return (self.stop_date or now) - (self.start_date or now)
 
+    def add_metrics(self, page: Page, response: t.Optional[requests.Response] = None):
+        """Add the latency, row count, and response size of a page to the rolling metrics."""
+        self.page_metrics.append(
+            (
+                page.duration.total_seconds(),
+                page.row_count or 0,
+                get_response_bytes(response=response),
+            )
+        )
+
+    @property
+    def rows_per_second(self) -> t.Optional[float]:
+        """Rows fetched per second of page latency over the rolling metrics window."""
+        seconds = sum(x[0] for x in self.page_metrics)
+        return round(sum(x[1] for x in self.page_metrics) / seconds, 2) if seconds else None
+
+    @property
+    def latency_mean(self) -> t.Optional[float]:
+        """Mean page latency in seconds over the rolling metrics window."""
+        latencies = [x[0] for x in self.page_metrics]
+        return round(sum(latencies) / len(latencies), 3) if latencies else None
+
+    @property
+    def latency_p95(self) -> t.Optional[float]:
+        """95th percentile page latency in seconds over the rolling metrics window."""
+        latencies = sorted(x[0] for x in self.page_metrics)
+        if not latencies:
+            return None
+        return round(latencies[math.ceil(len(latencies) * 0.95) - 1], 3)
+
+    @property
+    def bytes_mean(self) -> t.Optional[int]:
+        """Mean response size in bytes of pages over the rolling metrics window."""
+        sizes = [x[2] for x in self.page_metrics if isinstance(x[2], int)]
+        return round(sum(sizes) / len(sizes)) if sizes else None
+
     def stop(self, reason: t.Optional[str] = None):
         """Pass."""
         self.stop_paging = True
@@ -264,6 +338,18 @@ class PagingState(BaseModel):
         if self.stop_paging:
             self.stop()
 
-    def page(self, method: callable, request_obj: object) -> Page:
+    def page(self, method: callable, request_obj: object, **kwargs) -> Page:
         """Pass."""
-        return self.page_cls(state=self, method=method, request_obj=request_obj)
+        return self.page_cls(
+            state=self, method=method, request_obj=request_obj, method_kwargs=kwargs
+        )
+
+
+def get_response_bytes(response: t.Optional[requests.Response]) -> t.Optional[int]:
+    """Get the size in bytes of the body of a response without reading unread streams."""
+    if not isinstance(response, requests.Response):
+        return None
+    if response._content is False:
+        length = str(response.headers.get("Content-Length", ""))
+        return int(length) if length.isdigit() else None
+    return len(response.content or b"")
@@ -226,8 +226,8 @@ class TaskBasic(BaseModel):
         """Pass."""
         return TaskBasicSchema
 
-    def get_full(self) -> "TaskFull":
+    def get_full(self, trusted: bool = False) -> "TaskFull":
         """Pass."""
         # TODO: ensure cached!
         # noinspection PyUnresolvedReferences
-        return self.HTTP.CLIENT.enforcements.tasks.get_full(uuid=self.uuid)
+        return self.HTTP.CLIENT.enforcements.tasks.get_full(uuid=self.uuid, trusted=trusted)
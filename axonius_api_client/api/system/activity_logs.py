@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 """API for working with product metadata."""
 import datetime
-from typing import Generator, List, Optional, Union
+import re
+from typing import Generator, List, Optional, Tuple, Union
 
 from ...constants.api import MAX_PAGE_SIZE
 from ...exceptions import StopFetch
-from ...tools import json_dump
+from ...tools import Prefetcher, coerce_int_float, dt_now, dt_parse, json_dump, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ModelMixins
 
+REGEX_CHARS: re.Pattern = re.compile(r"[.^$*+?{}\[\]\\|()]")
+"""Characters that make a property search a regex instead of literal text."""
+
 
 class ActivityLogs(ModelMixins):
     """API for working with activity logs.
@@ -39,16 +43,40 @@ class ActivityLogs(ModelMixins):
         end_date: Optional[Union[str, datetime.datetime]] = None,
         within_last_hours: Optional[int] = None,
         max_rows: Optional[int] = None,
+        search: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch_pages: int = 1,
+        compact: bool = False,
+        trusted: bool = False,
         **kwargs,
     ) -> Generator[json_api.audit_logs.AuditLog, None, None]:
         """Get activity log entries.
 
+        Notes:
+            The latest of start_date and within_last_hours is sent to the API as date_from
+            and end_date is sent as date_to. If kwargs has a single search term with no
+            regex characters it is sent to the API as search. All filters are still checked
+            against every record. If records are returned newest first, fetching stops at
+            the first record older than the start date.
+
         Args:
             start_date: only return records with dates after this value
             end_date: only return records with dates before this value
             within_last_hours: only return records that happened N hours ago
+            max_rows: stop after this many records have been fetched
+            search: text to search for on the server side
+            page_size: number of records to fetch per page
+            prefetch_pages: number of pages to fetch in the background while the current page
+                is being processed, 0 to fetch pages only when needed
+            compact: yield compact rows that use less memory and are not instances of
+                AuditLog, see :meth:`BaseModel.to_compact`
+            trusted: load records without validating them, see :meth:`BaseModel.from_trusted`
             **kwargs: only return records that regex match properties as keys
         """
+        date_from = self._get_date_from(start_date=start_date, within_last_hours=within_last_hours)
+        date_to = dt_parse(obj=end_date, default_tz_utc=True) if end_date else None
+        search = search or self._get_search(property_searches=kwargs)
+
         state = {}
         state["total_rows_fetched"] = 0
         state["page_row_start"] = 0
@@ -59,15 +87,42 @@ class ActivityLogs(ModelMixins):
         state["end_date"] = end_date
         state["within_last_hours"] = within_last_hours
         state["property_searches"] = kwargs
+        state["date_from"] = date_from
+        state["date_to"] = date_to
+        state["search"] = search
+        state["newest_first"] = None
 
-        while True:
+        def fetch() -> Tuple[List[json_api.audit_logs.AuditLog], bool]:
             self.LOG.debug(f"Fetching page state={json_dump(state)}")
-            try:
-                rows = self._get(offset=state["page_row_start"])
-                state["page_rows_fetched"] = len(rows)
-                state["page_row_start"] += len(rows)
-                state["page_number"] += 1
-
+            rows = self._get(
+                offset=state["page_row_start"],
+                limit=page_size,
+                search=search or "",
+                date_from=date_from,
+                date_to=date_to,
+                trusted=trusted,
+            )
+            state["page_rows_fetched"] = len(rows)
+            state["page_row_start"] += len(rows)
+            state["page_number"] += 1
+            if state["newest_first"] is None and len(rows) > 1:
+                state["newest_first"] = rows[0].date > rows[-1].date
+            done = not rows or self._is_past_start(row=rows[-1], date_from=date_from, state=state)
+            return rows, done
+
+        def get_pages() -> Generator[List[json_api.audit_logs.AuditLog], None, None]:
+            done = False
+            while not done:
+                rows, done = fetch()
+                yield rows
+
+        pages = (
+            Prefetcher(fetch=fetch, size=prefetch_pages, name="activity_logs_prefetch")
+            if prefetch_pages
+            else get_pages()
+        )
+        try:
+            for rows in pages:
                 if not rows:
                     raise StopFetch(reason="empty rows returned", state=state)
 
@@ -78,6 +133,9 @@ class ActivityLogs(ModelMixins):
                     ):
                         raise StopFetch(reason="reached max_rows", state=state)
 
+                    if self._is_past_start(row=row, date_from=date_from, state=state):
+                        raise StopFetch(reason="reached record older than start date", state=state)
+
                     state["total_rows_fetched"] += 1
 
                     if (
@@ -87,10 +145,41 @@ class ActivityLogs(ModelMixins):
                     ):
                         continue
 
-                    yield row
-            except StopFetch as exc:
-                self.LOG.info(f"{type(exc)}(reason={exc}) -- state:\n{json_dump(exc.state)}")
-                break
+                    yield row.to_compact() if compact else row
+        except StopFetch as exc:
+            self.LOG.info(f"{type(exc)}(reason={exc}) -- state:\n{json_dump(exc.state)}")
+        finally:
+            if isinstance(pages, Prefetcher):
+                pages.stop()
+
+    @staticmethod
+    def _get_date_from(
+        start_date: Optional[Union[str, datetime.datetime]] = None,
+        within_last_hours: Optional[int] = None,
+    ) -> Optional[datetime.datetime]:
+        """Get the latest of start_date and within_last_hours to send as date_from."""
+        dates = []
+        if start_date:
+            dates.append(dt_parse(obj=start_date, default_tz_utc=True))
+        if within_last_hours:
+            hours = coerce_int_float(value=within_last_hours)
+            dates.append(dt_now() - datetime.timedelta(hours=hours))
+        return max(dates) if dates else None
+
+    @staticmethod
+    def _get_search(property_searches: dict) -> Optional[str]:
+        """Get the search to send to the API if there is a single literal search term."""
+        terms = [y for x in property_searches.values() for y in listify(x)]
+        if len(terms) == 1 and isinstance(terms[0], str) and terms[0].strip():
+            return None if REGEX_CHARS.search(terms[0]) else terms[0]
+        return None
+
+    @staticmethod
+    def _is_past_start(
+        row: json_api.audit_logs.AuditLog, date_from: Optional[datetime.datetime], state: dict
+    ) -> bool:
+        """Check if records are newest first and row is older than date_from."""
+        return bool(state["newest_first"] and date_from and row.date < date_from)
 
     def _get(
         self,
@@ -99,6 +188,7 @@ class ActivityLogs(ModelMixins):
         search: str = "",
         date_from: Optional[Union[str, datetime.datetime]] = None,
         date_to: Optional[Union[str, datetime.datetime]] = None,
+        trusted: bool = False,
     ) -> json_api.audit_logs.AuditLog:
         """Direct API method to get the activity logs."""
         api_endpoint = ApiEndpoints.audit_logs.get
@@ -108,4 +198,6 @@ class ActivityLogs(ModelMixins):
             date_from=date_from,
             date_to=date_to,
         )
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        return api_endpoint.perform_request(
+            http=self.auth.http, request_obj=request_obj, trusted=trusted
+        )
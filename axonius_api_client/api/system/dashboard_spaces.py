@@ -6,10 +6,11 @@ import typing as t
 
 import requests
 
+from ...constants.api import EXPORT_CSV_CONCURRENCY, GET_FULL_CONCURRENCY
 from ...constants.ctypes import PathLike
 from ...exceptions import NotFoundError
 from ...parsers.matcher import Matcher, MatcherLoad
-from ...tools import dt_now_file, get_path, listify, path_write
+from ...tools import concurrent_map, csv_writer, dt_now_file, get_path, listify, path_write
 from ..api_endpoints import ApiEndpoint, ApiEndpoints
 from ..json_api.dashboard_spaces import (
     ExportableSpacesResponse,
@@ -26,11 +27,26 @@ from ..mixins import ModelMixins
 class DashboardSpaces(ModelMixins):
     """API for working with dashboard spaces and charts."""
 
-    def get(self, charts: bool = True) -> t.List[t.Union[SpacesDetails, SpaceCharts]]:
-        """Pass."""
+    def get(
+        self, charts: bool = True, concurrency: int = GET_FULL_CONCURRENCY
+    ) -> t.List[t.Union[SpacesDetails, SpaceCharts]]:
+        """Get all dashboard spaces.
+
+        Args:
+            charts: get the charts of each space
+            concurrency: number of spaces to get the charts of at once
+        """
         ret = self._get()
         if charts:
-            ret = [self._get_single(uuid=x.uuid) for x in ret]
+            ret = [
+                self._check_result(item=space, result=result, exc=exc, error=True)
+                for space, result, exc in concurrent_map(
+                    func=lambda x: self._get_single(uuid=x.uuid),
+                    items=ret,
+                    concurrency=concurrency,
+                    name="spaces_get",
+                )
+            ]
         return ret
 
     def export_charts_to_csv(
@@ -38,9 +54,50 @@ class DashboardSpaces(ModelMixins):
         spaces: t.Optional[MatcherLoad] = None,
         charts: t.Optional[MatcherLoad] = None,
         error: bool = False,
+        concurrency: int = EXPORT_CSV_CONCURRENCY,
+        generator: bool = False,
         **kwargs,
-    ) -> t.List[t.Tuple[SpaceCharts, str]]:
-        """Pass."""
+    ) -> t.Union[
+        t.Generator[t.Tuple[SpaceCharts, str], None, None], t.List[t.Tuple[SpaceCharts, str]]
+    ]:
+        """Export charts to CSV.
+
+        Args:
+            spaces: names of spaces to export charts from, all spaces if empty
+            charts: names of charts to export, all charts if empty
+            error: raise an error if any CSV export fails, otherwise the CSV will have the error
+            concurrency: number of charts to export at once
+            generator: return an iterator that yields each CSV as it arrives
+            **kwargs: passed to :meth:`Matcher.load`
+        """
+        gen = self.export_charts_to_csv_generator(
+            spaces=spaces, charts=charts, error=error, concurrency=concurrency, **kwargs
+        )
+        return gen if generator else list(gen)
+
+    def export_charts_to_csv_generator(
+        self,
+        spaces: t.Optional[MatcherLoad] = None,
+        charts: t.Optional[MatcherLoad] = None,
+        error: bool = False,
+        concurrency: int = EXPORT_CSV_CONCURRENCY,
+        ordered: bool = True,
+        **kwargs,
+    ) -> t.Generator[t.Tuple[SpaceCharts, str], None, None]:
+        """Export charts to CSV using a pool of threads.
+
+        Notes:
+            CSVs are yielded in the order of the spaces and charts, or as soon as each export
+            finishes if ordered is False.
+
+        Args:
+            spaces: names of spaces to export charts from, all spaces if empty
+            charts: names of charts to export, all charts if empty
+            error: raise an error if any CSV export fails, otherwise the CSV will have the error
+            concurrency: number of charts to export at once
+            ordered: yield CSVs in the order of the spaces and charts
+            **kwargs: passed to :meth:`Matcher.load`
+        """
         spaces_matcher: Matcher = Matcher.load(values=spaces, **kwargs)
         msg_spaces_parsed: str = f"User supplied space names:\n{spaces_matcher}"
         self.LOG.info(msg_spaces_parsed)
@@ -48,16 +105,24 @@ class DashboardSpaces(ModelMixins):
         charts_matcher: Matcher = Matcher.load(values=charts, **kwargs)
         msg_charts_parsed: str = f"User supplied chart names:\n{charts_matcher}"
         self.LOG.info(msg_charts_parsed)
-        spaces = self.get()
-        ret = []
-        for space in spaces:
-            if spaces_matcher.values and not spaces_matcher.equals(space.name):
-                continue
-            for chart in space.charts_by_order:
-                if charts_matcher.values and not charts_matcher.equals(chart.name):
+
+        def get_charts() -> t.Generator[SpaceCharts, None, None]:
+            for space in self.get(concurrency=concurrency):
+                if spaces_matcher.values and not spaces_matcher.equals(space.name):
                     continue
-                ret.append((chart, chart.export_to_csv(error=error)))
-        return ret
+                for chart in space.charts_by_order:
+                    if charts_matcher.values and not charts_matcher.equals(chart.name):
+                        continue
+                    yield chart
+
+        for chart, data, exc in concurrent_map(
+            func=lambda x: x.export_to_csv(error=error),
+            items=get_charts(),
+            concurrency=concurrency,
+            name="spaces_export_csv",
+            ordered=ordered,
+        ):
+            yield chart, self._check_result(item=chart, result=data, exc=exc, error=error)
 
     def export_charts_to_csv_path(
         self,
@@ -65,26 +130,68 @@ class DashboardSpaces(ModelMixins):
         spaces: t.Optional[MatcherLoad] = None,
         charts: t.Optional[MatcherLoad] = None,
         error: bool = False,
+        concurrency: int = EXPORT_CSV_CONCURRENCY,
+        generator: bool = False,
         **kwargs,
-    ) -> t.List[t.Tuple[SpaceCharts, str, pathlib.Path]]:
-        """Pass."""
+    ) -> t.Union[
+        t.Generator[t.Tuple[SpaceCharts, str, pathlib.Path], None, None],
+        t.List[t.Tuple[SpaceCharts, str, pathlib.Path]],
+    ]:
+        """Export charts to CSV files.
+
+        Args:
+            path: directory to write CSV files to, CWD if None
+            spaces: names of spaces to export charts from, all spaces if empty
+            charts: names of charts to export, all charts if empty
+            error: raise an error if any CSV export fails, otherwise the CSV will have the error
+            concurrency: number of charts to export at once
+            generator: return an iterator that writes and yields each CSV as it arrives
+                instead of a list of every CSV
+            **kwargs: passed to :meth:`Matcher.load`
+        """
+        gen = self.export_charts_to_csv_path_generator(
+            path=path, spaces=spaces, charts=charts, error=error, concurrency=concurrency, **kwargs
+        )
+        return gen if generator else list(gen)
+
+    def export_charts_to_csv_path_generator(
+        self,
+        path: t.Optional[PathLike] = None,
+        spaces: t.Optional[MatcherLoad] = None,
+        charts: t.Optional[MatcherLoad] = None,
+        error: bool = False,
+        concurrency: int = EXPORT_CSV_CONCURRENCY,
+        **kwargs,
+    ) -> t.Generator[t.Tuple[SpaceCharts, str, pathlib.Path], None, None]:
+        """Export charts to CSV files, writing each file as soon as its CSV arrives.
 
-        def doit(csv_export: t.Tuple[SpaceCharts, str]) -> t.Tuple[SpaceCharts, str, pathlib.Path]:
-            chart, data = csv_export
-            space = chart.SPACE
-            filename = f"{space.name}__{chart.name}__{dt_now_file()}.csv"
-            chart_path = path / filename
-            result = path_write(obj=chart_path, data=data)
-            return (chart, data, result[0])
+        Notes:
+            Files are written and yielded in the order the exports finish in, not in the
+            order of the spaces and charts.
 
+        Args:
+            path: directory to write CSV files to, CWD if None
+            spaces: names of spaces to export charts from, all spaces if empty
+            charts: names of charts to export, all charts if empty
+            error: raise an error if any CSV export fails, otherwise the CSV will have the error
+            concurrency: number of charts to export at once
+            **kwargs: passed to :meth:`Matcher.load`
+        """
         if path is None:
             path = os.getcwd()
         path = get_path(path)
 
-        return [
-            doit(x)
-            for x in self.export_charts_to_csv(spaces=spaces, charts=charts, error=error, **kwargs)
-        ]
+        for chart, data in self.export_charts_to_csv_generator(
+            spaces=spaces,
+            charts=charts,
+            error=error,
+            concurrency=concurrency,
+            ordered=False,
+            **kwargs,
+        ):
+            filename = f"{chart.SPACE.name}__{chart.name}__{dt_now_file()}.csv"
+            result = path_write(obj=path / filename, data=data)
+            yield chart, data, result[0]
 
     def export_spaces(
         self,
@@ -276,6 +383,18 @@ class DashboardSpaces(ModelMixins):
         response: ExportableSpacesResponse = api_endpoint.perform_request(http=self.auth.http)
         return response
 
+    def _check_result(
+        self, item: t.Any, result: t.Any, exc: t.Optional[Exception], error: bool = True
+    ) -> t.Any:
+        """Raise or turn into a CSV with the error any exception from a worker thread."""
+        if exc is None:
+            return result
+        if error:
+            raise exc
+        err = f"Export to CSV Failed:\n{exc}"
+        self.LOG.error(f"{err}\nFor: {item}")
+        return csv_writer(rows=[{"export_chart_csv_error": err, "chart": str(item)}])
+
     def _get(self) -> t.List[SpacesDetails]:
         """Pass."""
         api_endpoint: ApiEndpoint = ApiEndpoints.dashboard_spaces.get
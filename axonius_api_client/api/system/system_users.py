@@ -19,7 +19,9 @@ MODEL = json_api.system_users.SystemUser
 class SystemUsers(ModelMixins):
     """API for working with system users."""
 
-    def get(self, generator: bool = False) -> t.Union[t.Generator[dict, None, None], t.List[dict]]:
+    def get(
+        self, generator: bool = False, trusted: bool = False
+    ) -> t.Union[t.Generator[dict, None, None], t.List[dict]]:
         """Get Axonius system users.
 
         Examples:
@@ -31,17 +33,22 @@ class SystemUsers(ModelMixins):
 
         Args:
             generator: return an iterator for objects that will yield rows as they are fetched
+            trusted: load users without validating them, see :meth:`BaseModel.from_trusted`
 
         """
-        gen = self.get_generator()
+        gen = self.get_generator(trusted=trusted)
         return gen if generator else list(gen)
 
-    def get_generator(self) -> t.Generator[dict, None, None]:
-        """Get Axonius system users using a generator."""
+    def get_generator(self, trusted: bool = False) -> t.Generator[dict, None, None]:
+        """Get Axonius system users using a generator.
+
+        Args:
+            trusted: load users without validating them, see :meth:`BaseModel.from_trusted`
+        """
         offset = 0
 
         while True:
-            rows = self._get(offset=offset)
+            rows = self._get(offset=offset, trusted=trusted)
             offset += len(rows)
 
             if not rows:
@@ -400,17 +407,22 @@ class SystemUsers(ModelMixins):
         self._tokens_notify(uuid=user["uuid"], email=email, invite=for_new_user)
         return link, email
 
-    def _get(self, limit: int = MAX_PAGE_SIZE, offset: int = 0, **kwargs) -> t.List[MODEL]:
+    def _get(
+        self, limit: int = MAX_PAGE_SIZE, offset: int = 0, trusted: bool = False, **kwargs
+    ) -> t.List[MODEL]:
         """Direct API method to get all users.
 
         Args:
             limit: limit to N rows per page
             offset: start at row N
+            trusted: load users without validating them
         """
         api_endpoint = ApiEndpoints.system_users.get
         kwargs.setdefault("page", {"limit": limit, "offset": offset})
         request_obj = api_endpoint.load_request(**kwargs)
-        return api_endpoint.perform_request(http=self.auth.http, request_obj=request_obj)
+        return api_endpoint.perform_request(
+            http=self.auth.http, request_obj=request_obj, trusted=trusted
+        )
 
     def _add(
         self,
@@ -7,14 +7,28 @@ import typing as t
 import click
 
 from ..projects.cf_token import constants as cf_constants
-from .. import INIT_DOTENV, connect, version
+from .. import INIT_DOTENV, version
+from ..constants.api import JSON_BACKEND, JSON_BACKENDS
 from ..constants.logs import (
+    HTTP_MAX_CLI,
+    LOG_FILE_MAX_FILES,
+    LOG_FILE_MAX_MB,
+    LOG_FILE_NAME,
+    LOG_FILE_PATH,
+    LOG_HTTP_MAX,
+    LOG_LEVEL_API,
+    LOG_LEVEL_AUTH,
+    LOG_LEVEL_CONSOLE,
+    LOG_LEVEL_ENDPOINTS,
+    LOG_LEVEL_FILE,
+    LOG_LEVEL_PACKAGE,
     LOG_LEVELS_STR,
     REQUEST_ATTRS,
     REQUEST_ATTRS_DEFAULT,
     RESPONSE_ATTRS,
     RESPONSE_ATTRS_DEFAULT,
 )
+from ..http import Http
 from ..logs import LOG
 from ..setup_env import DEFAULT_ENV_FILE
 from ..tools import json_dump
@@ -234,7 +248,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-level-package",
     "-lvlpkg",
     "log_level_package",
-    default=connect.LOG_LEVEL_PACKAGE,
+    default=LOG_LEVEL_PACKAGE,
     help="Logging level to use for entire package.",
     type=click.Choice(LOG_LEVELS_STR),
     show_envvar=True,
@@ -244,7 +258,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-level-http",
     "-lvlhttp",
     "log_level_http",
-    default=connect.Http.LOG_LEVEL,
+    default=Http.LOG_LEVEL,
     help="Logging level to use for http client.",
     type=click.Choice(LOG_LEVELS_STR),
     show_envvar=True,
@@ -254,7 +268,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-level-auth",
     "-lvlauth",
     "log_level_auth",
-    default=connect.LOG_LEVEL_AUTH,
+    default=LOG_LEVEL_AUTH,
     help="Logging level to use for auth client.",
     type=click.Choice(LOG_LEVELS_STR),
     show_envvar=True,
@@ -264,7 +278,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-level-api",
     "-lvlapi",
     "log_level_api",
-    default=connect.LOG_LEVEL_API,
+    default=LOG_LEVEL_API,
     help="Logging level to use for API models.",
     type=click.Choice(LOG_LEVELS_STR),
     show_envvar=True,
@@ -274,7 +288,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-level-endpoints",
     "-lvlep",
     "log_level_endpoints",
-    default=connect.LOG_LEVEL_ENDPOINTS,
+    default=LOG_LEVEL_ENDPOINTS,
     help="Logging level to use for API endpoints.",
     type=click.Choice(LOG_LEVELS_STR),
     show_envvar=True,
@@ -284,7 +298,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-level-console",
     "-lvlcon",
     "log_level_console",
-    default=connect.LOG_LEVEL_CONSOLE,
+    default=LOG_LEVEL_CONSOLE,
     help="Logging level to use for console output.",
     type=click.Choice(LOG_LEVELS_STR),
     show_envvar=True,
@@ -294,7 +308,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-level-file",
     "-lvlfile",
     "log_level_file",
-    default=connect.LOG_LEVEL_FILE,
+    default=LOG_LEVEL_FILE,
     help="Logging level to use for file output.",
     type=click.Choice(LOG_LEVELS_STR),
     show_envvar=True,
@@ -342,7 +356,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-body-lines",
     "-lbl",
     "log_body_lines",
-    default=connect.Http.LOG_BODY_LINES,
+    default=Http.LOG_BODY_LINES,
     help="Number of lines to log from request/response body.",
     type=click.INT,
     show_envvar=True,
@@ -390,7 +404,7 @@ CF = cf_constants.CLIENT_DESC
     "-fn",
     "log_file_name",
     metavar="FILENAME",
-    default=connect.LOG_FILE_NAME,
+    default=LOG_FILE_NAME,
     help="Log file to save logs to if -f/--log-file supplied.",
     show_envvar=True,
     show_default=True,
@@ -400,7 +414,7 @@ CF = cf_constants.CLIENT_DESC
     "-fp",
     "log_file_path",
     metavar="PATH",
-    default=connect.LOG_FILE_PATH,
+    default=LOG_FILE_PATH,
     help="Directory to use for -fn/--log-file-name (Defaults to current directory).",
     show_envvar=True,
 )
@@ -408,7 +422,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-file-max-mb",
     "-fmb",
     "log_file_max_mb",
-    default=connect.LOG_FILE_MAX_MB,
+    default=LOG_FILE_MAX_MB,
     help="Rollover -fn/--log-file-name at this many megabytes.",
     type=click.INT,
     show_envvar=True,
@@ -418,7 +432,7 @@ CF = cf_constants.CLIENT_DESC
     "--log-file-max-files",
     "-fmf",
     "log_file_max_files",
-    default=connect.LOG_FILE_MAX_FILES,
+    default=LOG_FILE_MAX_FILES,
     help="Keep this many rollover logs.",
     type=click.INT,
     show_envvar=True,
@@ -438,8 +452,8 @@ CF = cf_constants.CLIENT_DESC
     "--log-http-max/--no-log-http-max",
     "-lmax/-nlmax",
     "log_http_max",
-    default=connect.Connect.LOG_HTTP_MAX,
-    help=f"Shortcut to include_output http logging - overrides: {connect.Connect.HTTP_MAX_CLI}",
+    default=LOG_HTTP_MAX,
+    help=f"Shortcut to include_output http logging - overrides: {HTTP_MAX_CLI}",
     is_flag=True,
     show_envvar=True,
     show_default=True,
@@ -528,7 +542,7 @@ CF = cf_constants.CLIENT_DESC
     "--timeout-connect",
     "-tc",
     "timeout_connect",
-    default=connect.Http.CONNECT_TIMEOUT,
+    default=Http.CONNECT_TIMEOUT,
     help="Seconds to wait for connections to API",
     type=click.INT,
     show_envvar=True,
@@ -538,7 +552,7 @@ CF = cf_constants.CLIENT_DESC
     "--timeout-response",
     "-tr",
     "timeout_response",
-    default=connect.Http.RESPONSE_TIMEOUT,
+    default=Http.RESPONSE_TIMEOUT,
     help="Seconds to wait for responses from API",
     type=click.INT,
     show_default=True,
@@ -547,7 +561,7 @@ CF = cf_constants.CLIENT_DESC
     "--max-retries",
     "-rc",
     "max_retries",
-    default=connect.Http.MAX_RETRIES,
+    default=Http.MAX_RETRIES,
     help="Number of times to retry failed connections.",
     type=click.INT,
     show_envvar=True,
@@ -557,11 +571,64 @@ CF = cf_constants.CLIENT_DESC
     "--retry-backoff",
     "-rb",
     "retry_backoff",
-    default=connect.Http.RETRY_BACKOFF,
+    default=Http.RETRY_BACKOFF,
     help="Seconds to wait between retry attempts. This value is multiplied by the retry attempt.",
     type=click.INT,
     show_default=True,
 )
+@click.option(
+    "--pool-maxsize",
+    "-pm",
+    "pool_maxsize",
+    default=Http.POOL_MAXSIZE,
+    help="Maximum number of connections to keep open to the API.",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--pool-block/--no-pool-block",
+    "-pb/-npb",
+    "pool_block",
+    default=Http.POOL_BLOCK,
+    help="Wait for a free connection instead of opening more than --pool-maxsize connections.",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--keep-alive/--no-keep-alive",
+    "-ka/-nka",
+    "keep_alive",
+    default=Http.KEEP_ALIVE,
+    help="Keep connections to the API open between requests.",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--json-backend",
+    "-jb",
+    "json_backend",
+    default=JSON_BACKEND,
+    help=(
+        "JSON backend to use (auto will use orjson if installed, orjson will also use it for "
+        "flat JSON, which has no spaces after separators and NaN as null)."
+    ),
+    type=click.Choice(JSON_BACKENDS),
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--fields-cache/--no-fields-cache",
+    "-fc/-nfc",
+    "fields_cache",
+    default=False,
+    help="Cache parsed field schemas on disk so later commands do not fetch them again.",
+    is_flag=True,
+    show_envvar=True,
+    show_default=True,
+)
 @click.option(
     "--credentials/--keys",
     "-creds/-keys",
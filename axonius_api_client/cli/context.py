@@ -8,7 +8,6 @@ import warnings
 import click
 import urllib3.exceptions
 
-from ..connect import Connect
 from ..constants.ctypes import PathLike
 from ..tools import (
     bom_strip,
@@ -38,16 +37,35 @@ To silence this message:
 """
 
 
-def load_cmds(path: PathLike, package: str, group: click.Group):
-    """Load the commands for a given path."""
+def get_cmd_name(module: str) -> str:
+    """Get the name of the command defined in a cmd_*.py module.
+
+    Notes:
+        The command in a module named cmd_get_by_id.py must be named get-by-id, unless
+        another name is passed to :meth:`AliasedGroup.add_lazy_command`.
+    """
+    return module.rsplit(".", 1)[-1][len("cmd_") :].replace("_", "-")  # noqa: E203
+
+
+def load_cmds(
+    path: PathLike,
+    package: str,
+    group: "AliasedGroup",
+    names: t.Optional[t.Dict[str, str]] = None,
+):
+    """Add the commands for a given path to a group, to be imported when they are first used.
+
+    Args:
+        path: path to the __init__.py of the group package
+        package: name of the group package
+        group: group to add the commands to
+        names: command names for modules whose command name does not match the module name
+    """
     path = pathlib.Path(path)
+    names = names or {}
 
-    for item in path.parent.glob("cmd_*.py"):
-        module = importlib.import_module(f".{item.stem}", package=package)
-        module_cmd = getattr(module, "cmd", None)
-        if callable(module_cmd):
-            # noinspection PyTypeChecker
-            group.add_command(module_cmd)
+    for item in sorted(path.parent.glob("cmd_*.py")):
+        group.add_lazy_command(module=f"{package}.{item.stem}", name=names.get(item.stem))
 
 
 class DictParam(click.ParamType):
@@ -159,8 +177,38 @@ class SplitEquals(DictParam):
 class AliasedGroup(click.Group):
     """Pass."""
 
+    def __init__(self, *args, **kwargs):
+        """Pass."""
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: t.Dict[str, t.Tuple[str, str]] = {}
+
+    def add_lazy_command(self, module: str, name: t.Optional[str] = None, attr: str = "cmd"):
+        """Add a command that is not imported until it is used.
+
+        Args:
+            module: full name of the module that defines the command
+            name: name of the command, defaults to the name from :func:`get_cmd_name`
+            attr: attribute of the module that is the command
+        """
+        name = name or get_cmd_name(module=module)
+        self.lazy_commands[name] = (module, attr)
+
+    def list_commands(self, ctx) -> t.List[str]:
+        """Pass."""
+        return sorted({*self.commands, *self.lazy_commands})
+
+    def _load_command(self, cmd_name: str):
+        """Import a lazy command and add it to this group."""
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module, attr = self.lazy_commands[cmd_name]
+            cmd = getattr(importlib.import_module(module), attr)
+            if cmd.name != cmd_name:  # pragma: no cover
+                raise RuntimeError(f"Command {cmd.name!r} in {module!r} must be named {cmd_name!r}")
+            self.add_command(cmd)
+
     def get_command(self, ctx, cmd_name):
         """Pass."""
+        self._load_command(cmd_name=cmd_name)
         rv = click.Group.get_command(self, ctx, cmd_name)
 
         if rv is not None:
@@ -171,7 +219,10 @@ class AliasedGroup(click.Group):
         if matches and len(matches) != 1:  # pragma: no cover
             ctx.fail(f"Too many matches for {cmd_name!r}: {matches}")
 
-        return click.Group.get_command(self, ctx, matches[0]) if len(matches) == 1 else None
+        if len(matches) == 1:
+            self._load_command(cmd_name=matches[0])
+            return click.Group.get_command(self, ctx, matches[0])
+        return None
 
 
 class exc_wrapper:
@@ -263,6 +314,9 @@ class Context:
         self, url: str, key: t.Optional[str] = None, secret: t.Optional[str] = None, **kwargs
     ):
         """Pass."""
+        # importing the API client is slow, only import it for commands that need it
+        from ..connect import Connect
+
         connect_args = {}
         connect_args.update(self._connect_args)
         connect_args.update(kwargs)
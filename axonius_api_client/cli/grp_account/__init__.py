@@ -4,8 +4,8 @@ import typing as t
 
 import click
 
+from .. import grp_tools
 from ..context import AliasedGroup, load_cmds
-from ..grp_tools import cmd_signup, cmd_use_token_reset_token, cmd_write_config
 
 
 @click.group(cls=AliasedGroup)
@@ -15,11 +15,13 @@ def account():
 
 load_cmds(path=__file__, package=__package__, group=account)
 
-COMMANDS: t.List[t.Any] = [
-    cmd_write_config.cmd,
-    cmd_signup.cmd,
-    cmd_use_token_reset_token.cmd,
+COMMANDS: t.List[str] = [
+    "cmd_write_config",
+    "cmd_signup",
+    "cmd_use_token_reset_token",
 ]
 
 for cmd in COMMANDS:
-    account.add_command(cmd)
+    account.add_lazy_command(
+        module=f"{grp_tools.__name__}.{cmd}", name=grp_tools.CMD_NAMES.get(cmd)
+    )
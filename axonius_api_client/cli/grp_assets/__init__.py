@@ -3,19 +3,7 @@
 import click
 
 from ..context import AliasedGroup
-from . import (
-    cmd_count,
-    cmd_count_by_saved_query,
-    cmd_destroy,
-    cmd_get,
-    cmd_get_by_id,
-    cmd_get_by_saved_query,
-    cmd_get_fields,
-    cmd_get_fields_default,
-    cmd_get_tags,
-    cmds_run_enforcement,
-    grp_saved_query,
-)
+from . import grp_saved_query
 from .grp_common import (
     GET_BY_VALUE_BUILDERS,
     GET_BY_VALUE_FIELD,
@@ -41,23 +29,30 @@ def vulnerabilities():
 
 
 CMDS = [
-    grp_saved_query.saved_query,
-    cmd_count.cmd,
-    cmd_count_by_saved_query.cmd,
-    cmd_get_fields.cmd,
-    cmd_get_fields_default.cmd,
-    cmd_get.cmd,
-    cmd_get_by_saved_query.cmd,
-    cmd_get_tags.cmd,
-    cmd_get_by_id.cmd,
-    cmd_destroy.cmd,
-    *cmds_run_enforcement.CMDS,
+    "cmd_count",
+    "cmd_count_by_saved_query",
+    "cmd_get_fields",
+    "cmd_get_fields_default",
+    "cmd_get",
+    "cmd_get_by_saved_query",
+    "cmd_get_tags",
+    "cmd_get_by_id",
+    "cmd_destroy",
 ]
 
-for cmd in CMDS:
-    users.add_command(cmd)
-    devices.add_command(cmd)
-    vulnerabilities.add_command(cmd)
+CMDS_RUN_ENFORCEMENT = {
+    "run-enforcement-from-json": "from_json",
+    "run-enforcement-from-jsonl": "from_jsonl",
+    "run-enforcement-from-csv": "from_csv",
+    "run-enforcement-from-text": "from_text",
+}
+
+for grp in [devices, users, vulnerabilities]:
+    grp.add_command(grp_saved_query.saved_query)
+    for cmd in CMDS:
+        grp.add_lazy_command(module=f"{__package__}.{cmd}")
+    for name, attr in CMDS_RUN_ENFORCEMENT.items():
+        grp.add_lazy_command(module=f"{__package__}.cmds_run_enforcement", name=name, attr=attr)
 
 
 def add_cmd(grp_obj, method, cmd):
@@ -104,6 +104,26 @@ OPTS_RUNNER = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--batch-size",
+        "-bs",
+        "batch_size",
+        default=None,
+        type=click.INT,
+        help="Split Asset IDs into batches of this many for verifying and running $eset",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--batch-concurrency",
+        "-bc",
+        "concurrency",
+        default=1,
+        type=click.INT,
+        help="Number of batches to verify or run $eset against at once",
+        show_envvar=True,
+        show_default=True,
+    ),
 ]
 
 OPTIONS = [
@@ -112,6 +132,21 @@ OPTIONS = [
     *OPTS_RUNNER,
 ]
 
+OPTS_STREAM = [
+    click.option(
+        "--stream-grab/--no-stream-grab",
+        "-sg/-nsg",
+        "stream_grab",
+        default=False,
+        help=(
+            "Read $path one line at a time and only keep the Asset IDs and items with errors "
+            "(for files with millions of rows)"
+        ),
+        show_envvar=True,
+        show_default=True,
+    ),
+]
+
 EPI_JSON: str = """
 \b
 # Notes:
@@ -207,7 +242,7 @@ def from_json(ctx, url, key, secret, **kwargs):
 @click.command(
     name="run-enforcement-from-jsonl", context_settings=CONTEXT_SETTINGS, epilog=EPI_JSONL
 )
-@add_options(OPTIONS)
+@add_options([*OPTIONS, *OPTS_STREAM])
 @click.pass_context
 def from_jsonl(ctx, url, key, secret, **kwargs):
     """Grab Asset IDs from a JSONL file and run an Enforcement Set against them."""
@@ -221,7 +256,7 @@ def from_jsonl(ctx, url, key, secret, **kwargs):
 
 
 @click.command(name="run-enforcement-from-csv", context_settings=CONTEXT_SETTINGS, epilog=EPI_CSV)
-@add_options(OPTIONS)
+@add_options([*OPTIONS, *OPTS_STREAM])
 @click.pass_context
 def from_csv(ctx, url, key, secret, **kwargs):
     """Grab Asset IDs from a CSV file and run an Enforcement Set against them."""
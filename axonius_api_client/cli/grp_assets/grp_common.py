@@ -479,6 +479,19 @@ GET_EXPORT = [
         is_flag=True,
         hidden=False,
     ),
+    click.option(
+        "--delta-path",
+        "delta_path",
+        default=asset_callbacks.Base.args_map()["delta_path"],
+        help=(
+            "Only export assets added, changed, or removed since the last export that used "
+            "this state file, with the change in a column"
+        ),
+        show_envvar=True,
+        show_default=True,
+        type=click.Path(dir_okay=False, resolve_path=True),
+        hidden=False,
+    ),
     click.option(
         "--software-whitelist-file",
         "whitelist",
@@ -541,6 +554,26 @@ GET_EXPORT = [
         is_flag=True,
         hidden=False,
     ),
+    click.option(
+        "--tag-chunk-size",
+        "tags_chunk_size",
+        default=asset_callbacks.Base.args_map()["tags_chunk_size"],
+        help="Number of assets to add or remove tags from per request (0 = all)",
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--tag-concurrency",
+        "tags_concurrency",
+        default=asset_callbacks.Base.args_map()["tags_concurrency"],
+        help="Number of requests to add or remove tags to send at once",
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
     click.option(
         "--include-details/--no-include-details",
         "-id/-nid",
@@ -667,6 +700,26 @@ GET_BY_VALUES_BUILDERS = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--values-chunk-size",
+        "-vcs",
+        "chunk_size",
+        help="Build one query for every N values and fetch the queries concurrently",
+        type=click.INT,
+        default=None,
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--values-concurrency",
+        "-vcc",
+        "concurrency",
+        help="Number of queries to fetch at once when using --values-chunk-size",
+        type=click.INT,
+        default=1,
+        show_envvar=True,
+        show_default=True,
+    ),
     get_option_help(choices=["auth", "assetexport", "selectfields"]),
 ]
 
@@ -10,4 +10,6 @@ def certs():
     """Group: Work with SSL Certificates for the instance."""
 
 
-load_cmds(path=__file__, package=__package__, group=certs)
+CMD_NAMES: dict = {"cmd_from_path": "from-file"}
+
+load_cmds(path=__file__, package=__package__, group=certs, names=CMD_NAMES)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Command line interface for Axonius API Client."""
+from ...constants.api import EXPORT_CSV_CONCURRENCY
 from ...tools import echo_error, echo_ok
 from ..context import CONTEXT_SETTINGS, click
 from ..options import AUTH, DEFAULT_PATH, add_options
@@ -25,6 +26,16 @@ OPT_PATH = click.option(
     show_envvar=True,
     show_default=True,
 )
+OPT_CONCURRENCY = click.option(
+    "--concurrency",
+    "-c",
+    "concurrency",
+    default=EXPORT_CSV_CONCURRENCY,
+    help="Number of charts to export to CSV at once",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
 
 
 OPTIONS = [
@@ -34,6 +45,7 @@ OPTIONS = [
     OPT_SPACES,
     OPT_CHARTS,
     OPT_PATH,
+    OPT_CONCURRENCY,
 ]
 
 
@@ -46,7 +58,7 @@ def cmd(ctx, url, key, secret, **kwargs):
     apiobj = client.dashboard_spaces
 
     with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
-        results = apiobj.export_charts_to_csv_path(**kwargs)
+        results = apiobj.export_charts_to_csv_path(generator=True, **kwargs)
         for result in results:
             chart, data, path = result
             if "export_chart_csv_error" in data.splitlines()[0]:
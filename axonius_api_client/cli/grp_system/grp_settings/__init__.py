@@ -3,16 +3,6 @@
 import click
 
 from ...context import AliasedGroup
-from . import (
-    cmd_configure_destroy,
-    cmd_get,
-    cmd_get_section,
-    cmd_get_subsection,
-    cmd_update_section,
-    cmd_update_section_from_json,
-    cmd_update_subsection,
-    cmd_update_subsection_from_json,
-)
 
 
 @click.group(cls=AliasedGroup)
@@ -30,19 +20,19 @@ def settings_gui():
     """Group: GUI Settings."""
 
 
-CMDS = [
-    cmd_get,
-    cmd_get_section,
-    cmd_get_subsection,
-    cmd_update_section,
-    cmd_update_subsection,
-    cmd_update_section_from_json,
-    cmd_update_subsection_from_json,
-]
+CMDS = {
+    "cmd_get": "get",
+    "cmd_get_section": "get-section",
+    "cmd_get_subsection": "get-sub-section",
+    "cmd_update_section": "update-section",
+    "cmd_update_subsection": "update-sub-section",
+    "cmd_update_section_from_json": "update-section-from-json",
+    "cmd_update_subsection_from_json": "update-sub-section-from-json",
+}
 
-for cmd in CMDS:
-    settings_global.add_command(cmd.cmd)
-    settings_lifecycle.add_command(cmd.cmd)
-    settings_gui.add_command(cmd.cmd)
+for cmd, name in CMDS.items():
+    settings_global.add_lazy_command(module=f"{__package__}.{cmd}", name=name)
+    settings_lifecycle.add_lazy_command(module=f"{__package__}.{cmd}", name=name)
+    settings_gui.add_lazy_command(module=f"{__package__}.{cmd}", name=name)
 
-settings_global.add_command(cmd_configure_destroy.cmd)
+settings_global.add_lazy_command(module=f"{__package__}.cmd_configure_destroy")
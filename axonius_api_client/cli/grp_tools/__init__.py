@@ -10,4 +10,6 @@ def tools():
     """Group: CLI tools."""
 
 
-load_cmds(path=__file__, package=__package__, group=tools)
+CMD_NAMES: dict = {"cmd_use_token_reset_token": "use-password-reset-token"}
+
+load_cmds(path=__file__, package=__package__, group=tools, names=CMD_NAMES)
@@ -321,6 +321,42 @@ PAGING = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--prefetch-pages",
+        "prefetch_pages",
+        default=0,
+        type=click.INT,
+        help="Fetch up to N pages in the background while the current page is processed",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--shards",
+        "shards",
+        default=0,
+        type=click.INT,
+        help="Split the rows into N offset ranges and fetch them concurrently",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--shards-ordered/--no-shards-ordered",
+        "shards_ordered",
+        default=True,
+        help="Keep the order of rows when --shards is more than 1",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--stream-pages/--no-stream-pages",
+        "stream_pages",
+        default=False,
+        help="Decode each page as it is received instead of loading the whole page in memory",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+    ),
 ]
 
 SPLIT_CONFIG_OPT = click.option(
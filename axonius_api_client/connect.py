@@ -12,12 +12,15 @@ from . import api, logs, tools, version
 from .auth import AuthApiKey, AuthCredentials, AuthModel, AuthNull
 from .constants.ctypes import PathLike
 from .constants.logs import (
+    HTTP_MAX,
+    HTTP_MAX_CLI,
     LOG_FILE_MAX_FILES,
     LOG_FILE_MAX_MB,
     LOG_FILE_NAME,
     LOG_FILE_PATH,
     LOG_FMT_BRIEF,
     LOG_FMT_VERBOSE,
+    LOG_HTTP_MAX,
     LOG_LEVEL_API,
     LOG_LEVEL_AUTH,
     LOG_LEVEL_CONSOLE,
@@ -98,7 +101,7 @@ class Connect:
     LOG: t.Optional[logging.Logger] = None
     """Logger for this class."""
 
-    LOG_HTTP_MAX: bool = False
+    LOG_HTTP_MAX: bool = LOG_HTTP_MAX
     """Shortcut to include_output ALL http logging *warning: very heavy log output*."""
 
     STARTED: bool = False
@@ -142,6 +145,12 @@ class Connect:
     CREDENTIALS: bool = False
     """Flag to indicate if key & secret are actually username & password."""
 
+    JSON_BACKEND: str = "json"
+    """Name of the JSON backend in use."""
+
+    FIELDS_CACHE: bool = False
+    """Flag to indicate if parsed field schemas should be cached on disk between processes."""
+
     API_CACHE: t.Dict[t.Type[api.ModelMixins], api.ModelMixins] = None
     """Cache for API Models."""
 
@@ -188,19 +197,10 @@ class Connect:
     ABOUT_CACHE: t.Optional[dict] = None
     """Cached data from the /about endpoint."""
 
-    HTTP_MAX: str = """log_request_body = True
-log_response_body = True
-log_level_http = "debug"
-log_level_package = "debug"
-log_level_console = "debug"
-log_level_file = "debug"
-log_request_attrs = "all"
-log_response_attrs = "all"
-log_body_lines = 10000
-"""
+    HTTP_MAX: str = HTTP_MAX
     """Override values used when log_http_max is True."""
 
-    HTTP_MAX_CLI: str = ", ".join(HTTP_MAX.splitlines())
+    HTTP_MAX_CLI: str = HTTP_MAX_CLI
     """CLI Help string for log_http_max."""
 
     def __init__(  # noqa: PLR0913
@@ -266,6 +266,13 @@ log_body_lines = 10000
         auth_null: t.Optional[AuthModel] = None,
         max_retries: t.Optional[int] = Http.MAX_RETRIES,
         retry_backoff: t.Optional[int] = Http.RETRY_BACKOFF,
+        retry_statuses: t.Optional[t.Iterable[int]] = Http.RETRY_STATUSES,
+        pool_connections: int = Http.POOL_CONNECTIONS,
+        pool_maxsize: int = Http.POOL_MAXSIZE,
+        pool_block: bool = Http.POOL_BLOCK,
+        keep_alive: bool = Http.KEEP_ALIVE,
+        json_backend: t.Optional[str] = None,
+        fields_cache: bool = False,
         **kwargs: t.Dict[str, t.Any],
     ) -> None:
         """Easy all-in-one connection handler.
@@ -334,8 +341,20 @@ log_body_lines = 10000
             http: http object to use for this connection
             auth: auth model to use for this connection
             auth_null: null auth model to use for this connection
-            max_retries: number of times to retry a failed connection
+            max_retries: number of attempts to make for a request if the connection fails
+                or the response has a status code in retry_statuses
             retry_backoff: number of seconds to wait between retries, will be multiplied against the current retry attempt
+            retry_statuses: status codes of responses to retry
+            pool_connections: number of connection pools to cache in the http session adapter
+            pool_maxsize: maximum number of connections to keep open per connection pool
+            pool_block: wait for a free connection when a pool is full instead of opening
+                a new connection
+            keep_alive: keep connections open between requests
+            json_backend: JSON backend to use for the whole process (auto, orjson, json),
+                if None the backend from OS env AX_JSON_BACKEND is used, see
+                :func:`axonius_api_client.tools.set_json_backend`
+            fields_cache: cache parsed field schemas on disk under DEFAULT_PATH, keyed by URL,
+                asset type, and the version and build date of the instance
             **kwargs: unused
         """
         self._url: str = url
@@ -348,6 +367,12 @@ log_body_lines = 10000
         self.LOG: logging.Logger = logs.get_obj_log(obj=self, log_level=log_level)
         self.LOG_HTTP_MAX: bool = tools.coerce_bool(log_http_max)
         self.CREDENTIALS: bool = tools.coerce_bool(credentials)
+        self.FIELDS_CACHE: bool = tools.coerce_bool(fields_cache)
+        self.JSON_BACKEND: str = (
+            tools.get_json_backend()
+            if json_backend is None
+            else tools.set_json_backend(backend=json_backend)
+        )
 
         if self.LOG_HTTP_MAX:
             log_request_body = True
@@ -414,6 +439,11 @@ log_body_lines = 10000
             "cf_echo_verbose": cf_echo_verbose,
             "max_retries": max_retries,
             "retry_backoff": retry_backoff,
+            "retry_statuses": retry_statuses,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
         }
 
         self.set_wraperror(wraperror)
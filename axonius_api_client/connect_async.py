@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""asyncio interface for the all-in-one connection handler.
+
+Notes:
+    This is a thread pool wrapper around the blocking :obj:`Connect`, not non-blocking I/O.
+    Each call runs the same requests based code in a worker thread so the event loop is not
+    blocked, and the number of requests in flight is limited by the number of worker threads.
+    Every :obj:`AsyncConnect` shares one thread pool unless it is given its own.
+"""
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import types
+import typing as t
+
+from .api.api_endpoint import ApiEndpoint
+from .api.json_api.base import BaseModel
+from .connect import Connect
+from .constants.api import ASYNC_WORKERS
+from .tools import coerce_int
+
+_DONE: object = object()
+
+SHARED_EXECUTOR: t.Dict[str, t.Optional[concurrent.futures.ThreadPoolExecutor]] = {
+    "executor": None
+}
+"""Thread pool shared by every AsyncConnect, managed by :func:`get_shared_executor`."""
+
+SHARED_EXECUTOR_LOCK: threading.Lock = threading.Lock()
+"""Lock used to create the shared thread pool only once."""
+
+
+def get_shared_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the thread pool of ASYNC_WORKERS threads shared by every AsyncConnect."""
+    with SHARED_EXECUTOR_LOCK:
+        if SHARED_EXECUTOR["executor"] is None:
+            SHARED_EXECUTOR["executor"] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=ASYNC_WORKERS, thread_name_prefix="axonapi_async"
+            )
+        return SHARED_EXECUTOR["executor"]
+
+
+def _next(iterator: t.Iterator) -> t.Any:
+    """Get the next item from an iterator, returning a sentinel instead of raising."""
+    return next(iterator, _DONE)
+
+
+class AsyncIterator:
+    """Async iterator over a generator returned by a method of :obj:`Connect`.
+
+    Notes:
+        Each item is pulled from the generator in the executor of the :obj:`AsyncConnect`
+        that created this object, so the event loop is never blocked by the HTTP requests the
+        generator makes.
+    """
+
+    def __init__(self, client: "AsyncConnect", iterator: t.Iterator):
+        """Pass."""
+        self.client: "AsyncConnect" = client
+        self.iterator: t.Iterator = iterator
+
+    def __aiter__(self) -> "AsyncIterator":
+        """Pass."""
+        return self
+
+    async def __anext__(self) -> t.Any:
+        """Pass."""
+        value = await self.client.run(_next, self.iterator)
+        if value is _DONE:
+            raise StopAsyncIteration
+        return value
+
+    async def aclose(self):
+        """Close the underlying generator."""
+        close: t.Optional[callable] = getattr(self.iterator, "close", None)
+        if callable(close):
+            await self.client.run(close)
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(iterator={self.iterator!r})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class AsyncProxy:
+    """Awaitable reference to an attribute of :obj:`Connect`.
+
+    Examples:
+        >>> client = AsyncConnect(**axonapi.get_env_connect())
+        >>> count: int = await client.devices.count(query='(labels == "x")')
+        >>> async for row in await client.devices.get(generator=True):
+        ...     print(row)
+        >>> apiobj: axonapi.Devices = await client.devices
+
+    Notes:
+        Attribute access only builds a path, nothing is resolved until the proxy is called or
+        awaited. Calling the proxy resolves the path against :attr:`AsyncConnect.client` and
+        calls it in the executor, awaiting the proxy resolves the path in the executor and
+        returns the value as is.
+    """
+
+    def __init__(self, client: "AsyncConnect", path: t.Tuple[str, ...]):
+        """Pass."""
+        self._client: "AsyncConnect" = client
+        self._path: t.Tuple[str, ...] = path
+
+    def __getattr__(self, name: str) -> "AsyncProxy":
+        """Get a proxy for an attribute of this proxy."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return AsyncProxy(client=self._client, path=(*self._path, name))
+
+    def _resolve(self) -> t.Any:
+        """Resolve the path of this proxy against the client (blocking)."""
+        value: t.Any = self._client.client
+        for name in self._path:
+            value = getattr(value, name)
+        return value
+
+    def _call(self, *args, **kwargs) -> t.Any:
+        """Resolve the path of this proxy and call it (blocking)."""
+        return self._resolve()(*args, **kwargs)
+
+    async def __call__(self, *args, **kwargs) -> t.Any:
+        """Call the attribute in the executor.
+
+        Returns:
+            the value returned from the call, or :obj:`AsyncIterator` if the call
+            returned a generator
+        """
+        value: t.Any = await self._client.run(self._call, *args, **kwargs)
+        if isinstance(value, types.GeneratorType):
+            value = AsyncIterator(client=self._client, iterator=value)
+        return value
+
+    def __await__(self) -> t.Generator[t.Any, None, t.Any]:
+        """Resolve the attribute in the executor."""
+        return self._client.run(self._resolve).__await__()
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(path={'.'.join(self._path)!r})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+
+class AsyncConnect:
+    """asyncio interface for :obj:`Connect`.
+
+    Examples:
+        >>> import asyncio
+        >>> import axonius_api_client as axonapi
+        >>>
+        >>> async def main():
+        ...     async with axonapi.AsyncConnect(**axonapi.get_env_connect()) as client:
+        ...         counts = await asyncio.gather(
+        ...             client.devices.count(), client.users.count()
+        ...         )
+        ...         async for row in await client.devices.get(generator=True):
+        ...             print(row)
+        >>>
+        >>> asyncio.run(main())
+
+    Notes:
+        Every attribute in :attr:`Connect.API_ATTRS` is available as an :obj:`AsyncProxy`, so
+        this object always offers the same API models, methods, request models, and response
+        models as :obj:`Connect`.
+
+        This does not use non-blocking I/O. Requests are sent by the blocking
+        :obj:`axonius_api_client.http.Http` object of :attr:`client` in :attr:`executor`, so
+        they never run on the event loop. By default :attr:`executor` is a thread pool of
+        ASYNC_WORKERS threads shared by every AsyncConnect, so polling many instances does not
+        add threads per instance. Set ``pool_maxsize`` for :obj:`Connect` to at least
+        :attr:`max_workers` so concurrent requests reuse open connections.
+    """
+
+    API_ATTRS: t.List[str] = Connect.API_ATTRS
+    """Attributes that are API Models."""
+
+    def __init__(
+        self,
+        *args,
+        client: t.Optional[Connect] = None,
+        executor: t.Optional[concurrent.futures.ThreadPoolExecutor] = None,
+        max_workers: t.Optional[int] = None,
+        **kwargs,
+    ):
+        """asyncio interface for :obj:`Connect`.
+
+        Args:
+            *args: passed to :obj:`Connect` if client not supplied
+            client: client to use instead of creating one
+            executor: thread pool to run requests in, if None and max_workers is None use the
+                thread pool from :func:`get_shared_executor`
+            max_workers: create a thread pool with this many threads for this object only
+            **kwargs: passed to :obj:`Connect` if client not supplied
+        """
+        self.client_owned: bool = not isinstance(client, Connect)
+        self.client: Connect = Connect(*args, **kwargs) if self.client_owned else client
+        self.executor_owned: bool = executor is None and max_workers is not None
+        if self.executor_owned:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, coerce_int(max_workers)), thread_name_prefix="axonapi_async"
+            )
+        self.executor: concurrent.futures.ThreadPoolExecutor = executor or get_shared_executor()
+        self.max_workers: t.Optional[int] = getattr(self.executor, "_max_workers", None)
+        self.start_lock: t.Optional[asyncio.Lock] = None
+
+    async def run(self, func: callable, *args, **kwargs) -> t.Any:
+        """Run a blocking callable in :attr:`executor`.
+
+        Args:
+            func: callable to run
+            *args: passed to func
+            **kwargs: passed to func
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def start(self) -> None:
+        """Connect to and authenticate with Axonius.
+
+        Notes:
+            Concurrent calls wait on :attr:`start_lock` so the client is only started once.
+        """
+        if self.client.STARTED:
+            return
+
+        if self.start_lock is None:
+            self.start_lock = asyncio.Lock()
+
+        async with self.start_lock:
+            if not self.client.STARTED:
+                await self.run(self.client.start)
+
+    async def close(self) -> None:
+        """Shut down an executor and close the session of a client created here."""
+        if self.executor_owned:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, functools.partial(self.executor.shutdown, wait=True))
+        if self.client_owned:
+            self.client.HTTP.session.close()
+
+    async def perform_request(
+        self, endpoint: ApiEndpoint, request_obj: t.Optional[BaseModel] = None, **kwargs
+    ) -> t.Any:
+        """Perform a request to an endpoint using the http object of :attr:`client`.
+
+        Args:
+            endpoint: endpoint from :obj:`axonius_api_client.api.api_endpoints.ApiEndpoints`
+            request_obj: request model to send
+            **kwargs: passed to :meth:`ApiEndpoint.perform_request_async`
+        """
+        await self.start()
+        return await endpoint.perform_request_async(
+            http=self.client.HTTP, request_obj=request_obj, executor=self.executor, **kwargs
+        )
+
+    async def __aenter__(self) -> "AsyncConnect":
+        """Start the client."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Close the client."""
+        await self.close()
+
+    def __getattr__(self, name: str) -> AsyncProxy:
+        """Get a proxy for an API model of :attr:`client`."""
+        if name in self.API_ATTRS:
+            return AsyncProxy(client=self, path=(name,))
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def __dir__(self) -> t.List[str]:
+        """Pass."""
+        return sorted({*super().__dir__(), *self.API_ATTRS})
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(client={self.client.str_state!r})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Constants."""
+import importlib
+import typing as t
+
 from ..setup_env import load_dotenv
-from . import adapters, api, asset_helpers, ctypes, fields, general, logs, tables, wizards
 
 __all__ = (
     "adapters",
@@ -15,3 +17,23 @@ __all__ = (
     "ctypes",
     "asset_helpers",
 )
+
+
+LAZY_MODULES: t.Tuple[str, ...] = (*[x for x in __all__ if x != "load_dotenv"], "enforcements")
+"""Modules of this package that are imported the first time they are used."""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the modules of this package the first time they are used (PEP 562)."""
+    if name not in LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", package=__name__)
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the ones not yet imported.
+
+    Notes:
+        The names only used to do the lazy imports are left out.
+    """
+    return sorted({*globals(), *LAZY_MODULES} - {"LAZY_MODULES", "importlib", "t"})
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Constants for API models."""
-from typing import List
+from typing import List, Tuple
 
 from .general import ECHO
 
@@ -38,6 +38,52 @@ PAGE_SLEEP: int = 0
 GUI_PAGE_SIZES: List[int] = [20, 50, 100]
 """valid page sizes for GUI page sizes for saved queries"""
 
+PAGE_HISTORY_SIZE: int = 1
+"""Number of pages (and their rows) a paging state keeps in its page history."""
+
+PAGE_METRICS_SIZE: int = 100
+"""Number of pages a paging state uses to calculate its rolling metrics."""
+
+ASYNC_WORKERS: int = 10
+"""Number of threads in the thread pool shared by every AsyncConnect to run requests."""
+
+GET_FULL_CONCURRENCY: int = 5
+"""Default number of threads used to fetch the full model of objects from their basic model."""
+
+EXPORT_CSV_CONCURRENCY: int = 5
+"""Default number of threads used to export dashboard charts to CSV."""
+
+GET_BY_IDS_CONCURRENCY: int = 5
+"""Default number of threads used to get the full data of assets by internal_axon_id."""
+
+GET_BY_IDS_CHUNK_SIZE: int = 1000
+"""Default number of internal_axon_ids to put in each query when getting basic asset data."""
+
+POOL_CONNECTIONS: int = 10
+"""Number of connection pools to cache in the http session adapter."""
+
+POOL_MAXSIZE: int = 10
+"""Maximum number of connections to keep open per connection pool."""
+
+POOL_BLOCK: bool = False
+"""Block when no free connections are available in a pool instead of opening a new one."""
+
+RETRY_STATUSES: Tuple[int, ...] = (429, 502, 503, 504)
+"""HTTP status codes that will be retried by the http session adapter."""
+
+STREAM_CHUNK_SIZE: int = 1024 * 64
+"""Bytes to read at a time from responses that are decoded incrementally."""
+
+JSON_BACKENDS: List[str] = ["auto", "orjson", "json"]
+"""Valid JSON backends, auto will use orjson if it is installed and json if not.
+
+auto only encodes with orjson when the output matches json, orjson also encodes flat JSON
+(i.e. JSONL exports) with orjson, which has no spaces after separators and writes NaN and
+Infinity as null."""
+
+JSON_BACKEND: str = "auto"
+"""Default JSON backend used to serialize and deserialize JSON."""
+
 TIMEOUT_CONNECT: int = 5
 """seconds to wait for connection to API."""
 
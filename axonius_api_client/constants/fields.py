@@ -16,6 +16,12 @@ AGG_ADAPTER_NAME: str = "agg"
 AGG_ADAPTER_TITLE: str = "Aggregated"
 """Title to use for aggregated adapter"""
 
+FIELDS_CACHE_DIR: str = ".axonapi_cache"
+"""Directory under DEFAULT_PATH to store the persistent cache of parsed field schemas in"""
+
+FIELDS_CACHE_TTL: int = 60 * 60 * 24
+"""Seconds a persistent cache of parsed field schemas is valid for"""
+
 
 class AXID:
     """Pass."""
@@ -215,6 +221,24 @@ SCHEMAS_CUSTOM: t.Dict[str, dict] = {
             "is_custom": True,
         },
     },
+    "delta_path": {
+        "delta_change": {
+            "adapter_name": "report",
+            "column_name": "report:delta_change",
+            "column_title": "Report: Delta Change",
+            "is_complex": False,
+            "is_list": False,
+            "is_root": True,
+            "parent": "root",
+            "name": "delta_change",
+            "name_base": "delta_change",
+            "name_qual": "delta_change",
+            "title": "Delta Change",
+            "type": "string",
+            "type_norm": "string",
+            "is_custom": True,
+        },
+    },
 }
 """custom schemas for reports in asset callbacks"""
 
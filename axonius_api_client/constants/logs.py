@@ -133,3 +133,21 @@ RESPONSE_ATTRS_DEFAULT: t.Tuple[str, ...] = ("url", "status", "reason", "elapsed
 
 REQUEST_ATTRS_DEFAULT: t.Tuple[str, ...] = ("url", "size")
 """Default request attributes to log."""
+
+LOG_HTTP_MAX: bool = False
+"""Shortcut to include_output ALL http logging *warning: very heavy log output*."""
+
+HTTP_MAX: str = """log_request_body = True
+log_response_body = True
+log_level_http = "debug"
+log_level_package = "debug"
+log_level_console = "debug"
+log_level_file = "debug"
+log_request_attrs = "all"
+log_response_attrs = "all"
+log_body_lines = 10000
+"""
+"""Override values used when log_http_max is True."""
+
+HTTP_MAX_CLI: str = ", ".join(HTTP_MAX.splitlines())
+"""CLI Help string for log_http_max."""
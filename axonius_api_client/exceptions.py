@@ -336,6 +336,16 @@ class StopFetch(ApiError):
         super().__init__(reason)
 
 
+class ChunkError(ApiError):
+    """Pass."""
+
+    def __init__(self, msg: t.Union[str, t.List[t.Any]], errors: t.List[dict], value: t.Any = None):
+        """Pass."""
+        self.errors: t.List[dict] = errors
+        self.value: t.Any = value
+        super().__init__(msg)
+
+
 class SchemaError(ApiError):
     """Pass."""
 
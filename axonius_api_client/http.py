@@ -1,19 +1,29 @@
 """HTTP client."""
+import itertools
 import logging
 import pathlib
+import threading
 import typing as t
 import warnings
-import time
 
 import OpenSSL  # noqa: TCH002
 import requests
+import requests.adapters
 import requests.cookies
 import requests.structures
 import urllib3
 import urllib3.exceptions
+import urllib3.util.retry
 
 from . import version
-from .constants.api import TIMEOUT_CONNECT, TIMEOUT_RESPONSE
+from .constants.api import (
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RETRY_STATUSES,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+)
 from .constants.ctypes import PathLike, PatternLikeListy
 from .constants.logs import (
     LOG_LEVEL_HTTP,
@@ -31,6 +41,7 @@ from .projects.url_parser import UrlParser
 from .setup_env import get_env_user_agent
 from .tools import (
     coerce_bool,
+    coerce_int,
     coerce_int_float,
     coerce_str,
     join_url,
@@ -69,6 +80,50 @@ def is_cookies(value: t.Any) -> bool:
     return isinstance(value, (dict, requests.cookies.RequestsCookieJar))
 
 
+class HttpRetry(urllib3.util.retry.Retry):
+    """Retry policy for :obj:`Http` that backs off linearly.
+
+    Notes:
+        The sleep between attempts is backoff_factor multiplied by the number of consecutive
+        errors, so a backoff_factor of 5 sleeps 5 seconds, then 10 seconds, and so on. If a
+        response has a Retry-After header, that is used instead.
+
+        Responses for methods that are not in allowed_methods are only retried if they have
+        a Retry-After header and a status code in :attr:`RETRY_AFTER_METHODS_STATUSES`, since
+        the server did not act on the request.
+    """
+
+    RETRY_AFTER_METHODS_STATUSES: t.FrozenSet[int] = frozenset([429, 503])
+    """Status codes that are retried for any method if the response has a Retry-After header."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        """Check if a response should be retried."""
+        if super().is_retry(
+            method=method, status_code=status_code, has_retry_after=has_retry_after
+        ):
+            return True
+
+        return bool(
+            self.total
+            and self.respect_retry_after_header
+            and has_retry_after
+            and status_code in self.RETRY_AFTER_METHODS_STATUSES
+            and status_code in (self.status_forcelist or [])
+        )
+
+    def get_backoff_time(self) -> float:
+        """Get the number of seconds to sleep before the next attempt."""
+        consecutive_errors: int = len(
+            list(
+                itertools.takewhile(
+                    lambda x: x.redirect_location is None, reversed(self.history)
+                )
+            )
+        )
+        backoff_max: float = getattr(self, "backoff_max", None) or self.DEFAULT_BACKOFF_MAX
+        return min(backoff_max, self.backoff_factor * consecutive_errors)
+
+
 class Http:
     """HTTP client that wraps around :obj:`requests.Session`."""
 
@@ -87,6 +142,9 @@ class Http:
     LAST_RESPONSE: t.Optional[requests.Response] = None
     """Last response received."""
 
+    THREAD_RESPONSES: t.Optional[threading.local] = None
+    """Last response received by each thread."""
+
     SAVE_HISTORY: bool = False
     """Save history of requests."""
 
@@ -173,11 +231,31 @@ class Http:
     # TBD: Connect needs an interface for proper type hinting without circular reference
 
     MAX_RETRIES: t.Optional[int] = 3
-    """Number of times to retry a request if it fails."""
+    """Number of attempts to make for a request if the connection fails or the response
+    has a status code in :attr:`RETRY_STATUSES`."""
 
     RETRY_BACKOFF: t.Optional[int] = 5
     """Number of seconds to wait between retries, will be multiplied against the current retry attempt."""
 
+    RETRY_STATUSES: t.Tuple[int, ...] = RETRY_STATUSES
+    """Status codes of responses that will be retried, Retry-After headers are respected."""
+
+    RETRY_METHODS: t.Optional[t.FrozenSet[str]] = HttpRetry.DEFAULT_ALLOWED_METHODS
+    """Idempotent HTTP methods that will be retried, see :obj:`HttpRetry` for other methods."""
+
+    POOL_CONNECTIONS: int = POOL_CONNECTIONS
+    """Number of connection pools to cache in the session adapter."""
+
+    POOL_MAXSIZE: int = POOL_MAXSIZE
+    """Maximum number of connections to keep open per connection pool, set this to at
+    least the number of threads that share this object."""
+
+    POOL_BLOCK: bool = POOL_BLOCK
+    """Wait for a free connection when a pool is full instead of opening a new connection."""
+
+    KEEP_ALIVE: bool = True
+    """Keep connections open between requests, if False send Connection: close."""
+
     def __init__(  # noqa: PLR0913
         self,
         url: t.Union[UrlParser, str],
@@ -220,6 +298,11 @@ class Http:
         cf_timeout_login: t.Optional[int] = cf_constants.TIMEOUT_LOGIN,
         max_retries: t.Optional[int] = MAX_RETRIES,
         retry_backoff: t.Optional[int] = RETRY_BACKOFF,
+        retry_statuses: t.Optional[t.Iterable[int]] = RETRY_STATUSES,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+        keep_alive: bool = KEEP_ALIVE,
         **kwargs,
     ) -> None:
         """HTTP client that wraps around :obj:`requests.Session`.
@@ -272,8 +355,15 @@ class Http:
             cf_error_login: raise exc if `access login` command fails
             cf_echo: echo commands and results to stdout
             cf_echo_verbose: echo checks to stdout
-            max_retries: number of times to retry a failed connection
+            max_retries: number of attempts to make for a request if the connection fails
+                or the response has a status code in retry_statuses
             retry_backoff: number of seconds to wait between retries, will be multiplied against the current retry attempt
+            retry_statuses: status codes of responses to retry
+            pool_connections: number of connection pools to cache in the session adapter
+            pool_maxsize: maximum number of connections to keep open per connection pool
+            pool_block: wait for a free connection when a pool is full instead of opening
+                a new connection
+            keep_alive: keep connections open between requests
             **kwargs: no longer used, will throw a deprecation warning
 
         Raises:
@@ -291,6 +381,7 @@ class Http:
         self.HISTORY: t.List[requests.Response] = []
         self.LAST_REQUEST: t.Optional[requests.PreparedRequest] = None
         self.LAST_RESPONSE: t.Optional[requests.Response] = None
+        self.THREAD_RESPONSES: threading.local = threading.local()
 
         self.LOG_BODY_LINES: t.Optional[int] = coerce_int_float(
             log_body_lines,
@@ -360,6 +451,11 @@ class Http:
             retry_backoff,
             error=False,
         )
+        self.RETRY_STATUSES: t.Tuple[int, ...] = tuple(listify(retry_statuses))
+        self.POOL_CONNECTIONS: int = coerce_int(pool_connections, min_value=1)
+        self.POOL_MAXSIZE: int = coerce_int(pool_maxsize, min_value=1)
+        self.POOL_BLOCK: bool = coerce_bool(pool_block)
+        self.KEEP_ALIVE: bool = coerce_bool(keep_alive)
 
         self.set_urllib_warnings()
         self.set_urllib_log()
@@ -459,6 +555,10 @@ class Http:
                 raise
         return None  # pragma: no cover
 
+    def get_thread_response(self) -> t.Optional[requests.Response]:
+        """Get the last response received by the calling thread."""
+        return getattr(self.THREAD_RESPONSES, "response", None)
+
     def get_cert(self, error: bool = False) -> t.Optional[cert_human.Cert]:
         """Get the SSL certificate from url."""
         if not isinstance(self.URL_CERT, cert_human.Cert):
@@ -502,15 +602,46 @@ class Http:
     def new_session(self):
         """Create a new session object."""
         self.session: requests.Session = requests.Session()
+        self.set_session_adapter()
         self.set_session_headers()
         self.set_session_cookies()
         self.set_session_proxies()
         self.set_session_verify()
         self.set_session_cert()
 
+    def get_retry(self) -> HttpRetry:
+        """Get the retry policy to use for the session adapter."""
+        return HttpRetry(
+            total=max(1, self.MAX_RETRIES or 1) - 1,
+            backoff_factor=self.RETRY_BACKOFF or 0,
+            status_forcelist=self.RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            raise_on_redirect=False,
+            allowed_methods=self.RETRY_METHODS,
+        )
+
+    def set_session_adapter(self):
+        """Mount an adapter on :attr:`session` with the pool and retry settings."""
+        adapter: requests.adapters.HTTPAdapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=self.POOL_BLOCK,
+            max_retries=self.get_retry(),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.LOG.debug(
+            f"Mounted session adapter with pool_connections={self.POOL_CONNECTIONS}, "
+            f"pool_maxsize={self.POOL_MAXSIZE}, pool_block={self.POOL_BLOCK}, "
+            f"retry={adapter.max_retries!r}"
+        )
+
     def set_session_headers(self):
         """Configure :attr:`session` headers with :attr:`HTTP_HEADERS`."""
         self.session.headers.update(self.HTTP_HEADERS)
+        if not self.KEEP_ALIVE:
+            self.session.headers["Connection"] = "close"
 
     def set_session_cookies(self):
         """Configure :attr:`session` cookies with :attr:`HTTP_COOKIES`."""
@@ -672,33 +803,21 @@ class Http:
         )
         log_if_headers(f"Request arguments after environment merge: {send_args}")
 
-        if self.MAX_RETRIES < 1:
-            self.MAX_RETRIES = 1
-
-        response = None
-        for attempt in range(self.MAX_RETRIES):
-            attempt_count = attempt + 1
-            attempt_backoff = attempt_count * self.RETRY_BACKOFF
-            try:
-                self.LOG.debug(f"Attempt {attempt_count} of {self.MAX_RETRIES}.")
-                response = self.session.send(
-                    request=prepped_request,
-                    timeout=timeout,
-                    **send_args,
-                )
-                break
-            except Exception as exc:
-                self.LOG.error(f"Connect Error: {exc}")
-                if attempt == self.MAX_RETRIES - 1:
-                    self.LOG.error(f"Max attempts ({self.MAX_RETRIES}) reached.")
-                    raise exc
-                self.LOG.warning(f"Retrying after {attempt_backoff} seconds...")
-                time.sleep(attempt_backoff)
-                continue
+        try:
+            response = self.session.send(
+                request=prepped_request,
+                timeout=timeout,
+                **send_args,
+            )
+        except Exception as exc:
+            self.LOG.error(f"Connect Error after {self.MAX_RETRIES} attempts: {exc}")
+            raise
 
         if self.SAVE_LAST:
             self.LAST_RESPONSE = response
 
+        self.THREAD_RESPONSES.response = response
+
         if self.SAVE_HISTORY:
             self.HISTORY.append(response)
 
@@ -777,9 +896,15 @@ class Http:
             response (:obj:`requests.Response`): response to log attrs/body of
         """
         if self.log_response_attrs:
+            # do not read the body of a response sent with stream=True just to log its size
+            if getattr(response, "_content", None) is False:
+                body_size = response.headers.get("Content-Length", "unread")
+            else:
+                body_size = len(response.text or "")
+
             lattrs = ", ".join(self.log_response_attrs).format(
                 url=response.url,
-                body_size=len(response.text or ""),
+                body_size=body_size,
                 method=response.request.method,
                 status_code=response.status_code,
                 reason=response.reason,
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Utilities and tools."""
+import codecs
+import csv
 import dataclasses
 import logging
 import pathlib
@@ -14,10 +16,13 @@ from ..exceptions import GrabberError, GrabberWarning
 from ..logs import get_echoer, get_obj_log
 from ..tools import (
     add_source,
+    calc_percent,
     csv_able,
     csv_load,
+    human_size,
     json_load,
     jsonl_load,
+    jsonl_loader,
     listify,
     text_load,
     tlens,
@@ -25,6 +30,57 @@ from ..tools import (
 )
 
 
+class PathReader:
+    """Read the lines of a file lazily and track the number of bytes read."""
+
+    def __init__(self, path: pathlib.Path, encoding: str = "utf-8-sig"):
+        """Read the lines of a file lazily.
+
+        Args:
+            path: path to file to read
+            encoding: encoding to decode each line with
+        """
+        self.path: pathlib.Path = path
+        self.encoding: str = encoding
+        self.size: int = path.stat().st_size
+        self.bytes_read: int = 0
+
+    def __iter__(self) -> t.Generator[str, None, None]:
+        """Yield each line of the file as it is read."""
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        with self.path.open("rb") as fh:
+            for line in fh:
+                self.bytes_read += len(line)
+                yield decoder.decode(line)
+
+    @property
+    def progress(self) -> str:
+        """Get the number of bytes read out of the size of the file."""
+        percent = calc_percent(part=self.bytes_read, whole=self.size)
+        return f"read {human_size(self.bytes_read)} of {human_size(self.size)} ({percent}%)"
+
+    def __str__(self) -> str:
+        """Dunder."""
+        return f"{self.__class__.__name__}(path={str(self.path)!r}, {self.progress})"
+
+    def __repr__(self) -> str:
+        """Dunder."""
+        return self.__str__()
+
+
+def jsonl_stream(reader: PathReader) -> t.Generator[t.Any, None, None]:
+    """Load each line of a JSONL file lazily, skipping empty lines and comments."""
+    for idx, item in enumerate(reader):
+        if item.strip() and not item.startswith("#"):
+            yield jsonl_loader(item=item, idx=idx)
+
+
+def csv_stream(reader: PathReader, **kwargs) -> t.Generator[dict, None, None]:
+    """Load each row of a CSV file lazily."""
+    kwargs.setdefault("restkey", "extra_columns")
+    yield from csv.DictReader(reader, **kwargs)
+
+
 class Mixins:
     """Pass."""
 
@@ -165,6 +221,8 @@ class Hunter(BaseData, Mixins):
     @property
     def _tin_item(self) -> str:
         """Pass."""
+        if self.count_supplied is None:
+            return f"In item {self.num}"
         return f"In item {self.num}/{self.count_supplied}"
 
     @property
@@ -201,12 +259,17 @@ class Grabber(BaseData, Mixins):
     do_echo: bool = True
     do_raise: bool = False
     source: t.Any = None
+    stream: bool = False
+    reader: t.Optional[PathReader] = None
 
     log: t.ClassVar[logging.Logger] = None
     axids: t.ClassVar[t.Set[str]] = None
     hunters: t.ClassVar[t.List[Hunter]] = None
+    count_items: t.ClassVar[int] = 0
+    count_errors: t.ClassVar[int] = 0
     keys_base: t.ClassVar[t.List[str]] = AXID.keys
     progress: t.ClassVar[int] = 10000
+    errors_max: t.ClassVar[int] = 1000
     _initialized: t.ClassVar[bool] = False
     _titems_empty: t.ClassVar[str] = "No items supplied"
     _tnone_found: t.ClassVar[str] = "No Asset IDs found"
@@ -266,20 +329,45 @@ class Grabber(BaseData, Mixins):
         return cls.from_json(**kwargs)
 
     @classmethod
-    def from_jsonl_path(cls, path: PathLike, **kwargs) -> "Grabber":
-        """Get Asset IDs from a JSONL file with one dict per line."""
+    def from_jsonl_path(cls, path: PathLike, stream: bool = False, **kwargs) -> "Grabber":
+        """Get Asset IDs from a JSONL file with one dict per line.
+
+        Notes:
+            If stream is True, the file is read one line at a time and only the Asset IDs,
+            the counters, and the first :attr:`errors_max` items with errors are kept.
+        """
         path = pathify(path=path, as_file=True)
-        kwargs["items"] = path
         kwargs["source"] = add_source(source=f"from_jsonl_path {path}", kwargs=kwargs)
+        if stream:
+            kwargs["reader"] = reader = PathReader(path=path)
+            return cls(items=jsonl_stream(reader=reader), stream=True, **kwargs)
+        kwargs["items"] = path
         return cls.from_jsonl(**kwargs)
 
     @classmethod
-    def from_csv_path(cls, path: PathLike, **kwargs) -> "Grabber":
-        """Get Asset IDs from a CSV file."""
+    def from_csv_path(
+        cls,
+        path: PathLike,
+        stream: bool = False,
+        load_args: t.Optional[dict] = None,
+        **kwargs,
+    ) -> "Grabber":
+        """Get Asset IDs from a CSV file.
+
+        Notes:
+            If stream is True, the file is read one row at a time and only the Asset IDs,
+            the counters, and the first :attr:`errors_max` items with errors are kept.
+        """
         path = pathify(path=path, as_file=True)
-        kwargs["items"] = path
         kwargs["source"] = add_source(source=f"from_csv_path {path}", kwargs=kwargs)
-        return cls.from_csv(**kwargs)
+        if stream:
+            load_args = load_args if isinstance(load_args, dict) else {}
+            kwargs["reader"] = reader = PathReader(
+                path=path, encoding=load_args.pop("encoding", "utf-8-sig")
+            )
+            return cls(items=csv_stream(reader=reader, **load_args), stream=True, **kwargs)
+        kwargs["items"] = path
+        return cls.from_csv(load_args=load_args, **kwargs)
 
     @classmethod
     def from_text_path(cls, path: PathLike, **kwargs):
@@ -297,6 +385,9 @@ class Grabber(BaseData, Mixins):
                 self.keys.insert(0, self.keys.pop(key_idx))
 
     def _load_items(self):
+        if self.stream:
+            self.spew(msgs=[f"Streaming items from source: {self.source}"], top=True)
+            return
         self.items = listify(self.items)
         cnt = self.count_supplied
         if cnt is None:
@@ -316,21 +407,31 @@ class Grabber(BaseData, Mixins):
     def _load_hunters(self):
         self.hunters = []
         self.axids = set()
+        self.count_items = 0
+        self.count_errors = 0
+        count_supplied = None if self.stream else self.count_supplied
         for idx, x in enumerate(self.items):
             hunter = Hunter(
                 value=x,
                 idx=idx,
                 keys=self.keys,
                 do_echo=self.do_echo,
-                count_supplied=self.count_supplied,
+                count_supplied=count_supplied,
             )
-            self.hunters.append(hunter)
+            self.count_items += 1
+            if hunter.had_error:
+                self.count_errors += 1
+            if not self.stream or (hunter.had_error and len(self.hunters) < self.errors_max):
+                self.hunters.append(hunter)
             if isinstance(self.progress, int) and idx % self.progress == 0:
-                self.spew(f"Hunting progress: {self._tfound} - still loading", level="debug")
+                self.spew(f"Hunting progress: {self._tprogress} - still loading", level="debug")
                 self.reorder_keys(hunter.found_key)
             if hunter.axid:
                 self.axids.add(hunter.axid)
 
+        if self.stream and not self.count_items:
+            self.spew(msgs=[self._titems_empty], top=True, exc=True)
+
         sargs = {"top": True}
         if self.count_supplied != self.count_found:
             sargs["warn"] = True
@@ -370,6 +471,9 @@ class Grabber(BaseData, Mixins):
         if error_strs:
             msg = f"{self._tfound} with {len(error_strs)} {self._terrors_mid}:\n{self.keys}"
             msgs += [msg, "", *error_strs, "", msg]
+            kept = len(self.hunters) if self.stream else self.count_errors
+            if kept < self.count_errors:
+                msgs += [f"Only the first {kept} of {self.count_errors} items with errors shown"]
         return msgs
 
     @property
@@ -401,11 +505,19 @@ class Grabber(BaseData, Mixins):
     def _tfound(self) -> str:
         return f"Found {self.count_found} asset IDs from {self.count_supplied} items"
 
+    @property
+    def _tprogress(self) -> str:
+        if self.reader is not None:
+            return f"{self._tfound}, {self.reader.progress}"
+        return self._tfound
+
     @property
     def count_supplied(self) -> t.Optional[int]:
         """Pass."""
         if isinstance(self.items, list):
             return len(self.items)
+        if self.stream:
+            return self.count_items
         if isinstance(self.hunters, list):
             return len(self.hunters)
         return None
@@ -426,6 +538,8 @@ class Grabber(BaseData, Mixins):
             f"do_raise={self.do_raise}",
             f"source={self.source!r}",
         ]
+        if self.stream:
+            items += [f"stream={self.stream}", f"count_errors={self.count_errors}"]
         return items
 
     def __repr__(self) -> str:
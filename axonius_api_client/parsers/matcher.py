@@ -1,23 +1,127 @@
 # -*- coding: utf-8 -*-
 """Parsers for API models."""
 
+import collections
+import re
 import typing as t
 
-import cachetools
-
 from ..constants.api import RE_PREFIX
 from ..constants.ctypes import PatternLike, PatternLikeListy
 from ..constants.general import HIDDEN, SPLITTER
 from ..tools import bytes_to_str, coerce_str_re, is_pattern, is_str, listify
 
-CACHE_SIZE: int = 1024
+SUBSTRINGS_MIN: int = 100
+"""Minimum number of strings to use :class:`Substrings` for instead of checking each str.
+
+Substrings walks the value one character at a time in Python, so checking each str with
+the in operator is faster until there are about this many strings."""
+
+RE_UNCOMBINABLE: t.Pattern = re.compile(r"\(\?[aiLmsux]+\)")
+"""Patterns with global flags that can not be combined into one regex."""
+
 MatcherLoad: t.TypeVar = t.TypeVar(
     "MatcherLoad", "Matcher", str, t.Pattern, t.Iterable[t.Union[str, t.Pattern]]
 )
 
 
+class Substrings:
+    """Aho-Corasick automaton to check if any of a set of strings is in a value.
+
+    Notes:
+        Checking a value takes time linear to the length of value no matter how many strings
+        there are.
+    """
+
+    def __init__(self, strings: t.Iterable[str]) -> None:
+        """Pass."""
+        self.goto: t.List[t.Dict[str, int]] = [{}]
+        self.fail: t.List[int] = [0]
+        self.out: t.List[bool] = [False]
+
+        for string in strings:
+            node = 0
+            for char in string:
+                nxt = self.goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(False)
+                    self.goto[node][char] = nxt
+                node = nxt
+            self.out[node] = True
+
+        queue = collections.deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self.goto[node].items():
+                queue.append(nxt)
+                fail = self.fail[node]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                fail = self.goto[fail].get(char, 0)
+                self.fail[nxt] = 0 if fail == nxt else fail
+                self.out[nxt] = self.out[nxt] or self.out[self.fail[nxt]]
+
+    def search(self, value: str) -> bool:
+        """Check if any of the strings are in value."""
+        goto, fail, out = self.goto, self.fail, self.out
+        node = 0
+        for char in value:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                return True
+        return out[0]
+
+
+def combine_patterns(patterns: t.List[t.Pattern]) -> t.List[t.Pattern]:
+    """Combine patterns with the same flags into one alternation regex per set of flags.
+
+    Notes:
+        Patterns that are bytes, verbose, or use groups or global inline flags are kept as is,
+        since group numbers, backreferences, and conditionals change meaning when combined.
+
+    Args:
+        patterns: patterns to combine
+
+    Returns:
+        t.List[t.Pattern]: patterns that match a value if any of the supplied patterns do
+    """
+    groups: t.Dict[int, t.List[t.Pattern]] = {}
+    combined: t.List[t.Pattern] = []
+
+    for pattern in patterns:
+        if (
+            isinstance(pattern.pattern, str)
+            and not pattern.flags & re.VERBOSE
+            and not pattern.groups
+            and not RE_UNCOMBINABLE.search(pattern.pattern)
+        ):
+            groups.setdefault(pattern.flags, []).append(pattern)
+        else:
+            combined.append(pattern)
+
+    for flags, items in groups.items():
+        if len(items) == 1:
+            combined += items
+            continue
+        try:
+            combined.append(re.compile("|".join(f"(?:{x.pattern})" for x in items), flags))
+        except re.error:
+            combined += items
+    return combined
+
+
 class Matcher:
-    """Caching pattern matcher."""
+    """Pattern matcher that is compiled once when created.
+
+    Notes:
+        Exact matches use a frozenset, patterns are combined into as few regexes as possible,
+        and substring matches use :class:`Substrings` when there are many strings.
+        :attr:`strings` and :attr:`patterns` should not be changed after creation.
+    """
 
     def _listify(self, value: t.Any) -> t.List[t.Any]:
         """Pass."""
@@ -62,6 +166,12 @@ class Matcher:
                 elif is_pattern(value=check) and check not in self.patterns:
                     self.patterns.append(check)
 
+        self.strings_set: t.FrozenSet[str] = frozenset(self.strings)
+        self.patterns_combined: t.List[t.Pattern] = combine_patterns(self.patterns)
+        self.substrings: t.Optional[Substrings] = (
+            Substrings(self.strings) if len(self.strings) >= SUBSTRINGS_MIN else None
+        )
+
     @property
     def has_matches(self) -> bool:
         """Pass."""
@@ -107,7 +217,6 @@ class Matcher:
             return cls(values=values.values, **cls_args)
         return cls(values=values, **cls_args)
 
-    @cachetools.cached(cachetools.LRUCache(maxsize=CACHE_SIZE))
     def contains(self, value: str, patterns: bool = True) -> bool:
         """Check if value that contains strings or matches patterns.
 
@@ -120,12 +229,13 @@ class Matcher:
                 matches value, False otherwise
         """
         value = coerce_str(value=value)
-        for item in self.strings:
-            if item in value:
+        if self.substrings is not None:
+            if self.substrings.search(value):
                 return True
+        elif any(item in value for item in self.strings):
+            return True
         return self.search(value) if patterns else False
 
-    @cachetools.cached(cachetools.LRUCache(maxsize=CACHE_SIZE))
     def equals(self, value: str, patterns: bool = True) -> bool:
         """Check if value that equals strings or matches patterns.
 
@@ -138,12 +248,10 @@ class Matcher:
                 self.patterns matches value, False otherwise
         """
         value = coerce_str(value=value)
-        for item in self.strings:
-            if item == value:
-                return True
+        if value in self.strings_set:
+            return True
         return self.search(value) if patterns else False
 
-    @cachetools.cached(cachetools.LRUCache(maxsize=CACHE_SIZE))
     def search(self, value: str) -> bool:
         """Check if value that matches patterns.
 
@@ -154,10 +262,7 @@ class Matcher:
             bool: True if any of self.patterns matches values, False otherwise
         """
         value = coerce_str(value=value)
-        for item in self.patterns:
-            if item.search(value):
-                return True
-        return False
+        return any(item.search(value) for item in self.patterns_combined)
 
     def hide_values(self, value: dict, patterns: bool = True) -> dict:
         """Hide values in value if keys match hide.
@@ -1,5 +1,21 @@
 """Projects that are their own python modules."""
-
-from . import cert_human, cf_token, url_parser
+import importlib
+import typing as t
 
 __all__ = ("cert_human", "cf_token", "url_parser")
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the projects the first time they are used (PEP 562)."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", package=__name__)
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the ones not yet imported.
+
+    Notes:
+        The names only used to do the lazy imports are left out.
+    """
+    return sorted({*globals(), *__all__} - {"importlib", "t"})
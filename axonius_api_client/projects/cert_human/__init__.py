@@ -1,20 +1,49 @@
 # -*- coding: utf-8 -*-
 """Tools for working with SSL certificate files."""
+import importlib
+import typing as t
+
+LAZY_ATTRS: t.Dict[str, t.Tuple[str, t.Optional[str]]] = {
+    "constants": (".constants", None),
+    "ct_logs": (".ct_logs", None),
+    "all_logs_list": (".all_logs_list", None),
+    "enums": (".enums", None),
+    "exceptions": (".exceptions", None),
+    "paths": (".paths", None),
+    "ssl_capture": (".ssl_capture", None),
+    "ssl_context": (".ssl_context", None),
+    "ssl_extensions": (".ssl_extensions", None),
+    "stores": (".stores", None),
+    "convert": (".convert", None),
+    "utils": (".utils", None),
+    "Cert": (".stores", "Cert"),
+    "CertRequest": (".stores", "CertRequest"),
+    "Store": (".stores", "Store"),
+}
+"""Attributes of this package that are imported the first time they are used."""
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the modules of this package the first time they are used (PEP 562)."""
+    if name not in LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module, attr = LAZY_ATTRS[name]
+    value = importlib.import_module(module, package=__name__)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    """Get the attributes of this package, including the ones not yet imported.
+
+    Notes:
+        The names only used to do the lazy imports are left out.
+    """
+    return sorted({*globals(), *LAZY_ATTRS} - {"LAZY_ATTRS", "importlib", "t"})
 
-from . import (
-    constants,
-    ct_logs,
-    enums,
-    exceptions,
-    paths,
-    ssl_capture,
-    ssl_context,
-    ssl_extensions,
-    stores,
-    convert,
-    utils,
-)
-from .stores import Cert, CertRequest, Store
 
 __all__ = (
     "Store",
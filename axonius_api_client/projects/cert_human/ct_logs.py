@@ -7,7 +7,6 @@ from typing import Optional, Tuple
 import cachetools
 import requests
 
-from .all_logs_list import FALLBACK_JSON, FALLBACK_UPDATED
 from .constants import CT_LOGS
 from .paths import FileInfo, pathify
 
@@ -56,6 +55,9 @@ def read_data(**kwargs) -> Optional[dict]:
 
 def read_data_fallback(**kwargs) -> dict:
     """Pass."""
+    # the fallback module is large, only import it when there is no other data
+    from .all_logs_list import FALLBACK_JSON, FALLBACK_UPDATED
+
     LOG.debug(f"Reading fallback data updated on {FALLBACK_UPDATED}")
     data = json.loads(FALLBACK_JSON)
     return data
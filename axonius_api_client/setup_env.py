@@ -90,6 +90,12 @@ KEY_USER_AGENT: str = f"{KEY_PRE}USER_AGENT"
 """OS env to use a custom User Agent string."""
 
 KEY_CREDENTIALS = f"{KEY_PRE}CREDENTIALS"
+
+KEY_JSON_BACKEND: str = f"{KEY_PRE}JSON_BACKEND"
+"""OS env to select the JSON backend: auto, orjson, or json."""
+
+KEY_FIELDS_CACHE: str = f"{KEY_PRE}FIELDS_CACHE"
+"""OS env to enable the persistent cache of parsed field schemas."""
 DEFAULT_CREDENTIALS: str = "no"
 
 DEFAULT_DEBUG: str = "no"
@@ -106,6 +112,12 @@ DEFAULT_OVERRIDE: str = "yes"
 DEFAULT_CERTWARN: str = "yes"
 """Default for :attr:`KEY_CERTWARN`"""
 
+DEFAULT_JSON_BACKEND: str = "auto"
+"""Default for :attr:`KEY_JSON_BACKEND`"""
+
+DEFAULT_FIELDS_CACHE: str = "no"
+"""Default for :attr:`KEY_FIELDS_CACHE`"""
+
 DEFAULT_ENV_FILE: str = ".env"
 """Default for :attr:`KEY_ENV_FILE`"""
 
@@ -161,6 +173,21 @@ CONNECT_SCHEMAS: dict = {
         "type": "boolean",
         "description": "Treat key/secret as username/password",
     },
+    "json_backend": {
+        "env": KEY_JSON_BACKEND,
+        "arg": "json_backend",
+        "default": DEFAULT_JSON_BACKEND,
+        "type": "string",
+        "description": "JSON backend to use: auto, orjson, or json",
+        "empty_ok": True,
+    },
+    "fields_cache": {
+        "env": KEY_FIELDS_CACHE,
+        "arg": "fields_cache",
+        "default": DEFAULT_FIELDS_CACHE,
+        "type": "boolean",
+        "description": "Cache parsed field schemas on disk between processes",
+    },
     "cf_token": {
         "env": KEY_CF_TOKEN,
         "arg": "cf_token",
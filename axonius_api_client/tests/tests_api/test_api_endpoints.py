@@ -1,17 +1,20 @@
 """Tests."""
 import dataclasses
+import io
+import json
 from typing import List, Type
 
 import pytest
 import requests
 
-from axonius_api_client.api import json_api
+from axonius_api_client.api import ActivityLogs, SystemUsers, json_api
 from axonius_api_client.api.api_endpoints import (
     ApiEndpoint,
     ApiEndpointGroup,
     ApiEndpoints,
     ApiEndpointsGroups,
 )
+from axonius_api_client.api.enforcements import Tasks
 from axonius_api_client.exceptions import (
     InvalidCredentials,
     JsonInvalidError,
@@ -364,6 +367,24 @@ class TestApiEndpoint:
         assert isinstance(ret, dict)
         assert "data" in ret
 
+    def test_get_response_json_stream(self):
+        endpoint = ApiEndpoints.assets.get
+        body = {
+            "data": [{"id": "1", "type": "x", "attributes": {"internal_axon_id": "1"}}],
+            "meta": {"page": {"number": 1}},
+        }
+
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(json.dumps(body).encode())
+        assert endpoint.is_response_unread(response=response)
+
+        ret = endpoint.handle_response(http=None, response=response)
+        assert isinstance(ret, json_api.assets.AssetsPage)
+        assert ret.assets == [{"internal_axon_id": "1"}]
+        assert ret.meta == body["meta"]
+        assert not ret.empty_response
+
     def test_check_response_json(self, request):
         endpoint = ApiEndpoints.system_settings.feature_flags_get
         auth = get_auth(request)
@@ -467,6 +488,82 @@ class TestApiEndpoint:
         with pytest.raises(ResponseLoadObjectError):
             endpoint.load_response(data=data, http=None)
 
+    def test_response_trusted_endpoints(self):
+        endpoints = ApiEndpoints.get_endpoints(recursive=True)
+        assert not [k for k, v in endpoints.items() if v.response_trusted]
+        for name in [
+            "adapters.get_fetch_history",
+            "audit_logs.get",
+            "enforcements.tasks.get_full",
+            "saved_queries.get",
+            "system_users.get",
+        ]:
+            assert endpoints[name].response_schema_cls.can_load_trusted(), name
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_perform_request_trusted(self, monkeypatch, trusted):
+        class FakeAuth:
+            http = None
+
+            def login(self):
+                pass
+
+        calls = []
+
+        def perform_request(self, **kwargs):
+            calls.append((self.path, kwargs.get("trusted")))
+            return []
+
+        monkeypatch.setattr(ApiEndpoint, "perform_request", perform_request)
+        auth = FakeAuth()
+        ActivityLogs(auth=auth).get(trusted=trusted)
+        SystemUsers(auth=auth).get(trusted=trusted)
+        Tasks(auth=auth).get_full(uuid="x", trusted=trusted)
+        assert calls == [
+            (ApiEndpoints.audit_logs.get.path, trusted),
+            (ApiEndpoints.system_users.get.path, trusted),
+            (ApiEndpoints.enforcements.tasks.get_full.path, trusted),
+        ]
+
+    def test_load_response_trusted(self, monkeypatch):
+        endpoint = ApiEndpoints.audit_logs.get
+        schema = endpoint.response_schema_cls
+        data = {
+            "data": [
+                {
+                    "type": "audit_schema",
+                    "attributes": {
+                        "action": "login",
+                        "category": "user",
+                        "date": "2023-01-01T00:00:00Z",
+                        "message": "badwolf",
+                        "type": "info",
+                        "user": "admin",
+                    },
+                }
+            ]
+        }
+        calls = []
+        load_trusted = schema.load_trusted
+
+        def spy(**kwargs):
+            calls.append(kwargs)
+            return load_trusted(**kwargs)
+
+        monkeypatch.setattr(schema, "load_trusted", spy)
+        exp = endpoint.load_response(data=data, http=None)
+        assert not calls
+        ret = endpoint.load_response(data=data, http=None, trusted=True)
+        assert len(calls) == 1
+        assert ret == exp
+        assert isinstance(ret[0], endpoint.response_model_cls)
+
+        endpoint = dataclasses.replace(endpoint, response_trusted=True)
+        endpoint.load_response(data=data, http=None)
+        assert len(calls) == 2
+        endpoint.load_response(data=data, http=None, trusted=False)
+        assert len(calls) == 2
+
     def test_attr_request_load_cls(self):
         endpoint = ApiEndpoint(
             method="get",
@@ -40,6 +40,8 @@ def get_cbobj_main(
 
     assert isinstance(cbobj.TAG_ROWS_ADD, list) and not cbobj.TAG_ROWS_ADD
     assert isinstance(cbobj.TAG_ROWS_REMOVE, list) and not cbobj.TAG_ROWS_REMOVE
+    assert isinstance(cbobj.TAG_IDS_ADD, dict) and not cbobj.TAG_IDS_ADD
+    assert isinstance(cbobj.TAG_IDS_REMOVE, dict) and not cbobj.TAG_IDS_REMOVE
 
     assert isinstance(cbobj.LOG, logging.Logger)
 
@@ -88,6 +90,24 @@ class CallbacksFull(Callbacks):
         cbobj.stop()
         log_check(caplog=caplog, entries=["Stopping"], exists=True)
 
+    def test_compile_plan(self, cbexport, apiobj):
+        getargs = {"field_compress": True, "tags_add": ["badwolf"]}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+        assert cbobj.PLAN is None
+
+        plan = cbobj.compile_plan()
+        assert cbobj.do_change_field_keys in plan
+        assert cbobj.do_change_field_compress not in plan
+        assert cbobj.process_tags_to_add in plan
+        assert cbobj.process_tags_to_remove not in plan
+        assert cbobj.do_custom_cbs not in plan
+        assert cbobj.do_explode_field not in plan
+        assert plan == [x for x in cbobj.callbacks if x in plan]
+
+        cbobj.PLAN = plan
+        cbobj.set_arg_value("tags_remove", ["badwolf"])
+        assert cbobj.process_tags_to_remove in cbobj.PLAN
+
     def test_add_report_adapters_missing_false(self, cbexport, apiobj):
         original_row = copy.deepcopy(apiobj.ORIGINAL_ROWS[0])
         test_row = copy.deepcopy(original_row)
@@ -154,6 +174,43 @@ class CallbacksFull(Callbacks):
             assert schema in cbobj.custom_schemas
             assert schema in cbobj.final_schemas
 
+    def test_delta(self, cbexport, apiobj, tmp_path):
+        original_row = copy.deepcopy(apiobj.ORIGINAL_ROWS[0])
+        delta_path = tmp_path / "delta.state"
+        key = SCHEMAS_CUSTOM["delta_path"]["delta_change"]["name_qual"]
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={"delta_path": delta_path})
+        cbobj.start_delta()
+        rows = cbobj.do_delta(rows=copy.deepcopy(original_row))
+        assert [x[key] for x in rows] == ["added"]
+        assert list(cbobj.delta_removed()) == []
+        cbobj.DELTA.save()
+
+        for schema in SCHEMAS_CUSTOM["delta_path"].values():
+            assert schema in cbobj.custom_schemas
+            assert schema in cbobj.final_schemas
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={"delta_path": delta_path})
+        cbobj.start_delta()
+        assert cbobj.do_delta(rows=copy.deepcopy(original_row)) == []
+        assert list(cbobj.delta_removed()) == []
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={"delta_path": delta_path})
+        cbobj.start_delta()
+        assert list(cbobj.delta_removed()) == [
+            {"internal_axon_id": original_row["internal_axon_id"], key: "removed"}
+        ]
+
+    def test_delta_max_rows(self, cbexport, apiobj, tmp_path):
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"delta_path": tmp_path / "delta.state"},
+            store={"max_rows": 1},
+        )
+        with pytest.raises(ApiError):
+            cbobj.start_delta()
+
     def test_echo_page_progress_0(self, cbexport, apiobj, caplog):
         cbobj = self.get_cbobj(
             apiobj=apiobj,
@@ -318,6 +375,9 @@ class CallbacksFull(Callbacks):
         assert rows[0] == original_row
         assert {apiobj.FIELD_AXON_ID: row_id} in cbobj.TAG_ROWS_ADD
 
+        cbobj.process_tags_to_add(rows=[test_row, test_row])
+        assert list(cbobj.TAG_IDS_ADD) == [row_id]
+
         cbobj.do_tagging()
         log_entries = ["tags.*assets"]
         log_check(caplog=caplog, entries=log_entries, exists=True)
@@ -337,6 +397,9 @@ class CallbacksFull(Callbacks):
         assert rows[0] == original_row
         assert {apiobj.FIELD_AXON_ID: row_id} in cbobj.TAG_ROWS_REMOVE
 
+        cbobj.process_tags_to_remove(rows=[test_row, test_row])
+        assert list(cbobj.TAG_IDS_REMOVE) == [row_id]
+
         cbobj.do_tagging()
 
         log_check(caplog=caplog, entries=["tags.*assets"], exists=True)
@@ -537,6 +600,28 @@ class CallbacksFull(Callbacks):
             assert cb_schema["name"] not in test_row
             assert cb_schema["name_qual"] not in test_row
 
+    def test_do_change_field_keys(self, cbexport, apiobj):
+        field_complex = apiobj.FIELD_COMPLEX
+        original_row = copy.deepcopy(apiobj.COMPLEX_ROWS[0])
+        getargs = {"field_titles": True, "field_compress": True, "field_replace": [" =_"]}
+        store = {"fields_parsed": [field_complex]}
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, store=store, getargs=getargs)
+        rows = cbobj.do_change_field_keys(rows=copy.deepcopy(original_row))
+
+        cbobj_steps = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, store=store, getargs=getargs
+        )
+        rows_steps = cbobj_steps.do_change_field_titles(rows=copy.deepcopy(original_row))
+        rows_steps = cbobj_steps.do_change_field_compress(rows=rows_steps)
+        rows_steps = cbobj_steps.do_change_field_replace(rows=rows_steps)
+
+        assert rows == rows_steps
+        assert list(rows[0]) == list(rows_steps[0])
+        for key in rows[0]:
+            assert " " not in key
+        assert cbobj.field_keys
+
     def test_do_change_field_titles_false(self, cbexport, apiobj):
         original_row = copy.deepcopy(apiobj.ORIGINAL_ROWS[0])
         test_row = copy.deepcopy(original_row)
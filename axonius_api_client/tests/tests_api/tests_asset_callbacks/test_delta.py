@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Test suite for delta state of asset callbacks."""
+import gzip
+
+from axonius_api_client.api.asset_callbacks.delta import DeltaState
+from axonius_api_client.tools import get_json_backend, set_json_backend
+
+
+def get_row(idx, value="x"):
+    return {"internal_axon_id": f"{idx:032x}", "hostname": value}
+
+
+class TestDeltaState:
+    def test_changes(self, tmp_path):
+        path = tmp_path / "delta.state"
+        state = DeltaState(path=path)
+        assert state.count == 0
+        assert [state.check(row=get_row(x)) for x in range(5)] == ["added"] * 5
+        state.save()
+
+        state = DeltaState(path=path)
+        assert state.count == 5
+        assert state.check(row=get_row(0)) is None
+        assert state.check(row=get_row(1, "y")) == "changed"
+        assert state.check(row=get_row(9)) == "added"
+        assert list(state.removed()) == [get_row(x)["internal_axon_id"] for x in [2, 3, 4]]
+        state.save()
+
+        state = DeltaState(path=path)
+        assert state.count == 3
+        assert state.check(row=get_row(1, "y")) is None
+        assert state.check(row=get_row(9)) is None
+
+    def test_duplicates(self, tmp_path):
+        path = tmp_path / "delta.state"
+        state = DeltaState(path=path)
+        state.check(row=get_row(1, "a"))
+        state.check(row=get_row(1, "b"))
+        state.save()
+
+        state = DeltaState(path=path)
+        assert state.count == 1
+        assert state.check(row=get_row(1, "b")) is None
+
+    def test_runs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(DeltaState, "RUN_SIZE", 2)
+        path = tmp_path / "delta.state"
+        state = DeltaState(path=path)
+        for idx, value in [(5, "a"), (3, "a"), (1, "a"), (5, "b"), (3, "b"), (2, "a"), (5, "c")]:
+            state.check(row=get_row(idx, value))
+        assert isinstance(state.records, bytearray)
+        assert len(state.records) == 7 * DeltaState.RECORD_SIZE
+        assert state.runs == [x * DeltaState.RECORD_SIZE for x in [2, 4, 6]]
+        state.save()
+
+        state = DeltaState(path=path)
+        assert state.count == 4
+        keys = [state.keys[x] for x in range(state.count)]
+        assert keys == sorted(keys)
+        assert state.check(row=get_row(1, "a")) is None
+        assert state.check(row=get_row(2, "a")) is None
+        assert state.check(row=get_row(3, "b")) is None
+        assert state.check(row=get_row(5, "c")) is None
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / "delta.state"
+        with gzip.open(path, "wb") as fh:
+            fh.write(b"badwolf")
+
+        state = DeltaState(path=path)
+        assert state.count == 0
+        assert state.check(row=get_row(1)) == "added"
+
+        path.write_bytes(b"badwolf")
+        assert DeltaState(path=path).count == 0
+
+    def test_hash_backend(self):
+        row = {"b": [1, 2.5, None], "a": "é", "n": float("nan")}
+        orig = get_json_backend()
+        try:
+            hashes = []
+            for backend in ["json", "auto"]:
+                set_json_backend(backend=backend)
+                hashes.append(DeltaState.get_hash(row=row))
+        finally:
+            set_json_backend(backend=orig)
+        assert hashes[0] == hashes[1]
+        assert DeltaState.get_hash(row=dict(reversed(row.items()))) == hashes[0]
@@ -5,9 +5,15 @@ from typing import Any, List
 
 import pytest
 
-from axonius_api_client.api import json_api, mixins, AssetMixin
-
-from axonius_api_client.exceptions import ApiError, NotFoundError, StopFetch, ToolsError
+from axonius_api_client.api import Devices, json_api, mixins, AssetMixin
+
+from axonius_api_client.exceptions import (
+    ApiError,
+    ChunkError,
+    NotFoundError,
+    StopFetch,
+    ToolsError,
+)
 from axonius_api_client.tools import listify
 
 from ...meta import QUERIES
@@ -55,6 +61,54 @@ class WizData:
     nones: List[Any] = [[], None, {}, ""]
 
 
+class FakeAuth:
+    http = None
+
+    def login(self):
+        pass
+
+
+class FakePage:
+    def __init__(self, offset, limit):
+        self.assets = [{"offset": x} for x in range(offset, offset + limit)]
+        self.asset_count_page = len(self.assets)
+
+
+class TestAssetsShardedFake:
+    @pytest.fixture
+    def apiobj(self):
+        apiobj = Devices(auth=FakeAuth())
+        apiobj.counts = []
+
+        def count(**kwargs):
+            apiobj.counts.append(kwargs)
+            return 25
+
+        def _get(request_obj, http_args):
+            page = request_obj.page
+            return FakePage(offset=page.offset, limit=min(page.limit, 25 - page.offset))
+
+        apiobj.count = count
+        apiobj._get = _get
+        return apiobj
+
+    @pytest.mark.parametrize("initial_count", [None, 0, 25])
+    def test_initial_count(self, apiobj, initial_count):
+        state = json_api.assets.AssetsPage.create_state(
+            max_pages=None, max_rows=None, page_sleep=0, page_size=10, initial_count=initial_count
+        )
+        request_obj = json_api.assets.AssetRequest(filter="badwolf")
+        pages = apiobj._get_pages_sharded(
+            request_obj=request_obj, state=state, http_args={}, shards=2
+        )
+        rows = [y["offset"] for x, _ in pages for y in x.assets]
+        assert rows == list(range(25))
+        assert state["rows_initial_count"] == 25
+        assert len(apiobj.counts) == (0 if initial_count else 1)
+        if apiobj.counts:
+            assert apiobj.counts[0]["query"] == "badwolf"
+
+
 class ModelMixinsBase:
     """Pass."""
 
@@ -221,6 +275,13 @@ class TestAssetsPrivate(ModelMixinsBase):
         data = apiobj.get_wiz_entries(wiz_entries=WizData.wiz_dict)
         assert data == WizData.exp
 
+    def test_get_stream_pages(self, apiobj):
+        rows = apiobj.get(max_rows=5, page_size=2)
+        rows_stream = apiobj.get(max_rows=5, page_size=2, stream_pages=True)
+        assert [x["internal_axon_id"] for x in rows_stream] == [
+            x["internal_axon_id"] for x in rows
+        ]
+
     def test_get_query(self, apiobj):
         query = QUERIES["not_last_seen_day"]
         data = apiobj._get(filter=query, limit=1)
@@ -399,6 +460,41 @@ class TestAssetsPublic(ModelMixinsBase):
         check_asset(row)
         assert row["internal_axon_id"] == axon_id
 
+    @FLAKY()
+    def test_get_by_values_chunked(self, apiobj):
+        axon_ids = [x["internal_axon_id"] for x in apiobj.ORIGINAL_ROWS[:2]]
+        values = axon_ids + axon_ids[:1]
+
+        rows = apiobj.get_by_values(
+            values=values, field="internal_axon_id", field_manual=True, chunk_size=1, concurrency=2
+        )
+        check_assets(rows)
+        assert sorted(x["internal_axon_id"] for x in rows) == sorted(axon_ids)
+        assert apiobj.LAST_CALLBACKS.STORE["queries"] == [
+            f"(internal_axon_id in ['{x}'])" for x in values
+        ]
+
+    @FLAKY()
+    @pytest.mark.parametrize("full", [True, False])
+    def test_get_by_ids(self, apiobj, full):
+        axon_ids = [x["internal_axon_id"] for x in apiobj.ORIGINAL_ROWS[:3]]
+
+        rows = apiobj.get_by_ids(ids=axon_ids, full=full, concurrency=2, chunk_size=2)
+        assert sorted(x["internal_axon_id"] for x in rows) == sorted(axon_ids)
+
+    def test_get_by_ids_error(self, apiobj):
+        axon_id = apiobj.ORIGINAL_ROWS[0]["internal_axon_id"]
+        missing = "0" * 32
+
+        with pytest.raises(ChunkError) as exc:
+            apiobj.get_by_ids(ids=[axon_id, missing, "badwolf"])
+        assert exc.value.value == 1
+        assert [x["id"] for x in exc.value.errors] == ["badwolf", missing]
+        assert isinstance(exc.value.errors[1]["exc"], NotFoundError)
+
+        rows = apiobj.get_by_ids(ids=[axon_id, missing], error=False)
+        assert [x["internal_axon_id"] for x in rows] == [axon_id]
+
     def test_get_id_error(self, apiobj):
         with pytest.raises(NotFoundError):
             apiobj.get_by_id(id="badwolf")
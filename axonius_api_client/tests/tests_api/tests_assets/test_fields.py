@@ -276,6 +276,44 @@ class TestFieldsPublic:
         fields = apiobj.fields.get()
         self.val_parsed_fields(fields=fields)
 
+    def test_find_field_schema(self, apiobj):
+        fields = apiobj.fields.get()
+        index = apiobj.fields.get_index()
+        assert apiobj.fields.get_index() is index
+        for adapter, schemas in fields.items():
+            for schema in schemas[:50]:
+                for key in ["name", "name_qual", "title"]:
+                    for selectable_only in [True, False]:
+                        found = apiobj.fields.find_field_schema(
+                            adapter=adapter, value=schema[key], selectable_only=selectable_only
+                        )
+                        try:
+                            exp = apiobj.fields.get_field_schema(
+                                value=schema[key],
+                                schemas=schemas,
+                                selectable_only=selectable_only,
+                            )
+                        except NotFoundError:
+                            exp = None
+                        assert found is exp
+        assert apiobj.fields.find_field_schema(adapter="agg", value="badwolf_xxx") is None
+
+    def test_get_cache_path(self, apiobj, monkeypatch, tmp_path):
+        monkeypatch.setattr("axonius_api_client.api.assets.fields.DEFAULT_PATH", str(tmp_path))
+        monkeypatch.setattr(apiobj.http.CLIENT, "FIELDS_CACHE", True)
+        path = apiobj.fields.cache_path
+        assert path.parent.parent == tmp_path
+
+        fields = apiobj.fields.get.__wrapped__(apiobj.fields)
+        assert path.is_file()
+        assert apiobj.fields._load_cache(path=path) == fields
+
+        monkeypatch.setattr(apiobj.fields, "_get", None)
+        assert apiobj.fields.get.__wrapped__(apiobj.fields) == fields
+
+        monkeypatch.setattr(apiobj.http.CLIENT, "FIELDS_CACHE", False)
+        assert apiobj.fields.cache_path is None
+
     def val_parsed_fields(self, fields):
         fields = copy.deepcopy(fields)
         assert isinstance(fields, dict)
@@ -2,7 +2,8 @@
 """Test suite for axonapi.api.assets."""
 import pytest
 
-from axonius_api_client.api import json_api
+from axonius_api_client.api import Devices, json_api
+from axonius_api_client.exceptions import ChunkError
 
 
 class TestLabelsPrivate:
@@ -132,3 +133,62 @@ class LabelsPublic:
 
         for label in labels:
             assert label not in all_labels_post_remove
+
+    def test_add_remove_chunked(self, apiobj):
+        labels = ["badwolf_chunked"]
+
+        assets = apiobj.get(max_rows=3)
+        asset_ids = [x["internal_axon_id"] for x in assets]
+
+        add_label_result = apiobj.labels.add(
+            labels=labels, rows=asset_ids, chunk_size=1, concurrency=2
+        )
+        assert add_label_result == len(asset_ids)
+
+        remove_label_result = apiobj.labels.remove(
+            labels=labels, rows=asset_ids, chunk_size=2, concurrency=2
+        )
+        assert remove_label_result == len(asset_ids)
+
+
+class FakeAuth:
+    http = None
+
+    def login(self):
+        pass
+
+
+class TestLabelsFake:
+    @pytest.fixture
+    def apiobj(self):
+        return Devices(auth=FakeAuth())
+
+    def test_chunked_errors(self, apiobj):
+        def method(ids, include, labels):
+            if "bad" in ids:
+                raise ValueError("badwolf")
+            return json_api.generic.IntValue(value=len(ids))
+
+        ids = ["a", "b", "bad", "c", "d"]
+        with pytest.raises(ChunkError) as exc:
+            apiobj.labels._chunked(method=method, ids=ids, chunk_size=2, labels=["x"])
+
+        assert exc.value.value == 3
+        assert len(exc.value.errors) == 1
+        assert exc.value.errors[0]["chunk"] == 2
+        assert exc.value.errors[0]["ids"] == ["bad", "c"]
+        assert isinstance(exc.value.errors[0]["exc"], ValueError)
+
+    def test_chunked_invert(self, apiobj):
+        calls = []
+
+        def method(ids, include, labels):
+            calls.append(ids)
+            return json_api.generic.IntValue(value=10)
+
+        ids = ["a", "b", "c"]
+        ret = apiobj.labels._chunked(
+            method=method, ids=ids, include=False, chunk_size=1, labels=["x"]
+        )
+        assert ret == 10
+        assert calls == [ids]
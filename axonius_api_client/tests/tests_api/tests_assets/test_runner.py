@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
+import logging
 import re
 
 import pytest
@@ -162,3 +163,82 @@ class TestRunEnforcement(RunEnforcements):
             with pytest.raises(RunnerError, match=re.escape(runner._trun_notv)):
                 runner.run()
             assert runner.executed is False
+
+
+class FakeEset:
+    name = MetaEset.name
+
+
+class FakeEnforcements:
+    def get_set(self, value, refetch=False):
+        return FakeEset()
+
+
+class FakeHttp:
+    POOL_MAXSIZE = 2
+
+
+class FakeAuth:
+    http = FakeHttp()
+
+
+class FakeApi:
+    LOG = logging.getLogger("FakeApi")
+
+    def __init__(self, fail_ids=None):
+        self.auth = FakeAuth()
+        self.enforcements = FakeEnforcements()
+        self.fail_ids = fail_ids or []
+        self.queries = []
+        self.runs = []
+
+    def count(self, query):
+        self.queries.append(query)
+        return query.count('"') // 2 - 1
+
+    def _run_enforcement(self, name, ids, fields=None, query=None):
+        if set(ids) & set(self.fail_ids):
+            raise ValueError("badwolf")
+        self.runs.append(ids)
+
+
+class TestRunnerBatches:
+    def test_batches(self):
+        apiobj = FakeApi()
+        ids = random_strs(num=7, length=32)
+        runner = Runner(apiobj=apiobj, eset="x", ids=ids, batch_size=3, concurrency=5)
+        assert runner.batches == [ids[:3], ids[3:6], ids[6:]]
+        assert runner.count_batch == 3
+        assert runner.count_batches == 3
+        assert runner._concurrency == FakeHttp.POOL_MAXSIZE
+
+        with pytest.warns(RunnerWarning, match=re.escape(Runner._tstate_count_matches)):
+            runner.verify_and_run()
+        assert runner.count_result == 7
+        assert len(apiobj.queries) == 3
+        assert runner.executed is True
+        assert runner.state == runner._tstate_ran
+        assert sorted(apiobj.runs) == sorted(runner.batches)
+        assert [x.number for x in runner.batch_results] == [1, 2, 3]
+        assert all(x.executed for x in runner.batch_results)
+        assert "count_batches=3" in str(runner)
+
+    def test_batches_error(self):
+        ids = random_strs(num=4, length=32)
+        apiobj = FakeApi(fail_ids=ids[2:3])
+        runner = Runner(apiobj=apiobj, eset="x", ids=ids, batch_size=2, verified=True)
+        runner.verify()
+        with pytest.raises(RunnerError, match="1 out of 2 batches ran, 1 failed"):
+            runner.run()
+        assert runner.executed is True
+        assert [x.executed for x in runner.batch_results] == [True, False]
+        assert "FAILED: badwolf" in str(runner.batch_results[1])
+
+    def test_no_batches(self):
+        apiobj = FakeApi()
+        ids = random_strs(num=3, length=32)
+        runner = Runner(apiobj=apiobj, eset="x", ids=ids, batch_size=5, verified=True)
+        assert runner.count_batches == 1
+        runner.verify_and_run()
+        assert apiobj.runs == [ids]
+        assert runner.batch_results is None
@@ -177,6 +177,20 @@ class TestEnforcements(EnforcementsBase):
         value = apiobj.get_sets()
         assert created_set.uuid in [x.uuid for x in value]
 
+    def test_get_sets_concurrency(self, created_set, apiobj):
+        basic = apiobj.get_sets(full=False)
+        value = apiobj.get_sets(concurrency=4)
+        assert [x.uuid for x in value] == [x.uuid for x in basic]
+        assert all(isinstance(x, EnforcementFullModel) for x in value)
+
+    def test_get_sets_cached(self, created_set, apiobj):
+        apiobj.clear_cache()
+        value = apiobj.get_sets_cached(full=False)
+        assert apiobj.get_sets_cached(full=False) is value
+        assert created_set.uuid in [x.uuid for x in value]
+        apiobj.update_description(value=created_set, description=Meta.description)
+        assert apiobj.get_sets_cached(full=False) is not value
+
     def test_get_set(self, created_set, apiobj):
         value = apiobj.get_set(value=created_set)
         assert (value.name, value.uuid) == (created_set.name, created_set.uuid)
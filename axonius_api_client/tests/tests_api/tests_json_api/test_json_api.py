@@ -1,4 +1,7 @@
+import copy
 import dataclasses
+import time
+import warnings
 
 import marshmallow
 import pytest
@@ -227,3 +230,292 @@ class TestJsonApi:
         exp = {"page[limit]": 20, "page[offset]": 3, "get_metadata": True}
         ret = data.dump_request_params()
         assert ret == exp
+
+
+def get_trusted_data(count: int = 2) -> dict:
+    attributes = {
+        "name": "badwolf",
+        "view": {"query": {"filter": ""}},
+        "tags": ["a"],
+        "private": "false",
+        "last_updated": "2023-01-02T00:00:00Z",
+        "used_in": ["x", {"y": 1}],
+        "access": {"mode": "Shared", "config": {}},
+    }
+    return {
+        "data": [
+            {"type": "views_details_schema", "id": str(x), "attributes": dict(attributes)}
+            for x in range(count)
+        ],
+        "meta": {"page": {"number": 1}},
+    }
+
+
+class TestJsonApiTrusted:
+    def test_load_trusted(self):
+        schema = json_api.saved_queries.SavedQuerySchema
+        assert schema.can_load_trusted()
+        exp = schema.load_response(data=get_trusted_data())
+        ret = schema.load_trusted(data=get_trusted_data())
+        assert [x.to_dict() for x in ret] == [x.to_dict() for x in exp]
+        assert isinstance(ret[0].access, json_api.nested_access.Access)
+        assert ret[0].private is False
+        assert ret[0].document_meta == {"page": {"number": 1}}
+
+    def test_load_trusted_defaults(self):
+        schema = json_api.saved_queries.SavedQuerySchema
+        data = get_trusted_data(count=1)
+        data["data"] = data["data"][0]
+        data["data"]["attributes"].pop("access")
+        data["data"]["attributes"].pop("private")
+        exp = schema.load_response(data=data)
+        ret = json_api.saved_queries.SavedQuery.load_trusted(data=data)
+        assert isinstance(ret, json_api.saved_queries.SavedQuery)
+        assert ret.to_dict() == exp.to_dict()
+
+    def test_load_trusted_extra_attributes(self):
+        @dataclasses.dataclass
+        class SomeModel(BaseModel):
+            test: int
+
+            @staticmethod
+            def get_schema_cls():
+                return SomeSchema
+
+        class SomeSchema(BaseSchemaJson):
+            test = marshmallow.fields.Int()
+
+            class Meta:
+                """Pass."""
+
+                type_ = "some_schema"
+
+            @staticmethod
+            def get_model_cls():
+                return SomeModel
+
+        with pytest.warns(ExtraAttributeWarning):
+            ret = SomeSchema.load_trusted(
+                data={"data": {"type": "some_schema", "attributes": {"test": 1, "extra": 2}}}
+            )
+        assert ret.test == 1
+        assert ret.extra_attributes == {"extra": 2}
+
+        with pytest.raises(SchemaError):
+            SomeSchema.load_trusted(data={"data": {"type": "some_schema", "attributes": {}}})
+
+        with pytest.raises(SchemaError) as exc:
+            SomeSchema.load_trusted(data=1)
+        assert "Data to load must be a dictionary" in str(exc.value)
+
+    def test_load_trusted_hooks(self):
+        schema = json_api.tasks.TaskBasicSchema
+        assert not schema.can_load_trusted()
+
+    def test_load_trusted_many(self):
+        schema = json_api.saved_queries.SavedQuerySchema
+        data = get_trusted_data(count=50)
+        for idx, item in enumerate(data["data"]):
+            attributes = item["attributes"]
+            attributes["name"] = f"badwolf {idx}"
+            attributes["private"] = "true" if idx % 2 else "false"
+            attributes["tags"] = [f"tag{x}" for x in range(idx % 3)]
+            if idx % 5 == 0:
+                attributes.pop("last_updated")
+
+        exp = schema.load_response(data=copy.deepcopy(data))
+        ret = schema.load_trusted(data=copy.deepcopy(data))
+        assert len(ret) == len(exp) == 50
+        for ret_item, exp_item in zip(ret, exp):
+            assert type(ret_item) is type(exp_item)
+            assert ret_item.to_dict() == exp_item.to_dict()
+            assert ret_item.private is exp_item.private
+            assert ret_item.last_updated == exp_item.last_updated
+            assert ret_item.extra_attributes == exp_item.extra_attributes
+
+    @pytest.mark.benchmark
+    def test_load_trusted_benchmark(self, capsys):
+        schema = json_api.saved_queries.SavedQuerySchema
+        data = get_trusted_data(count=1000)
+        schema.load_trusted(data=get_trusted_data(count=1))
+
+        start = time.perf_counter()
+        exp = schema.load_response(data=copy.deepcopy(data))
+        validated = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ret = schema.load_trusted(data=copy.deepcopy(data))
+        trusted = time.perf_counter() - start
+
+        assert [x.to_dict() for x in ret] == [x.to_dict() for x in exp]
+        with capsys.disabled():
+            print(
+                f"\nload {len(ret)} saved queries validated: {validated:.3f}s,"
+                f" trusted: {trusted:.3f}s"
+            )
+
+    @pytest.mark.parametrize(
+        "schema,attributes",
+        [
+            [
+                json_api.tasks.TaskFullSchema,
+                [
+                    {
+                        "uuid": "1",
+                        "pretty_id": 1,
+                        "date_fetched": "2023-01-01",
+                        "enforcement": "badwolf",
+                        "enforcement_id": "e1",
+                        "task_name": "badwolf task 1",
+                        "result": {"main": {"name": "action"}},
+                        "started": "2023-01-01T00:00:00Z",
+                        "finished": "2023-01-01T00:01:00Z",
+                    },
+                    {
+                        "uuid": "2",
+                        "pretty_id": 2,
+                        "date_fetched": "2023-01-02",
+                        "enforcement": "badwolf",
+                        "enforcement_id": "e1",
+                        "task_name": "badwolf task 2",
+                        "view": None,
+                        "started": None,
+                    },
+                ],
+            ],
+            [
+                json_api.adapters.AdapterFetchHistorySchema,
+                [
+                    {
+                        "adapter": {"text": "AWS", "icon": "aws_adapter"},
+                        "adapter_discovery_id": "d1",
+                        "client_id": "c1",
+                        "client": "client1",
+                        "devices_count": 10,
+                        "users_count": None,
+                        "start_time": "2023-01-01T00:00:00Z",
+                        "end_time": "2023-01-01T00:01:00Z",
+                        "fetch_events_count": {"warning": 1},
+                        "realtime": "false",
+                        "status": "success",
+                        "has_configuration_changed": True,
+                    },
+                    {
+                        "adapter": {"text": "Okta", "icon": "okta_adapter"},
+                        "adapter_discovery_id": "d2",
+                        "client_id": "c2",
+                        "start_time": "2023-01-02T00:00:00Z",
+                        "end_time": None,
+                        "realtime": True,
+                        "status": "failure",
+                        "error": "badwolf",
+                        "has_configuration_changed": "false",
+                        "unknown_attr": 1,
+                    },
+                ],
+            ],
+            [
+                json_api.system_users.SystemUserSchema,
+                [
+                    {
+                        "user_name": "admin",
+                        "role_id": "r1",
+                        "uuid": "u1",
+                        "email": "admin@example.com",
+                        "last_login": "2023-01-01T00:00:00Z",
+                        "last_updated": "2023-01-02T00:00:00Z",
+                        "source": "internal",
+                        "ignore_role_assignment_rules": "true",
+                        "allowed_scopes_impersonation": ["s1"],
+                    },
+                    {
+                        "user_name": "badwolf",
+                        "role_id": "r2",
+                        "uuid": "u2",
+                        "first_name": None,
+                        "ignore_role_assignment_rules": None,
+                    },
+                ],
+            ],
+        ],
+    )
+    def test_load_trusted_equivalent(self, schema, attributes):
+        assert schema.can_load_trusted()
+        data = {
+            "data": [
+                {"type": schema.Meta.type_, "id": str(idx), "attributes": item}
+                for idx, item in enumerate(attributes)
+            ]
+        }
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ExtraAttributeWarning)
+            exp = schema.load_response(data=copy.deepcopy(data))
+            ret = schema.load_trusted(data=copy.deepcopy(data))
+
+        assert len(ret) == len(exp) == len(attributes)
+        for ret_item, exp_item in zip(ret, exp):
+            assert type(ret_item) is type(exp_item)
+            assert ret_item.to_dict() == exp_item.to_dict()
+            assert ret_item.extra_attributes == exp_item.extra_attributes
+            for field in dataclasses.fields(exp_item):
+                ret_value = getattr(ret_item, field.name)
+                exp_value = getattr(exp_item, field.name)
+                assert type(ret_value) is type(exp_value), field.name
+                assert ret_value == exp_value, field.name
+
+
+class TestCompactModel:
+    @pytest.fixture
+    def model(self):
+        data = {
+            "data": {
+                "type": "audit_schema",
+                "attributes": {
+                    "action": "login",
+                    "category": "user",
+                    "date": "2023-01-01T00:00:00Z",
+                    "message": "badwolf",
+                    "type": "info",
+                    "user": "admin",
+                },
+            }
+        }
+        return json_api.audit_logs.AuditLog.load_response(data=data)
+
+    def test_to_compact(self, model):
+        row = model.to_compact()
+        assert isinstance(row, json_api.base.CompactModel)
+        assert type(row) is model.get_compact_cls()
+        assert not isinstance(row, type(model))
+        assert isinstance(row.to_model(), type(model))
+        assert row.to_dict() == model.to_dict()
+        assert str(row) == str(model)
+        assert repr(row) == repr(model)
+        assert row == model
+        assert row["message"] == "badwolf"
+        assert row.message == "badwolf"
+        assert row.hours_ago == model.hours_ago
+        assert row.to_model() == model
+
+        with pytest.raises(AttributeError):
+            object.__getattribute__(row, "__dict__")
+
+        with pytest.raises(AttributeError):
+            row.badwolf
+
+    def test_to_compact_extra_attributes(self, model):
+        model._extra_attributes = {"extra": 2}
+        row = model.to_compact()
+        assert row.extra_attributes == {"extra": 2}
+        assert row.to_model().extra_attributes == {"extra": 2}
+
+    def test_to_compact_memory(self, model):
+        """Compact rows must store only the fields of the model in slots."""
+        row = model.to_compact()
+        fields = tuple(x.name for x in dataclasses.fields(model))
+        assert type(row).__slots__ == (*fields, "HTTP", "_extra_attributes")
+        assert json_api.base.CompactModel.__slots__ == ()
+        assert not hasattr(row, "__dict__")
+        assert not hasattr(row, "__weakref__")
+        assert row.to_dict() == model.to_dict()
+        assert str(row) == str(model)
@@ -0,0 +1,131 @@
+import threading
+
+import requests
+
+from axonius_api_client.api.json_api.paging_state import PagingState, get_response_bytes
+
+
+class FakeHttp:
+    LAST_RESPONSE = None
+
+    def __init__(self):
+        self.THREAD_RESPONSES = threading.local()
+
+    def get_thread_response(self):
+        return getattr(self.THREAD_RESPONSES, "response", None)
+
+    def send(self, body):
+        response = requests.Response()
+        response._content = body
+        self.LAST_RESPONSE = self.THREAD_RESPONSES.response = response
+        return response
+
+
+class FakePage:
+    offset = 0
+    limit = 0
+
+
+class FakeRequest:
+    page = FakePage()
+
+
+class FakeApi:
+    def __init__(self, rows=35, body=b"x" * 100):
+        self.http = FakeHttp()
+        self.rows = rows
+        self.body = body
+
+    def get(self, request_obj):
+        self.http.send(body=self.body)
+        offset = request_obj.page.offset
+        return list(range(offset, min(offset + request_obj.page.limit, self.rows)))
+
+
+def fetch(state, api):
+    rows = []
+    with state:
+        while not state.stop_paging:
+            page = state.page(method=api.get, request_obj=FakeRequest())
+            rows += list(page.rows)
+    return rows
+
+
+class TestPagingState:
+    def test_history_bounded(self):
+        state = PagingState(page_size=10)
+        rows = fetch(state=state, api=FakeApi())
+        assert rows == list(range(35))
+        assert state.page_number == 5
+        assert len(state.page_history) == 1
+        assert state.page_history[-1].page_number == 5
+        assert len(state.page_metrics) == 5
+
+    def test_history_size(self):
+        state = PagingState(page_size=10, history_size=None, metrics_size=2)
+        fetch(state=state, api=FakeApi())
+        assert [x.page_number for x in state.page_history] == [1, 2, 3, 4, 5]
+        assert len(state.page_metrics) == 2
+
+    def test_metrics(self):
+        state = PagingState(page_size=10)
+        assert state.rows_per_second is None
+        assert state.latency_mean is None
+        assert state.latency_p95 is None
+        assert state.bytes_mean is None
+
+        state.page_metrics.extend([(1.0, 10, 100), (3.0, 10, 300), (2.0, 0, None)])
+        assert state.rows_per_second == round(20 / 6, 2)
+        assert state.latency_mean == 2.0
+        assert state.latency_p95 == 3.0
+        assert state.bytes_mean == 200
+        for prop in ["rows_per_second", "latency_mean", "latency_p95", "bytes_mean"]:
+            assert f"{prop}=" in str(state)
+
+    def test_page_bytes(self):
+        state = PagingState(page_size=10)
+        fetch(state=state, api=FakeApi(body=b"x" * 50))
+        assert state.page_history[-1].response_bytes == 50
+        assert state.bytes_mean == 50
+
+    def test_page_bytes_other_thread(self):
+        class FakeApiOtherThread(FakeApi):
+            def get(self, request_obj):
+                rows = super().get(request_obj=request_obj)
+                other = threading.Thread(target=self.http.send, kwargs={"body": b"x" * 999})
+                other.start()
+                other.join()
+                return rows
+
+        api = FakeApiOtherThread(body=b"x" * 50)
+        state = PagingState(page_size=10)
+        fetch(state=state, api=api)
+        assert api.http.LAST_RESPONSE.content == b"x" * 999
+        assert [x[2] for x in state.page_metrics] == [50] * 5
+        assert state.page_history[-1].response_bytes == 50
+
+    def test_page_method_kwargs(self):
+        class FakeApiTrusted(FakeApi):
+            def get(self, request_obj, trusted=False):
+                self.trusted.append(trusted)
+                return super().get(request_obj=request_obj)
+
+        api = FakeApiTrusted()
+        api.trusted = []
+        state = PagingState(page_size=10)
+        with state:
+            while not state.stop_paging:
+                page = state.page(method=api.get, request_obj=FakeRequest(), trusted=True)
+                list(page.rows)
+        assert api.trusted == [True] * 5
+
+    def test_get_response_bytes(self):
+        assert get_response_bytes(response=None) is None
+        response = requests.Response()
+        response._content = False
+        response.headers["Content-Length"] = "123"
+        assert get_response_bytes(response=response) == 123
+        response.headers.pop("Content-Length")
+        assert get_response_bytes(response=response) is None
+        response._content = b"abc"
+        assert get_response_bytes(response=response) == 3
@@ -105,6 +105,32 @@ class TestGrabber:
         grabber = Grabber.from_csv_path(path=path)
         assert grabber.count_found == grabber.count_supplied == CNT
 
+    def test_from_jsonl_path_stream(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Grabber, "errors_max", 1)
+        path = tmp_path / "test.jsonl"
+        path.write_text("#\n\n" + fake_jsonl(other=[{"x": 1}, {"y": 2}]))
+        grabber = Grabber.from_jsonl_path(path=path, stream=True)
+        assert grabber.count_found == CNT
+        assert grabber.count_supplied == grabber.count_items == CNT + 2
+        assert grabber.count_errors == 2
+        assert len(grabber.hunters) == 1
+        assert not isinstance(grabber.items, list)
+        assert grabber.reader.bytes_read == grabber.reader.size
+        assert "Only the first 1 of 2" in "\n".join(grabber.error_msgs)
+
+    def test_from_csv_path_stream(self, tmp_path):
+        path = tmp_path / "test.csv"
+        path.write_text(fake_csv(), encoding="utf-8-sig")
+        grabber = Grabber.from_csv_path(path=path, stream=True)
+        assert grabber.count_found == grabber.count_supplied == CNT
+        assert grabber.hunters == []
+
+    def test_from_jsonl_path_stream_empty(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        path.write_text("\n")
+        with pytest.raises(GrabberError, match=Grabber._titems_empty):
+            Grabber.from_jsonl_path(path=path, stream=True)
+
     def test_from_text(self):
         grabber = Grabber.from_text(items="#\n\n" + fake_csv())
         assert grabber.count_found == CNT
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Test suite."""
+import re
+
+import pytest
+
+from axonius_api_client.parsers.matcher import (
+    SUBSTRINGS_MIN,
+    Matcher,
+    Substrings,
+    combine_patterns,
+)
+
+
+class TestSubstrings:
+    @pytest.mark.parametrize(
+        "strings,value,exp",
+        [
+            (["he", "she", "his", "hers"], "ushers", True),
+            (["he", "she", "his", "hers"], "ahisb", True),
+            (["he", "she", "his", "hers"], "xyz", False),
+            (["abcd", "bce"], "abce", True),
+            (["abcd", "bce"], "abcx", False),
+            (["aab"], "aaab", True),
+            ([], "anything", False),
+        ],
+    )
+    def test_search(self, strings, value, exp):
+        assert Substrings(strings).search(value) is exp
+
+
+class TestCombinePatterns:
+    def test_combine(self):
+        patterns = [re.compile("^a", re.I), re.compile("b$", re.I), re.compile("c")]
+        combined = combine_patterns(patterns)
+        assert len(combined) == 2
+        for value in ["Ax", "xB", "c", "C", "x"]:
+            exp = any(x.search(value) for x in patterns)
+            assert any(x.search(value) for x in combined) is exp
+
+    def test_uncombinable(self):
+        patterns = [re.compile(r"(a)\1"), re.compile("(?i)b"), re.compile("c")]
+        assert combine_patterns(patterns) == patterns
+
+    def test_groups(self):
+        matcher = Matcher(values=["~^(x)y$", "~^(a)?(?(1)b|c)$"])
+        assert matcher.search("ab") is True
+        assert matcher.search("c") is True
+        assert matcher.search("xy") is True
+        assert matcher.search("ac") is False
+
+
+class TestMatcher:
+    def test_equals(self):
+        matcher = Matcher(values="foo,bar,~^ba[rz]$")
+        assert matcher.strings == ["foo", "bar"]
+        assert matcher.equals("foo") is True
+        assert matcher.equals("BAZ") is True
+        assert matcher.equals("BAZ", patterns=False) is False
+        assert matcher.equals("food") is False
+        assert matcher.equals(None) is False
+
+    def test_contains(self):
+        matcher = Matcher(values=[f"secret{x}" for x in range(SUBSTRINGS_MIN)])
+        assert matcher.substrings is not None
+        assert matcher.contains("my secret19 value") is True
+        assert matcher.contains("my secret value") is False
+
+        matcher = Matcher(values=[f"secret{x}" for x in range(20)])
+        assert matcher.substrings is None
+        assert matcher.contains("my secret19 value") is True
+        assert matcher.contains("my secret value") is False
+
+        matcher = Matcher(values="secret")
+        assert matcher.substrings is None
+        assert matcher.contains("my secret value") is True
+
+    def test_hide_values(self):
+        matcher = Matcher(values="password,~token")
+        value = {"password": "x", "api_token": "y", "user": "z"}
+        assert matcher.hide_values(value) == {
+            "password": matcher.hidden,
+            "api_token": matcher.hidden,
+            "user": "z",
+        }
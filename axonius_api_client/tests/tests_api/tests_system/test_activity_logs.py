@@ -6,7 +6,9 @@ import datetime
 import pytest
 
 from axonius_api_client.api import json_api
+from axonius_api_client.api.system.activity_logs import ActivityLogs
 from axonius_api_client.exceptions import ApiError
+from axonius_api_client.tools import dt_now
 
 
 class ActivityLogsBase:
@@ -54,3 +56,70 @@ class TestActivityLogsPublic(ActivityLogsBase):
         data = apiobj.get(within_last_hours=-1)
         assert isinstance(data, list)
         assert not data
+
+    def test_get_within_last_hours_server(self, apiobj):
+        data = apiobj.get(within_last_hours=12, prefetch_pages=0)
+        assert isinstance(data, list)
+        for row in data:
+            assert row.hours_ago <= 13
+
+
+class FakeAuth:
+    http = None
+
+    def login(self):
+        pass
+
+
+class TestActivityLogsFake:
+    @pytest.fixture
+    def apiobj(self):
+        now = dt_now()
+        rows = [
+            json_api.audit_logs.AuditLog(
+                action="login",
+                category="user",
+                date=now - datetime.timedelta(hours=x),
+                message=f"message {x}",
+                type="info",
+                user="admin",
+            )
+            for x in range(10)
+        ]
+        apiobj = ActivityLogs(auth=FakeAuth())
+        apiobj.calls = []
+
+        def _get(offset=0, limit=2, search="", date_from=None, date_to=None):
+            apiobj.calls.append({"offset": offset, "search": search, "date_from": date_from})
+            return rows[offset : offset + limit]
+
+        apiobj._get = _get
+        return apiobj
+
+    @pytest.mark.parametrize("prefetch_pages", [0, 1, 2])
+    def test_stop_at_start_date(self, apiobj, prefetch_pages):
+        data = apiobj.get(within_last_hours=3.5, page_size=2, prefetch_pages=prefetch_pages)
+        assert [x.message for x in data] == [f"message {x}" for x in range(4)]
+        assert apiobj.calls[0]["date_from"] is not None
+        assert len(apiobj.calls) <= 3 + prefetch_pages
+
+    def test_search(self, apiobj):
+        data = apiobj.get(page_size=2, message="message 1")
+        assert [x.message for x in data] == ["message 1"]
+        assert apiobj.calls[0]["search"] == "message 1"
+        assert len(apiobj.calls) == 6
+
+    def test_search_regex(self, apiobj):
+        data = apiobj.get(page_size=2, message="message [12]")
+        assert [x.message for x in data] == ["message 1", "message 2"]
+        assert apiobj.calls[0]["search"] == ""
+
+    def test_max_rows(self, apiobj):
+        data = apiobj.get(page_size=2, max_rows=3)
+        assert len(data) == 3
+
+    def test_compact(self, apiobj):
+        data = apiobj.get(page_size=2, max_rows=3, compact=True)
+        assert all(isinstance(x, json_api.base.CompactModel) for x in data)
+        assert [x.message for x in data] == [f"message {x}" for x in range(3)]
+        assert data[0].hours_ago < 1
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Test suite."""
+import time
+
+import pytest
+
+from axonius_api_client.api.system.dashboard_spaces import DashboardSpaces
+from axonius_api_client.exceptions import ApiError
+
+
+class FakeAuth:
+    http = None
+
+    def login(self):
+        pass
+
+
+class FakeSpace:
+    def __init__(self, name, uuid, charts=None):
+        self.name = name
+        self.uuid = uuid
+        self.charts_by_order = charts or []
+
+
+class FakeChart:
+    def __init__(self, apiobj, space, name, delay=0.0):
+        self.apiobj = apiobj
+        self.SPACE = space
+        self.name = name
+        self.uuid = f"{space.uuid}_{name}"
+        self.delay = delay
+
+    def export_to_csv(self, error=True):
+        time.sleep(self.delay)
+        return self.apiobj._export_chart_csv(uuid=self.uuid)
+
+    def __str__(self):
+        return self.name
+
+
+class TestDashboardSpacesFake:
+    @pytest.fixture
+    def apiobj(self):
+        apiobj = DashboardSpaces(auth=FakeAuth())
+        spaces = {f"s{x}": FakeSpace(name=f"space{x}", uuid=f"s{x}") for x in range(2)}
+        for space in spaces.values():
+            space.charts_by_order = [
+                FakeChart(apiobj=apiobj, space=space, name=f"chart{x}", delay=0.1 if x else 0.3)
+                for x in range(2)
+            ]
+
+        def _export_chart_csv(uuid):
+            if uuid == "s1_chart1":
+                raise ApiError(f"failed {uuid}")
+            return f"uuid\n{uuid}\n"
+
+        apiobj._get = lambda: [FakeSpace(name=x.name, uuid=x.uuid) for x in spaces.values()]
+        apiobj._get_single = lambda uuid: spaces[uuid]
+        apiobj._export_chart_csv = _export_chart_csv
+        return apiobj
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_get(self, apiobj, concurrency):
+        spaces = apiobj.get(concurrency=concurrency)
+        assert [x.name for x in spaces] == ["space0", "space1"]
+        assert [len(x.charts_by_order) for x in spaces] == [2, 2]
+
+    def test_get_error(self, apiobj):
+        def _get_single(uuid):
+            raise ApiError(f"failed {uuid}")
+
+        apiobj._get_single = _get_single
+        with pytest.raises(ApiError):
+            apiobj.get(concurrency=4)
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_export_charts_to_csv(self, apiobj, concurrency):
+        data = apiobj.export_charts_to_csv(concurrency=concurrency)
+        assert [x.uuid for x, _ in data] == ["s0_chart0", "s0_chart1", "s1_chart0", "s1_chart1"]
+        for chart, csv in data[:3]:
+            assert csv == f"uuid\n{chart.uuid}\n"
+
+        chart, csv = data[3]
+        assert "export_chart_csv_error" in csv.splitlines()[0]
+        assert "failed s1_chart1" in csv
+
+    def test_export_charts_to_csv_error(self, apiobj):
+        with pytest.raises(ApiError):
+            apiobj.export_charts_to_csv(error=True, concurrency=4)
+
+    def test_export_charts_to_csv_matchers(self, apiobj):
+        data = apiobj.export_charts_to_csv(spaces="space1", charts="chart0", concurrency=4)
+        assert [x.uuid for x, _ in data] == ["s1_chart0"]
+
+    def test_export_charts_to_csv_path(self, apiobj, tmp_path):
+        data = apiobj.export_charts_to_csv_path(path=tmp_path, concurrency=4)
+        # chart0 of each space takes the longest, so it is written last
+        assert [x.name for x, _, _ in data][-2:] == ["chart0", "chart0"]
+        assert sorted(x.uuid for x, _, _ in data) == [
+            "s0_chart0",
+            "s0_chart1",
+            "s1_chart0",
+            "s1_chart1",
+        ]
+        for chart, csv, path in data:
+            assert path.parent == tmp_path
+            assert path.name.startswith(f"{chart.SPACE.name}__{chart.name}__")
+            assert path.read_text() == csv
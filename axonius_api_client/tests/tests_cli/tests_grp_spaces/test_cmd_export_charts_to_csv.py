@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Test suite."""
+import pathlib
+
+from click.testing import CliRunner
+
+from axonius_api_client.cli import cli
+from axonius_api_client.cli.context import Context
+
+
+class FakeChart:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeDashboardSpaces:
+    def __init__(self):
+        self.kwargs = {}
+
+    def export_charts_to_csv_path(self, generator=False, **kwargs):
+        self.kwargs = kwargs
+        path = pathlib.Path(kwargs["path"])
+        for name, data in [("good", "uuid\nx\n"), ("bad", "export_chart_csv_error,chart\n")]:
+            yield FakeChart(name=name), data, path / f"{name}.csv"
+
+
+class FakeClient:
+    def __init__(self):
+        self.dashboard_spaces = FakeDashboardSpaces()
+
+
+class TestCmdExportChartsToCsv:
+    def test_concurrency(self, monkeypatch):
+        client = FakeClient()
+        monkeypatch.setattr(Context, "start_client", lambda *args, **kwargs: client)
+        runner = CliRunner(mix_stderr=False)
+        with runner.isolated_filesystem():
+            args = [
+                "spaces",
+                "export-charts-to-csv",
+                "--url",
+                "https://x",
+                "--key",
+                "a",
+                "--secret",
+                "b",
+                "--concurrency",
+                "3",
+            ]
+            result = runner.invoke(cli=cli, args=args)
+
+        assert result.exit_code == 0, result.stderr
+        assert client.dashboard_spaces.kwargs["concurrency"] == 3
+        assert client.dashboard_spaces.kwargs["error"] is False
+        assert "good.csv written with no errors" in result.stderr
+        assert "bad.csv written with errors" in result.stderr
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.connect_async."""
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+
+from axonius_api_client.api import Devices
+from axonius_api_client.api.api_endpoints import ApiEndpoints
+from axonius_api_client.api.json_api.assets import HistoryDates
+from axonius_api_client.connect import Connect
+from axonius_api_client.connect_async import (
+    AsyncConnect,
+    AsyncIterator,
+    AsyncProxy,
+    get_shared_executor,
+)
+from axonius_api_client.constants.api import ASYNC_WORKERS
+
+
+class FakeConnect(Connect):
+    def __init__(self):
+        self.starts = 0
+
+    def start(self):
+        time.sleep(0.05)
+        self.starts += 1
+        self.STARTED = True
+
+
+class TestAsyncConnectFake:
+    def test_start_once(self):
+        fake = FakeConnect()
+        client = AsyncConnect(client=fake, max_workers=4)
+
+        async def main():
+            await asyncio.gather(*[client.start() for _ in range(4)])
+            await client.start()
+            await client.close()
+
+        asyncio.run(main())
+        assert fake.starts == 1
+
+    def test_shared_executor(self):
+        clients = [AsyncConnect(client=FakeConnect()) for _ in range(3)]
+        executor = get_shared_executor()
+        assert all(x.executor is executor for x in clients)
+        assert all(not x.executor_owned for x in clients)
+        assert clients[0].max_workers == ASYNC_WORKERS
+
+        async def main():
+            await asyncio.gather(*[x.start() for x in clients])
+            for client in clients:
+                await client.close()
+            return await clients[0].run(lambda: 1)
+
+        assert asyncio.run(main()) == 1
+        assert get_shared_executor() is executor
+
+    def test_own_executor(self):
+        client = AsyncConnect(client=FakeConnect(), max_workers=2)
+        assert client.executor_owned
+        assert client.executor is not get_shared_executor()
+        assert client.max_workers == 2
+        asyncio.run(client.close())
+        with pytest.raises(RuntimeError):
+            client.executor.submit(time.sleep, 0)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            client = AsyncConnect(client=FakeConnect(), executor=executor)
+            assert client.executor is executor
+            assert not client.executor_owned
+            asyncio.run(client.close())
+            assert executor.submit(lambda: 1).result() == 1
+
+
+class TestAsyncConnect:
+    def test_proxy(self, api_client):
+        client = AsyncConnect(client=api_client)
+        proxy = client.devices.fields
+        assert isinstance(proxy, AsyncProxy)
+        assert "devices" in dir(client)
+
+        with pytest.raises(AttributeError):
+            client.badwolf
+
+        async def main():
+            async with client:
+                return await client.devices
+
+        assert isinstance(asyncio.run(main()), Devices)
+
+    def test_count_gather(self, api_client):
+        client = AsyncConnect(client=api_client, max_workers=2)
+
+        async def main():
+            async with client:
+                return await asyncio.gather(client.devices.count(), client.users.count())
+
+        devices, users = asyncio.run(main())
+        assert devices == api_client.devices.count()
+        assert users == api_client.users.count()
+
+    def test_get_generator(self, api_client):
+        client = AsyncConnect(client=api_client)
+
+        async def main():
+            async with client:
+                rows = await client.devices.get(generator=True, max_rows=2)
+                assert isinstance(rows, AsyncIterator)
+                return [x async for x in rows]
+
+        rows = asyncio.run(main())
+        assert isinstance(rows, list) and len(rows) <= 2
+        for row in rows:
+            assert isinstance(row, dict)
+
+    def test_perform_request(self, api_client):
+        client = AsyncConnect(client=api_client)
+
+        async def main():
+            async with client:
+                return await client.perform_request(endpoint=ApiEndpoints.assets.history_dates)
+
+        assert isinstance(asyncio.run(main()), HistoryDates)
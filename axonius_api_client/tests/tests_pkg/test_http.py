@@ -8,7 +8,7 @@ import requests
 import urllib3.exceptions
 
 from axonius_api_client.exceptions import HttpError
-from axonius_api_client.http import Http
+from axonius_api_client.http import Http, HttpRetry
 from axonius_api_client.projects.url_parser import UrlParser
 from axonius_api_client.projects import cert_human
 from axonius_api_client.version import __version__
@@ -52,6 +52,56 @@ class TestHttp:
         http = Http(url=ax_url)
         assert __version__ in http.user_agent
 
+    def test_session_adapter(self, request):
+        """Test pool and retry settings are applied to the session adapter."""
+        ax_url = get_arg_url(request)
+        http = Http(
+            url=ax_url,
+            pool_maxsize=25,
+            pool_block=True,
+            max_retries=4,
+            retry_backoff=2,
+            keep_alive=False,
+        )
+        adapter = http.session.get_adapter(http.url)
+        assert adapter._pool_maxsize == 25
+        assert adapter._pool_block is True
+        assert isinstance(adapter.max_retries, HttpRetry)
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.status_forcelist == Http.RETRY_STATUSES
+        assert adapter.max_retries.respect_retry_after_header is True
+        assert http.session.headers["Connection"] == "close"
+
+    def test_retry_backoff_linear(self):
+        """Test retry backoff is multiplied by the number of consecutive errors."""
+        retry = HttpRetry(total=5, backoff_factor=3)
+        assert retry.get_backoff_time() == 0
+        retry = retry.increment(method="GET", url="/", error=requests.exceptions.ConnectionError())
+        assert retry.get_backoff_time() == 3
+        retry = retry.increment(method="GET", url="/", error=requests.exceptions.ConnectionError())
+        assert retry.get_backoff_time() == 6
+
+    def test_retry_backoff_max(self):
+        """Test retry backoff is capped at the default backoff max."""
+        retry = HttpRetry(total=5, backoff_factor=HttpRetry.DEFAULT_BACKOFF_MAX)
+        for _ in range(2):
+            retry = retry.increment(
+                method="GET", url="/", error=requests.exceptions.ConnectionError()
+            )
+        assert retry.get_backoff_time() == HttpRetry.DEFAULT_BACKOFF_MAX
+
+    def test_retry_methods(self):
+        """Test status retries for methods that are not idempotent need a Retry-After header."""
+        retry = HttpRetry(
+            total=3, status_forcelist=Http.RETRY_STATUSES, allowed_methods=Http.RETRY_METHODS
+        )
+        assert retry.is_retry(method="GET", status_code=502)
+        assert not retry.is_retry(method="POST", status_code=502)
+        assert not retry.is_retry(method="POST", status_code=503)
+        assert retry.is_retry(method="POST", status_code=503, has_retry_after=True)
+        assert retry.is_retry(method="POST", status_code=429, has_retry_after=True)
+        assert not retry.is_retry(method="POST", status_code=504, has_retry_after=True)
+
     # def test_certwarn_true(self, httpbin_secure):
     #     url = httpbin_secure.url
     #     http = Http(url=url, certwarn=True, save_history=True)
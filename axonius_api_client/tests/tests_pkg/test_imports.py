@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Test suite for the import time of axonius_api_client."""
+import json
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import axonius_api_client
+
+HEAVY_MODULES = [
+    "axonius_api_client.api.api_endpoints",
+    "axonius_api_client.api.json_api.assets",
+    "axonius_api_client.projects.cert_human.all_logs_list",
+    "xlsxwriter",
+]
+"""Modules that must not be imported until something uses them."""
+
+SCRIPT = """
+import json, sys
+{statement}
+print(json.dumps({{"modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    """Run statement in a fresh interpreter and get the loaded modules."""
+    script = SCRIPT.format(statement=textwrap.dedent(statement).strip())
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImports:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import axonius_api_client",
+            "from axonius_api_client.cli import cli",
+        ],
+    )
+    def test_heavy_modules_not_imported(self, statement):
+        modules = measure(statement)["modules"]
+        assert [x for x in HEAVY_MODULES if x in modules] == []
+
+    def test_lazy_attrs(self):
+        statement = "import axonius_api_client; axonius_api_client.Connect"
+        modules = measure(statement)["modules"]
+        assert "axonius_api_client.connect" in modules
+        assert "axonius_api_client.api.api_endpoints" in modules
+
+    def test_dir(self):
+        assert "Connect" in dir(axonius_api_client)
+        assert "LAZY_ATTRS" not in dir(axonius_api_client)
+        with pytest.raises(AttributeError):
+            axonius_api_client.badwolf
+
+    @pytest.mark.parametrize(
+        "module,names",
+        [
+            ("axonius_api_client", ["connect", "connect_async", "features", "parsers"]),
+            ("axonius_api_client.api", ["assets", "system", "api_endpoint", "asset_callbacks"]),
+            ("axonius_api_client.constants", ["enforcements"]),
+            ("axonius_api_client.projects.cert_human", ["all_logs_list"]),
+        ],
+    )
+    def test_submodules(self, module, names):
+        statement = f"""
+        import importlib, types
+        module = importlib.import_module({module!r})
+        for name in {names!r}:
+            assert name in dir(module)
+            assert isinstance(getattr(module, name), types.ModuleType)
+        """
+        measure(statement)
+
+    def test_full_import(self):
+        statement = "import axonius_api_client; axonius_api_client.api.ApiEndpoints"
+        modules = measure(statement)["modules"]
+        assert "axonius_api_client.api.api_endpoints" in modules
+        assert "axonius_api_client.projects.cert_human.all_logs_list" not in modules
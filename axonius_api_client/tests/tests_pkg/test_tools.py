@@ -2,7 +2,10 @@
 """Test suite for axonius_api_client."""
 import codecs
 import io
+import json
 import tempfile
+import threading
+import time
 from datetime import timezone
 
 import dateutil.tz
@@ -13,6 +16,8 @@ from axonius_api_client.constants.api import GUI_PAGE_SIZES
 from axonius_api_client.constants.general import IS_WINDOWS
 from axonius_api_client.exceptions import ToolsError
 from axonius_api_client.tools import (
+    Prefetcher,
+    _JsonStreamBuffer,
     bom_strip,
     calc_perc_gb,
     calc_percent,
@@ -26,6 +31,7 @@ from axonius_api_client.tools import (
     coerce_str,
     coerce_str_to_csv,
     combo_dicts,
+    concurrent_map,
     datetime,
     dt_days_left,
     dt_min_ago,
@@ -52,15 +58,20 @@ from axonius_api_client.tools import (
     is_url,
     join_kv,
     join_url,
+    get_json_backend,
+    json_decode,
     json_dump,
+    json_encode,
     json_load,
     json_reload,
+    json_stream,
     kv_dump,
     listify,
     longest_str,
     parse_int_min_max,
     parse_ip_address,
     parse_ip_network,
+    prefetch_merge,
     path_backup_file,
     path_create_parent_dir,
     path_read,
@@ -68,6 +79,7 @@ from axonius_api_client.tools import (
     pathlib,
     prettify_obj,
     read_stream,
+    set_json_backend,
     split_str,
     strip_left,
     strip_right,
@@ -1224,6 +1236,83 @@ class TestJsonDump:
         assert ret.splitlines() == exp
 
 
+
+class TestJsonBackend:
+    """Test set_json_backend, json_encode, and json_decode."""
+
+    @pytest.fixture
+    def backend(self):
+        orig = get_json_backend()
+        yield
+        set_json_backend(backend=orig)
+
+    def test_json(self, backend):
+        assert set_json_backend(backend="json") == "json"
+        assert get_json_backend() == "json"
+        obj = {"x": [1, "\u00e9"], "a": None}
+        assert json_encode(obj) == json.dumps(obj)
+        assert json_encode(obj, indent=2, sort_keys=True) == json.dumps(
+            obj, indent=2, sort_keys=True
+        )
+        assert json_decode(json_encode(obj)) == obj
+        assert json_decode(b'{"x": 1}') == {"x": 1}
+
+    def test_invalid(self, backend):
+        with pytest.raises(ToolsError):
+            set_json_backend(backend="badwolf")
+
+    def test_auto(self, backend):
+        exp = "json"
+        try:
+            import orjson  # noqa: F401
+
+            exp = "orjson"
+        except ImportError:
+            pass
+        assert set_json_backend(backend="auto") == exp
+        assert set_json_backend(backend=None) == exp
+
+    def test_orjson(self, backend):
+        pytest.importorskip("orjson")
+        now = datetime.datetime.utcnow()
+        obj = {"x": [1, "\u00e9\U0001f600"], 1: now, "d": IntValue(value=1), "s": {1}}
+        set_json_backend(backend="json")
+        exp = json_encode(obj, indent=2)
+        assert set_json_backend(backend="orjson") == "orjson"
+        assert json_encode(obj, indent=2) == exp
+        assert json_dump(obj) == exp
+        assert json_decode(json_encode(obj)) == json.loads(exp)
+        assert json_decode("NaN") != json_decode("NaN")
+        assert json_encode(2**70) == str(2**70)
+        assert json_encode({"y": 1}, indent=4) == json.dumps({"y": 1}, indent=4)
+        assert json_encode({"y": 1, "z": None}) == '{"y":1,"z":null}'
+        assert json_encode({"y": float("nan")}) == '{"y":null}'
+        assert json_encode({"b": 1, "a": "\u00e9"}, sort_keys=True) == '{"a":"\\u00e9","b":1}'
+        assert json_decode(json_encode(obj)) == json.loads(exp)
+
+    def test_orjson_error(self, backend):
+        pytest.importorskip("orjson")
+        set_json_backend(backend="orjson")
+        obj = {"x": 2**70}
+        assert json_encode(obj) == json.dumps(obj)
+        assert json_encode({"x": [2**70]}, indent=2) == json.dumps({"x": [2**70]}, indent=2)
+
+    def test_auto_flat(self, backend):
+        pytest.importorskip("orjson")
+        set_json_backend(backend="auto")
+        obj = {"y": 1, "z": [None, "\u00e9"]}
+        assert json_encode(obj) == json.dumps(obj)
+        assert json_encode(obj, indent=2) == json.dumps(obj, indent=2)
+
+    @pytest.mark.parametrize("name", ["json", "auto"])
+    def test_non_finite(self, backend, name):
+        set_json_backend(backend=name)
+        obj = {"nan": float("nan"), "inf": [float("inf"), -float("inf")], "none": None}
+        assert json_encode(obj) == json.dumps(obj)
+        assert json_encode(obj, indent=2) == json.dumps(obj, indent=2)
+        assert json_encode({"none": None}, indent=2) == json.dumps({"none": None}, indent=2)
+
+
 class TestDtParseTmpl:
     def test_valid(self):
         assert dt_parse_tmpl("2019-07-09T09:22:21") == "2019-07-09"
@@ -1499,3 +1588,185 @@ class TestGetPathsFormat:
         exp = pathlib.Path("/x/xxx/z/ddd_xxx.txt")
         ret = get_paths_format("/x", "{DATE}", "z", "ddd_{DATE}.txt", mapping={"{DATE}": "xxx"})
         assert exp == ret
+
+
+class TestPrefetcher:
+    @staticmethod
+    def get_fetch(items, error_at=None):
+        source = iter(items)
+        count = {"calls": 0}
+
+        def fetch():
+            count["calls"] += 1
+            if error_at is not None and count["calls"] == error_at:
+                raise ValueError("boom")
+            item = next(source)
+            return item, item == items[-1]
+
+        return fetch, count
+
+    def test_order(self):
+        items = list(range(20))
+        fetch, _ = self.get_fetch(items)
+        assert list(Prefetcher(fetch=fetch, size=3)) == items
+
+    def test_error(self):
+        fetch, _ = self.get_fetch(list(range(5)), error_at=3)
+        ret = []
+        with pytest.raises(ValueError):
+            for item in Prefetcher(fetch=fetch, size=2):
+                ret.append(item)
+        assert ret == [0, 1]
+
+    def test_stop_early(self):
+        items = list(range(100))
+        fetch, count = self.get_fetch(items)
+        prefetcher = Prefetcher(fetch=fetch, size=2)
+        for item in prefetcher:
+            if item == 4:
+                break
+        prefetcher.stop()
+        assert not prefetcher.thread.is_alive()
+        assert count["calls"] < len(items)
+
+
+class TestPrefetchMerge:
+    @staticmethod
+    def get_fetch(items):
+        source = iter(items)
+
+        def fetch():
+            item = next(source)
+            return item, item == items[-1]
+
+        return fetch
+
+    def test_ordered(self):
+        chunks = [list(range(x, x + 5)) for x in range(0, 20, 5)]
+        fetches = [self.get_fetch(x) for x in chunks]
+        ret = list(prefetch_merge(fetches=fetches, size=2, ordered=True))
+        assert ret == list(range(20))
+
+    def test_unordered(self):
+        chunks = [list(range(x, x + 5)) for x in range(0, 20, 5)]
+        fetches = [self.get_fetch(x) for x in chunks]
+        ret = list(prefetch_merge(fetches=fetches, size=2, ordered=False))
+        assert sorted(ret) == list(range(20))
+        for chunk in chunks:
+            assert [x for x in ret if x in chunk] == chunk
+
+
+class TestConcurrentMap:
+    @staticmethod
+    def func(item):
+        if item == 3:
+            raise ValueError("badwolf")
+        return item * 2
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_order_errors(self, concurrency):
+        ret = list(concurrent_map(func=self.func, items=range(6), concurrency=concurrency))
+        assert [x[0] for x in ret] == list(range(6))
+        assert [x[1] for x in ret] == [0, 2, 4, None, 8, 10]
+        assert isinstance(ret[3][2], ValueError)
+        assert [x[2] for x in ret if x[0] != 3] == [None] * 5
+
+    def test_bounded(self):
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def func(item):
+            with lock:
+                active.append(item)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(item)
+            return item
+
+        ret = [x[1] for x in concurrent_map(func=func, items=iter(range(20)), concurrency=3)]
+        assert ret == list(range(20))
+        assert max(peak) <= 3
+
+    def test_unordered(self):
+        def func(item):
+            time.sleep(0.2 if item == 0 else 0.01)
+            return item
+
+        ret = [
+            x[1]
+            for x in concurrent_map(func=func, items=range(6), concurrency=3, ordered=False)
+        ]
+        assert sorted(ret) == list(range(6))
+        assert ret[0] != 0
+
+    def test_stop_early(self):
+        ret = concurrent_map(func=self.func, items=range(100), concurrency=2)
+        assert next(ret) == (0, 0, None)
+        ret.close()
+
+
+class TestJsonStream:
+    body = {
+        "data": [{"attributes": {"id": x, "name": f"\u00e9 [{x}]"}} for x in range(20)],
+        "meta": {"page": {"number": 1, "size": 1.5e3}},
+        "count": 123456,
+    }
+
+    @pytest.mark.parametrize("size", [1, 7, 100000])
+    def test_chunks(self, size):
+        raw = json.dumps(self.body).encode()
+        chunks = [raw[x : x + size] for x in range(0, len(raw), size)]
+        ret = list(json_stream(chunks=chunks, key="data"))
+        assert [x[1] for x in ret if x[2]] == self.body["data"]
+        assert {x[0]: x[1] for x in ret if not x[2]} == {
+            "meta": self.body["meta"],
+            "count": self.body["count"],
+        }
+
+    @pytest.mark.parametrize(
+        "chunks",
+        [
+            ['{"data": [-25000000000.', '0], "count": 1', "2}"],
+            ['{"data": ["a\\', '"b]}", {"x": "\\\\"', ', "y": [[', "]]}], ", '"count": 12}'],
+            ['{"da', 'ta": [tr', "ue, nu", "ll], ", '"count": 1', "2}"],
+        ],
+    )
+    def test_split_values(self, chunks):
+        exp = json.loads("".join(chunks))
+        ret = list(json_stream(chunks=chunks, key="data"))
+        assert [x[1] for x in ret if x[2]] == exp["data"]
+        assert ("count", 12, False) in ret
+
+    def test_large_value(self):
+        body = {"data": [{"x": "a" * 200000, "y": list(range(20000))}]}
+        raw = json.dumps(body)
+        chunks = [raw[x : x + 16] for x in range(0, len(raw), 16)]
+        buf = _JsonStreamBuffer(chunks=chunks)
+        buf.take("{")
+        assert buf.value() == "data"
+        buf.take(":")
+        decode = buf.decode
+        calls = []
+
+        def spy(*args):
+            calls.append(args)
+            return decode(*args)
+
+        buf.decode = spy
+        assert buf.value() == body["data"]
+        assert len(calls) == 2
+
+    def test_not_list(self):
+        ret = list(json_stream(chunks=['{"data": null, "other": []}'], key="data"))
+        assert ret == [("data", None, False), ("other", [], False)]
+
+    def test_empty(self):
+        assert list(json_stream(chunks=["{}"], key="data")) == []
+        assert list(json_stream(chunks=['{"data": []}'], key="data")) == [("data", [], False)]
+
+    @pytest.mark.parametrize("value", ['{"data": [1,', '{"data" 1}', "[1]", '{"data": [1 2]}'])
+    def test_invalid(self, value):
+        with pytest.raises(json.JSONDecodeError):
+            list(json_stream(chunks=[value], key="data"))
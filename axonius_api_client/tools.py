@@ -1,5 +1,7 @@
 """Utilities and tools."""
 import codecs
+import collections
+import concurrent.futures
 import contextlib
 import csv
 import dataclasses
@@ -11,8 +13,10 @@ import json
 import logging
 import pathlib
 import platform
+import queue
 import re
 import sys
+import threading
 import types
 import typing as t
 import uuid
@@ -28,7 +32,7 @@ import marshmallow
 import typing_extensions as te
 
 from . import INIT_DOTENV, PACKAGE_FILE, PACKAGE_ROOT, VERSION
-from .constants.api import GUI_PAGE_SIZES, REFRESH, FolderDefaults
+from .constants.api import GUI_PAGE_SIZES, JSON_BACKEND, JSON_BACKENDS, REFRESH, FolderDefaults
 from .constants.ctypes import (
     PathLike,
     PatternLike,
@@ -62,7 +66,7 @@ from .constants.general import (
 )
 from .constants.logs import MAX_BODY_LEN
 from .exceptions import FormatError, ToolsError
-from .setup_env import find_dotenv, get_env_ax
+from .setup_env import KEY_JSON_BACKEND, find_dotenv, get_env_ax, get_env_str
 
 LOG: logging.Logger = logging.getLogger(PACKAGE_ROOT).getChild("tools")
 
@@ -469,6 +473,127 @@ def has_to_dict(obj: t.Any) -> bool:
     return hasattr(obj, "to_dict") and callable(obj.to_dict)
 
 
+JSON_STATE: dict = {"backend": "json", "module": None, "exact": True}
+"""Resolved JSON backend name and module, and if encoding must match json exactly,
+managed by :func:`set_json_backend`."""
+
+JSON_NON_ASCII: t.Pattern = re.compile(r"[^\x00-\x7f]")
+"""Pattern for characters that json.dumps escapes by default."""
+
+
+def set_json_backend(backend: t.Optional[str] = JSON_BACKEND) -> str:
+    """Set the JSON backend used by :func:`json_encode` and :func:`json_decode`.
+
+    Notes:
+        auto only uses orjson to encode when the output is the same as json. orjson always
+        uses orjson to encode an indent of None or 2, so flat json has no spaces after
+        separators and NaN and Infinity are encoded as null.
+
+    Args:
+        backend: one of :data:`axonius_api_client.constants.api.JSON_BACKENDS`, auto will use
+            orjson if it is installed and json if not
+
+    Returns:
+        str: name of the backend that is now in use
+    """
+    name = str(backend or JSON_BACKEND).strip().lower()
+    if name not in JSON_BACKENDS:
+        raise ToolsError(f"Invalid JSON backend {backend!r}, valid backends: {JSON_BACKENDS}")
+
+    module = None
+    if name != "json":
+        try:
+            import orjson as module
+        except ImportError as exc:
+            if name == "orjson":
+                raise ToolsError(f"JSON backend {name!r} is not installed: {exc}")
+
+    JSON_STATE["module"] = module
+    JSON_STATE["backend"] = "orjson" if module else "json"
+    JSON_STATE["exact"] = name != "orjson"
+    return JSON_STATE["backend"]
+
+
+def get_json_backend() -> str:
+    """Get the name of the JSON backend in use."""
+    return JSON_STATE["backend"]
+
+
+def json_escape_ascii(match: t.Match) -> str:
+    """Escape a non-ascii character the same way json.dumps does."""
+    code = ord(match.group(0))
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u{:04x}\\u{:04x}".format(0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u{:04x}".format(code)
+
+
+def json_default(obj: t.Any) -> t.Any:
+    """Serialize objects the orjson backend does not support the same way as AxJSONEncoder."""
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+
+    if has_to_dict(obj):
+        return obj.to_dict()
+
+    return str(obj)
+
+
+def json_encode(obj: t.Any, indent: t.Optional[int] = None, sort_keys: bool = False) -> str:
+    """Serialize an object into json str using the JSON backend in use.
+
+    Notes:
+        orjson only supports an indent of None or 2. If the backend was set to auto, orjson
+        is only used for an indent of 2 and json is used if the output has null, since
+        orjson turns NaN and Infinity into null. See :func:`set_json_backend`.
+
+    Args:
+        obj: object to serialize into json str
+        indent: json str indent level
+        sort_keys: sort dict keys
+    """
+    module = JSON_STATE["module"]
+    exact = JSON_STATE["exact"]
+    if module is not None and (indent == 2 or (indent is None and not exact)):
+        option = (
+            module.OPT_NON_STR_KEYS
+            | module.OPT_PASSTHROUGH_DATETIME
+            | module.OPT_PASSTHROUGH_DATACLASS
+        )
+        option |= module.OPT_INDENT_2 if indent == 2 else 0
+        option |= module.OPT_SORT_KEYS if sort_keys else 0
+        try:
+            value = module.dumps(obj, default=json_default, option=option).decode()
+        except (module.JSONEncodeError, TypeError) as exc:
+            LOG.debug(f"Unable to encode {type(obj)} with orjson, using json: {exc}")
+        else:
+            if not exact or "null" not in value:
+                return value if value.isascii() else JSON_NON_ASCII.sub(json_escape_ascii, value)
+
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys, cls=AxJSONEncoder, fallback=str)
+
+
+def json_decode(value: t.Union[str, bytes]) -> t.Any:
+    """Deserialize a json str or bytes into an object using the JSON backend in use.
+
+    Args:
+        value: json str or bytes to deserialize
+    """
+    module = JSON_STATE["module"]
+    if module is not None:
+        try:
+            return module.loads(value)
+        except Exception:
+            pass
+    return json.loads(value)
+
+
+try:
+    set_json_backend(get_env_str(key=KEY_JSON_BACKEND, default=JSON_BACKEND, empty_ok=True))
+except Exception as exc:  # pragma: no cover
+    LOG.warning(f"Unable to set JSON backend from OS env {KEY_JSON_BACKEND}: {exc}")
+
+
 def json_dump(
     obj: t.Any,
     indent: t.Optional[int] = 2,
@@ -494,6 +619,8 @@ def json_dump(
         obj = obj.to_dict()
 
     try:
+        if cls is AxJSONEncoder and fallback is str and not kwargs:
+            return json_encode(obj, indent=indent, sort_keys=sort_keys)
         return json.dumps(
             obj,
             indent=indent,
@@ -548,6 +675,8 @@ def json_load(
 
     if isinstance(load, (io.TextIOBase, io.BufferedIOBase)):
         method = json.load
+    elif isinstance(load, (str, bytes)) and not kwargs:
+        method = json_decode
 
     try:
         return method(load, **kwargs)
@@ -713,6 +842,208 @@ def json_log(
     )
 
 
+class _JsonStreamScanner:
+    """Find where a JSON value that spans chunks ends without decoding it for :func:`json_stream`.
+
+    Notes:
+        The depth, string, and escape state are kept between calls to :meth:`feed`, so each
+        chunk is only scanned once no matter how many chunks the value spans.
+    """
+
+    TOKENS: t.Pattern = re.compile(r'[\[\]{}"]')
+    STRING: t.Pattern = re.compile(r'["\\]')
+    SCALAR_END: t.Pattern = re.compile(r"[\s,:\]}]")
+
+    def __init__(self):
+        """Pass."""
+        self.depth: int = 0
+        self.in_string: bool = False
+        self.escape: bool = False
+        self.scalar: t.Optional[bool] = None
+
+    def feed(self, text: str) -> bool:
+        """Scan the next text of the value and check if the value ends in it."""
+        if self.scalar is None:
+            self.scalar = text[:1] not in '[{"'
+        if self.scalar:
+            return bool(self.SCALAR_END.search(text))
+
+        idx = 0
+        while True:
+            if self.escape:
+                if idx >= len(text):
+                    return False
+                idx += 1
+                self.escape = False
+
+            if self.in_string:
+                match = self.STRING.search(text, idx)
+                if not match:
+                    return False
+                idx = match.end()
+                if match.group() == "\\":
+                    self.escape = True
+                    continue
+                self.in_string = False
+                if not self.depth:
+                    return True
+                continue
+
+            match = self.TOKENS.search(text, idx)
+            if not match:
+                return False
+            idx = match.end()
+            char = match.group()
+            if char == '"':
+                self.in_string = True
+            elif char in "[{":
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if not self.depth:
+                    return True
+
+
+class _JsonStreamBuffer:
+    """Buffer of text decoded from chunks for :func:`json_stream`."""
+
+    WHITESPACE: str = " \t\n\r"
+    DELIMITERS: str = " \t\n\r,:]}"
+
+    def __init__(self, chunks: t.Iterable[t.Union[str, bytes]], encoding: str = "utf-8"):
+        """Pass."""
+        self.chunks: t.Iterator[t.Union[str, bytes]] = iter(chunks)
+        self.decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(encoding)(
+            errors="replace"
+        )
+        self.decode: t.Callable[..., t.Any] = json.JSONDecoder().raw_decode
+        self.buf: str = ""
+        self.pos: int = 0
+        self.done: bool = False
+
+    def next_text(self) -> t.Optional[str]:
+        """Get the text of the next chunk that is not empty, or None if there are no more."""
+        while not self.done:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.done = True
+                chunk = self.decoder.decode(b"", final=True)
+            elif isinstance(chunk, bytes):
+                chunk = self.decoder.decode(chunk)
+
+            if chunk:
+                return chunk
+        return None
+
+    def read(self) -> bool:
+        """Add the next chunk to the buffer, dropping the text that has been parsed."""
+        chunk = self.next_text()
+        if chunk is None:
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Get the next non whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.read():
+                raise json.JSONDecodeError("Unexpected end of data", self.buf, self.pos)
+
+    def take(self, *chars: str) -> str:
+        """Consume the next non whitespace character, which must be one of chars."""
+        char = self.peek()
+        if char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buf, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> t.Any:
+        """Consume the next complete JSON value.
+
+        Notes:
+            If the value does not end in the buffer, the chunks are scanned by
+            :obj:`_JsonStreamScanner` until it ends and the value is decoded once, instead of
+            decoding it again from its start for every chunk.
+        """
+        self.peek()
+        try:
+            value, end = self.decode(self.buf, self.pos)
+        except json.JSONDecodeError:
+            if self.done:
+                raise
+        else:
+            # a number at the end of the buffer may continue in the next chunk
+            if self.done or (end < len(self.buf) and self.buf[end] in self.DELIMITERS):
+                self.pos = end
+                return value
+
+        scanner = _JsonStreamScanner()
+        parts = [self.buf[self.pos :]]
+        complete = scanner.feed(parts[0])
+        while not complete:
+            chunk = self.next_text()
+            if chunk is None:
+                break
+            parts.append(chunk)
+            complete = scanner.feed(chunk)
+
+        self.buf = "".join(parts)
+        self.pos = 0
+        value, self.pos = self.decode(self.buf, self.pos)
+        return value
+
+
+def json_stream(
+    chunks: t.Iterable[t.Union[str, bytes]], key: str, encoding: str = "utf-8"
+) -> t.Generator[t.Tuple[str, t.Any, bool], None, None]:
+    """Incrementally deserialize a json object, yielding the items of one list as they are parsed.
+
+    Notes:
+        Only the text of the value currently being parsed is kept in memory, so the items of
+        the list at key can be processed and discarded before the rest of the json is received.
+
+    Args:
+        chunks: str or bytes of a json object, i.e. :meth:`requests.Response.iter_content`
+        key: key in the json object of the list to yield the items of
+        encoding: encoding to decode chunks of bytes with
+
+    Yields:
+        tuple of (key, value, is_item), where is_item is True for each item of the list at key,
+        and False for all other keys of the json object
+    """
+    buf = _JsonStreamBuffer(chunks=chunks, encoding=encoding)
+    buf.take("{")
+    if buf.peek() == "}":
+        return
+
+    while True:
+        name = buf.value()
+        if not isinstance(name, str):
+            raise json.JSONDecodeError("Expecting property name", buf.buf, buf.pos)
+        buf.take(":")
+
+        if name == key and buf.peek() == "[":
+            buf.take("[")
+            if buf.peek() == "]":
+                buf.take("]")
+                yield name, [], False
+            else:
+                while True:
+                    yield name, buf.value(), True
+                    if buf.take(",", "]") == "]":
+                        break
+        else:
+            yield name, buf.value(), False
+
+        if buf.take(",", "}") == "}":
+            break
+
+
 def json_reload(
     obj: t.Any,
     error: bool = False,
@@ -2798,3 +3129,218 @@ def coerce_date_delta(
         parsed = parsed or dt_now()
         parsed -= subtract
     return parsed
+
+
+class Prefetcher:
+    """Call a fetch function on a background thread to stay ahead of the consumer.
+
+    Notes:
+        Items are yielded in the order they were fetched. Any exception raised by ``fetch``
+        is re-raised in the consumer when the consumer reaches it.
+
+    Args:
+        fetch: callable that returns a tuple of (item, done), where done is True if
+            no more items should be fetched after item
+        size: number of items to keep fetched ahead of the consumer
+        name: name to use for the background thread
+        output: queue to put fetched items in, used by :meth:`prefetch_merge` to share
+            one queue between multiple prefetchers
+    """
+
+    def __init__(
+        self,
+        fetch: t.Callable[[], t.Tuple[t.Any, bool]],
+        size: int = 1,
+        name: str = "prefetch",
+        output: t.Optional[queue.Queue] = None,
+    ):
+        """Pass."""
+        self.fetch: t.Callable[[], t.Tuple[t.Any, bool]] = fetch
+        self.size: int = max(1, coerce_int(size))
+        self.name: str = name
+        self.queue: queue.Queue = (
+            output if isinstance(output, queue.Queue) else queue.Queue(maxsize=self.size)
+        )
+        self.stop_event: threading.Event = threading.Event()
+        self.thread: t.Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the background thread if it is not already started."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Signal the background thread to stop and wait for it to exit."""
+        self.stop_event.set()
+        self._drain()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self._drain()
+
+    def __iter__(self) -> t.Generator[t.Any, None, None]:
+        """Yield fetched items until fetch reports it is done."""
+        self.start()
+        try:
+            while True:
+                item, exc, done = self.queue.get()
+                if exc is not None:
+                    raise exc
+                yield item
+                if done:
+                    break
+        finally:
+            self.stop()
+
+    def __str__(self) -> str:
+        """Pass."""
+        return f"{self.__class__.__name__}(name={self.name!r}, size={self.size})"
+
+    def __repr__(self) -> str:
+        """Pass."""
+        return self.__str__()
+
+    def _worker(self):
+        """Fetch items and put them in the queue until done or stopped."""
+        done: bool = False
+        while not done and not self.stop_event.is_set():
+            try:
+                item, done = self.fetch()
+                entry = (item, None, done)
+            except BaseException as exc:
+                done = True
+                entry = (None, exc, done)
+            if not self._put(entry=entry):
+                break
+
+    def _put(self, entry: tuple) -> bool:
+        """Put an entry in the queue, giving up if a stop is signalled while waiting."""
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain(self):
+        """Discard any items left in the queue."""
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+def prefetch_merge(
+    fetches: t.List[t.Callable[[], t.Tuple[t.Any, bool]]],
+    size: int = 1,
+    ordered: bool = True,
+    name: str = "prefetch",
+) -> t.Generator[t.Any, None, None]:
+    """Run multiple fetch functions concurrently and merge their items into one stream.
+
+    Args:
+        fetches: callables to pass to :obj:`Prefetcher`, each one is run on its own thread
+        size: number of items to keep fetched ahead of the consumer for each fetch
+        ordered: if True, yield all items from each fetch in the order fetches were supplied,
+            otherwise yield items in the order they were fetched across all fetches
+        name: prefix to use for the name of each background thread
+    """
+    size: int = max(1, coerce_int(size))
+    output: t.Optional[queue.Queue] = None if ordered else queue.Queue(maxsize=size * len(fetches))
+    prefetchers: t.List[Prefetcher] = [
+        Prefetcher(fetch=fetch, size=size, name=f"{name}_{idx}", output=output)
+        for idx, fetch in enumerate(fetches)
+    ]
+    try:
+        for prefetcher in prefetchers:
+            prefetcher.start()
+
+        if ordered:
+            for prefetcher in prefetchers:
+                yield from prefetcher
+        else:
+            left: int = len(prefetchers)
+            while left:
+                item, exc, done = output.get()
+                if exc is not None:
+                    raise exc
+                yield item
+                if done:
+                    left -= 1
+    finally:
+        for prefetcher in prefetchers:
+            prefetcher.stop_event.set()
+        for prefetcher in prefetchers:
+            prefetcher.stop()
+
+
+def concurrent_map(
+    func: t.Callable[[t.Any], t.Any],
+    items: t.Iterable[t.Any],
+    concurrency: int = 1,
+    name: str = "concurrent",
+    ordered: bool = True,
+) -> t.Generator[t.Tuple[t.Any, t.Any, t.Optional[Exception]], None, None]:
+    """Call a function for each item using a bounded pool of threads.
+
+    Notes:
+        Results are yielded in the same order as items, or as soon as each call finishes if
+        ordered is False. No more than ``concurrency`` calls are in flight at once, so items can
+        be a generator of any length. Exceptions raised by ``func`` are yielded instead of
+        raised so that callers can report per item failures.
+
+    Args:
+        func: callable to call with each item
+        items: items to call func with
+        concurrency: max number of threads to use, 1 or less will call func in this thread
+        name: prefix to use for the names of the threads
+        ordered: yield results in the order of items instead of the order calls finish in
+
+    Yields:
+        tuple of (item, result of func or None, exception raised by func or None)
+    """
+    concurrency = max(1, coerce_int(concurrency))
+
+    if concurrency == 1:
+        for item in items:
+            try:
+                result = func(item)
+            except Exception as exc:
+                yield item, None, exc
+            else:
+                yield item, result, None
+        return
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix=name
+    )
+    pending: t.Deque[t.Tuple[t.Any, concurrent.futures.Future]] = collections.deque()
+    items = iter(items)
+    try:
+        for item in items:
+            pending.append((item, executor.submit(func, item)))
+            if len(pending) >= concurrency:
+                break
+
+        while pending:
+            if ordered:
+                item, future = pending.popleft()
+            else:
+                done, _ = concurrent.futures.wait(
+                    [x[1] for x in pending], return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                idx = next(idx for idx, x in enumerate(pending) if x[1] in done)
+                item, future = pending[idx]
+                del pending[idx]
+            exc = future.exception()
+            yield item, None if exc else future.result(), exc
+
+            for item in items:
+                pending.append((item, executor.submit(func, item)))
+                break
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)